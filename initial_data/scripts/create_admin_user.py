@@ -21,7 +21,7 @@ async def create_admin_user() -> None:
             logger.error("USUARIO ADMINISTRADOR YA EXISTE.")
             return None
 
-        hashed_password = HashService.hash_text(settings.ADMIN_PASSWORD)
+        hashed_password = await HashService.hash_text(settings.ADMIN_PASSWORD)
 
         admin_user = Usuario(
             username=settings.ADMIN_USERNAME,
@@ -0,0 +1,19 @@
+/* Columnas entity_id e is_diff de audit_data_log en Oracle
+Las filas existentes son snapshots completos (is_diff = 0) y no tienen
+entity_id, por lo que no participan en la reconstrucción de los diffs.
+
+ALTER TABLE audit_data_log ADD (
+   entity_id VARCHAR2(255 CHAR),
+   is_diff SMALLINT DEFAULT 0 NOT NULL
+);
+
+CREATE INDEX ix_audit_data_log_entity ON audit_data_log (entity_type, entity_id);
+*/
+
+/* Columnas entity_id e is_diff de audit_data_log en PostgreSQL
+ALTER TABLE audit_data_log
+   ADD COLUMN entity_id VARCHAR(255),
+   ADD COLUMN is_diff BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE INDEX ix_audit_data_log_entity ON audit_data_log (entity_type, entity_id);
+*/
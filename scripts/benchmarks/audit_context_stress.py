@@ -0,0 +1,76 @@
+import asyncio
+import json
+import random
+import time
+
+from config import settings  # noqa: F401
+from loguru import logger
+from starlette.requests import Request
+
+from src.core.context import get_request_context
+from src.operations.models import MovementDetail
+from src.security.audit import AuditPolicy, AuditService, audit_data_log_queue
+
+REQUESTS = 500
+ROWS_PER_REQUEST = 20
+
+
+def _build_request(index: int) -> Request:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": f"/stress/{index}",
+        "headers": [],
+        "query_string": b"",
+        "path_params": {"index": index},
+        "client": ("127.0.0.1", 0),
+    }
+    return Request(scope)
+
+
+@AuditService.audit_action_log(policy=AuditPolicy.metadata())
+async def _fake_endpoint(request: Request, index: int) -> dict:
+    audit_id = get_request_context().audit_id
+    for item_number in range(ROWS_PER_REQUEST):
+        await asyncio.sleep(random.random() / 1000)
+        instance = MovementDetail(document_number=str(index), item_number=item_number)
+        AuditService.audit_data_log(
+            instance=instance,
+            values_before={},
+            values_after={"nrodoc": str(index), "nroitm": item_number},
+        )
+
+    return {"index": index, "audit_id": str(audit_id)}
+
+
+async def run_audit_context_stress() -> None:
+    """
+    Interleaves many simulated requests on one event loop and checks that every
+    audit data row points to the action of the request that produced it.
+    """
+    audit_data_log_queue.max_size = REQUESTS * ROWS_PER_REQUEST
+    audit_data_log_queue.batch_size = REQUESTS * ROWS_PER_REQUEST
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(
+        *(_fake_endpoint(_build_request(index), index) for index in range(REQUESTS))
+    )
+    elapsed = time.perf_counter() - start
+
+    audit_ids = {str(response["index"]): response["audit_id"] for response in responses}
+    rows = [values for _, values in audit_data_log_queue._drain()]
+
+    contaminated = [
+        row
+        for row in rows
+        if audit_ids[json.loads(row["new_data"])["nrodoc"]] != str(row["action_id"])
+    ]
+
+    logger.info(
+        f"{REQUESTS} concurrent requests, {len(rows)} audit rows in {elapsed:.2f}s"
+    )
+    if len(rows) != REQUESTS * ROWS_PER_REQUEST or contaminated:
+        logger.error(f"{len(contaminated)} audit rows with a foreign audit id")
+        raise SystemExit(1)
+
+    logger.success("No audit row was attributed to another request")
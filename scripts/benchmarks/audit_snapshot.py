@@ -0,0 +1,76 @@
+import time
+
+from config import settings  # noqa: F401
+from loguru import logger
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm.attributes import get_history, set_committed_value
+from sqlalchemy.orm.properties import ColumnProperty
+
+from src.operations.models import MovementDetail
+from src.security.audit.audit_service import AuditService
+
+ROWS = (10, 50, 100, 500, 1000)
+REPEAT = 5
+
+
+def _build_movement_details(rows: int) -> list[MovementDetail]:
+    plan = AuditService.get_snapshot_plan(MovementDetail)
+    instances = []
+    for item_number in range(rows):
+        instance = MovementDetail()
+        for key, _ in plan:
+            set_committed_value(instance, key, None)
+        set_committed_value(instance, "item_number", item_number)
+        set_committed_value(instance, "stkgen", 100.0)
+        instance.stkgen = 80.0
+        instances.append(instance)
+
+    return instances
+
+
+def _walk_column_attrs(instance: MovementDetail) -> dict:
+    values: dict = {}
+    insp = inspect(instance)
+    for attr in instance.__mapper__.column_attrs:
+        if not isinstance(attr, ColumnProperty) or attr.columns[0].name.startswith("%"):
+            continue
+        column_name = attr.columns[0].name
+        if attr.key in insp.unloaded:
+            values[column_name] = None
+        else:
+            hist = get_history(instance, attr.key)
+            values[column_name] = (
+                hist.deleted[0] if hist.deleted else getattr(instance, attr.key)
+            )
+
+    return values
+
+
+def _measure(func) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+async def run_audit_snapshot_benchmark() -> None:
+    logger.info(
+        f"MovementDetail: {len(AuditService.get_snapshot_plan(MovementDetail))} "
+        "audited columns"
+    )
+    for rows in ROWS:
+        instances = _build_movement_details(rows)
+
+        walk = _measure(lambda: [_walk_column_attrs(obj) for obj in instances])
+        batch = _measure(
+            lambda: AuditService._snapshot_all(instances, AuditService._snapshot_before)
+        )
+
+        logger.info(
+            f"rows={rows:>5} | column walk: {walk * 1000:8.2f} ms "
+            f"({walk / rows * 1e6:6.1f} us/row) | snapshot plan: "
+            f"{batch * 1000:8.2f} ms ({batch / rows * 1e6:6.1f} us/row)"
+        )
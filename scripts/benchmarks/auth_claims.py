@@ -0,0 +1,91 @@
+import time
+
+import httpx
+from config import settings  # noqa: F401
+from fastapi import Depends, FastAPI, Request
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.services import PermissionService
+from src.security.audit import AuditPolicy, AuditService
+from src.security.models import Usuario
+from src.security.permission_cache import UserPermissions, permission_cache
+from src.security.services import TokenService
+
+REQUESTS = 2000
+USER_ID = 1
+ACCESS_ID = 1
+OPERATION_ID = 1
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[get_db] = no_db
+
+    @app.get("/protected")
+    @AuditService.audit_action_log(policy=AuditPolicy.metadata())
+    @PermissionService.check_permission(ACCESS_ID, OPERATION_ID)
+    async def protected(request: Request, db: AsyncSession = Depends(get_db)):
+        return {"ok": True}
+
+    return app
+
+
+def _verify_per_consumer(request: Request):
+    # Former behaviour: every consumer verified the cookie on its own.
+    return TokenService.verify_access_claims(request.cookies.get("access_token"))
+
+
+async def _measure(app: FastAPI, token: str) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://benchmark",
+        cookies={"access_token": token},
+    ) as client:
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await client.get("/protected")
+            response.raise_for_status()
+
+        return REQUESTS / (time.perf_counter() - start)
+
+
+async def run_auth_claims_benchmark() -> None:
+    """
+    Requests-per-second of an audited endpoint protected by
+    `PermissionService.check_permission`, verifying the access token once per
+    consumer versus once per request. Permissions are served from the cache, so
+    the database is not involved.
+    """
+    token, _ = TokenService.create_access_token(
+        Usuario(usuario_id=USER_ID, username="benchmark")
+    )
+    permission_cache.set(
+        USER_ID,
+        UserPermissions(
+            is_active=True,
+            blocked_until=None,
+            access_operations=frozenset({(ACCESS_ID, OPERATION_ID)}),
+        ),
+    )
+    app = _build_app()
+
+    get_request_claims = TokenService.get_request_claims
+    TokenService.get_request_claims = staticmethod(_verify_per_consumer)
+    try:
+        before = await _measure(app, token)
+    finally:
+        TokenService.get_request_claims = get_request_claims
+
+    after = await _measure(app, token)
+
+    logger.info(
+        f"{REQUESTS} requests | verify per consumer: {before:8.1f} req/s | "
+        f"verify once per request: {after:8.1f} req/s ({after / before:.2f}x)"
+    )
@@ -0,0 +1,86 @@
+import contextlib
+import shutil
+import time
+import tracemalloc
+
+from config import settings
+from loguru import logger
+
+from src.operations.schemas import CardOperationListSchema, CardOperationSchema
+from src.operations.utils.card_operation.pdf import (
+    generate_pdf_cards,
+    generate_pdf_cards_latex,
+)
+
+CARD_COUNTS = (10, 100, 1000)
+
+
+def _build_cards(count: int) -> CardOperationListSchema:
+    cards = []
+    for number in range(count):
+        card = CardOperationSchema(
+            id=f"C{1000000 + number}",
+            fabric_id="104001",
+            product_id="104001",
+            net_weight=24.35,
+            tint_supplier_id="P001",
+            tint_color_id="CRUD",
+            yarn_supplier_id="P002,P003",
+            card_type="N",
+            status_flag="P",
+            service_order_id="TJ0001234,TJ0001235",
+            supplier_weaving_tej="P004",
+        )
+        card._supplier_tint_initials = "TIN"
+        card._supplier_weaving_tej_initials = "TEJ"
+        card._supplier_yarn_initials = ["HI1", "HI2"]
+        cards.append(card)
+
+    return CardOperationListSchema(card_operations=cards)
+
+
+def _measure(render, cards: CardOperationListSchema) -> tuple[float, float, int]:
+    # Timed and traced in separate runs, since tracing slows allocations down.
+    start = time.perf_counter()
+    pdf = render(cards)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    render(cards)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 1024 / 1024, len(pdf.getvalue())
+
+
+def run_card_labels_benchmark() -> None:
+    """
+    Wall time and peak Python memory of rendering the card labels PDF with
+    reportlab versus LaTeX, by number of cards.
+
+    The LaTeX path is skipped when `pdflatex` is not installed. Its memory does
+    not include the LaTeX process.
+    """
+    has_latex = shutil.which("pdflatex") is not None
+    if not has_latex:
+        logger.warning("pdflatex not found, only the reportlab renderer is measured")
+
+    # The LaTeX renderer writes its files relative to the repository root.
+    with contextlib.chdir(settings.BASE_DIR):
+        for count in CARD_COUNTS:
+            cards = _build_cards(count)
+
+            elapsed, peak, size = _measure(generate_pdf_cards, cards)
+            message = (
+                f"{count:5d} cards | reportlab: {elapsed * 1000:9.1f} ms, "
+                f"{peak:6.1f} MiB peak, {size / 1024:7.1f} KiB"
+            )
+
+            if has_latex:
+                elapsed, peak, size = _measure(generate_pdf_cards_latex, cards)
+                message += (
+                    f" | latex: {elapsed * 1000:9.1f} ms, "
+                    f"{peak:6.1f} MiB peak, {size / 1024:7.1f} KiB"
+                )
+
+            logger.info(message)
@@ -0,0 +1,79 @@
+import time
+
+from config import settings  # noqa: F401
+from jinja2 import Environment, FileSystemLoader
+from loguru import logger
+
+from src.core.config import settings as app_settings
+from src.core.constants import LOGO_MECSA
+from src.core.templates import TemplateRegistry
+from src.operations.models import Proveedor
+from src.operations.utils.programacion_tintoreria import generate_html
+
+RENDERS = 2000
+PARTIDAS = 30
+
+TEMPLATES_DIR = app_settings.ASSETS_DIR + "email_templates"
+
+
+def _render_reset_password(template) -> str:
+    return template.render(
+        LOGO_MECSA=LOGO_MECSA,
+        display_name="Usuario de prueba",
+        username="usuario",
+        password="Contraseña123",
+        FRONTEND_URL="http://localhost",
+    )
+
+
+def _render_programacion(template) -> str:
+    table = [["Partida", "O.S.", "Tejido", "Ancho", "Rollos", "Peso", "Color"]]
+    table += [
+        [str(partida), "TJ0001234", "104", "80", "12", "250.5", "NEGRO"]
+        for partida in range(1, PARTIDAS + 1)
+    ]
+    return generate_html(
+        Proveedor(razon_social="TEJEDURIA S.A.C."),
+        Proveedor(razon_social="TINTORERIA S.A.C."),
+        table,
+        template,
+    )
+
+
+CASES = {
+    "send_reset_password_email.html": _render_reset_password,
+    "send_programming_dry_cleaners.html": _render_programacion,
+}
+
+
+def _measure(get_template, name: str) -> float:
+    render = CASES[name]
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        render(get_template(name))
+
+    return RENDERS / (time.perf_counter() - start)
+
+
+def run_email_templates_benchmark() -> None:
+    """
+    Renders per second of the password reset and dyeing schedule emails, with a
+    new Jinja environment per render (as when every `EmailService` built its
+    own) versus the process-wide `TemplateRegistry`.
+    """
+
+    def per_instance(name: str):
+        return Environment(
+            loader=FileSystemLoader(searchpath=TEMPLATES_DIR)
+        ).get_template(name)
+
+    registry = TemplateRegistry(searchpath=TEMPLATES_DIR, auto_reload=False)
+    registry.warm_up()
+
+    for name in CASES:
+        before = _measure(per_instance, name)
+        after = _measure(registry.get_template, name)
+        logger.info(
+            f"{name} | environment per render: {before:9.1f}/s | "
+            f"registry: {after:9.1f}/s ({after / before:.1f}x)"
+        )
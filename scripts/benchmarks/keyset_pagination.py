@@ -0,0 +1,126 @@
+import time
+from datetime import date, timedelta
+
+from config import settings  # noqa: F401
+from loguru import logger
+from sqlalchemy import MetaData, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.constants import MECSA_COMPANY_CODE, PAGE_SIZE
+from src.core.pagination import next_cursor
+from src.operations.constants import (
+    ENTRY_DOCUMENT_CODE,
+    ENTRY_MOVEMENT_TYPE,
+    WEAVING_SERVICE_ENTRY_MOVEMENT_CODE,
+    WEAVING_STORAGE_CODE,
+)
+from src.operations.models import Movement
+from src.operations.repositories import WeavingServiceEntryRepository
+
+PERIODS = (2023, 2024, 2025)
+PAGES = (1, 10, 100, 1000)
+REPEAT = 5
+BATCH_SIZE = 5000
+
+
+def _build_movements(period: int, rows: int) -> list[dict]:
+    return [
+        {
+            "company_code": MECSA_COMPANY_CODE,
+            "storage_code": WEAVING_STORAGE_CODE,
+            "movement_type": ENTRY_MOVEMENT_TYPE,
+            "movement_code": WEAVING_SERVICE_ENTRY_MOVEMENT_CODE,
+            "document_code": ENTRY_DOCUMENT_CODE,
+            "document_number": f"{period % 100:02d}{number:08d}",
+            "period": period,
+            "creation_date": date(period, 1, 1) + timedelta(days=number % 365),
+            "auxiliary_code": f"S{number % 50:04d}",
+            "status_flag": "P",
+        }
+        for number in range(1, rows + 1)
+    ]
+
+
+async def _populate(engine, rows: int) -> None:
+    # Only the keys and the filtered and sorted columns are filled in.
+    table = Movement.__table__.to_metadata(MetaData())
+    for column in table.columns:
+        column.nullable = not column.primary_key
+
+    async with engine.begin() as connection:
+        await connection.run_sync(table.drop, checkfirst=True)
+        await connection.run_sync(table.create)
+
+    async with AsyncSession(bind=engine) as db:
+        for period in PERIODS:
+            movements = _build_movements(period=period, rows=rows)
+            for start in range(0, rows, BATCH_SIZE):
+                await db.execute(
+                    insert(Movement), movements[start : start + BATCH_SIZE]
+                )
+
+        await db.commit()
+
+
+async def _measure(repository: WeavingServiceEntryRepository, **kwargs) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await repository.find_weaving_service_entries(
+            period=PERIODS[-1], limit=PAGE_SIZE, **kwargs
+        )
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+async def _cursors(
+    repository: WeavingServiceEntryRepository,
+) -> dict[int, str | None]:
+    """
+    Walks the period page by page, as a client following `next_cursor` would,
+    and keeps the cursor that leads to each measured page.
+    """
+    cursors: dict[int, str | None] = {1: None}
+    keyset = repository.get_movement_creation_date_keyset()
+    cursor = None
+    for page in range(2, max(PAGES) + 1):
+        movements, _ = await repository.find_weaving_service_entries(
+            period=PERIODS[-1], limit=PAGE_SIZE, cursor=cursor
+        )
+        cursor = next_cursor(items=movements, keyset=keyset, limit=PAGE_SIZE)
+        if page in PAGES:
+            cursors[page] = cursor
+
+    return cursors
+
+
+async def run_keyset_pagination_benchmark(database_url: str) -> None:
+    """
+    Latency of a page of `find_weaving_service_entries` by page number, using
+    offset pagination and keyset pagination, over a synthetic `almcmovi` with
+    `max(PAGES) * PAGE_SIZE` entries per period.
+
+    The table is dropped and recreated, so `database_url` must point to a
+    scratch database.
+    """
+    rows = max(PAGES) * PAGE_SIZE
+    engine = create_async_engine(database_url).execution_options(
+        schema_translate_map={"PUB": None}
+    )
+    await _populate(engine, rows=rows)
+    logger.info(f"{len(PERIODS) * rows} movements in {len(PERIODS)} periods")
+
+    async with AsyncSession(bind=engine) as db:
+        repository = WeavingServiceEntryRepository(promec_db=db)
+        cursors = await _cursors(repository)
+
+        for page in PAGES:
+            offset = await _measure(repository, offset=(page - 1) * PAGE_SIZE)
+            keyset = await _measure(repository, cursor=cursors[page])
+            logger.info(
+                f"page {page:5d} | offset: {offset * 1000:8.2f} ms | "
+                f"keyset: {keyset * 1000:8.2f} ms"
+            )
+
+    await engine.dispose()
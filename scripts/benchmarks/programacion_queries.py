@@ -0,0 +1,139 @@
+import time
+from decimal import Decimal
+
+from config import settings  # noqa: F401
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.operations.models import Color, OrdenServicioTejeduriaDetalle
+from src.operations.repositories.orden_servicio_tejeduria_detalle_repository import (
+    SUBORDEN_IDS_CHUNK_SIZE,
+)
+from src.operations.schemas import (
+    OrdenServicioTintoreriaCreateSchemaWithDetalleByProgramacion,
+    OrdenServicioTintoreriaDetalleCreateSchemaByOrder,
+)
+from src.operations.services.programacion_tintoreria_service import (
+    ProgramacionTintoreriaService,
+)
+
+PARTIDAS = (10, 100, 500)
+SUBORDENES_PER_PARTIDA = 3
+COLORES = 50
+
+
+def _expected_statements(size: int) -> int:
+    # One IN query for the colors, one composite-key query per chunk of
+    # subórdenes and one batched UPDATE for their stock.
+    subordenes = size * SUBORDENES_PER_PARTIDA
+    return 1 + -(-subordenes // SUBORDEN_IDS_CHUNK_SIZE) + 1
+
+
+def _build_partidas(
+    size: int,
+) -> list[OrdenServicioTintoreriaCreateSchemaWithDetalleByProgramacion]:
+    return [
+        OrdenServicioTintoreriaCreateSchemaWithDetalleByProgramacion(
+            color_id=partida % COLORES + 1,
+            detail=[
+                OrdenServicioTintoreriaDetalleCreateSchemaByOrder(
+                    orden_servicio_tejeduria_id=f"TJ{partida:07d}",
+                    crudo_id=f"{suborden:03d}ABC80",
+                    nro_rollos=1,
+                    cantidad_kg=Decimal("20.5"),
+                )
+                for suborden in range(SUBORDENES_PER_PARTIDA)
+            ],
+        )
+        for partida in range(size)
+    ]
+
+
+async def _populate(db: AsyncSession, size: int) -> None:
+    db.add_all(
+        Color(color_id=color_id, nombre=f"COLOR {color_id}")
+        for color_id in range(1, COLORES + 1)
+    )
+    db.add_all(
+        OrdenServicioTejeduriaDetalle(
+            orden_servicio_tejeduria_id=f"TJ{partida:07d}",
+            crudo_id=f"{suborden:03d}ABC80",
+            programado_kg=100.0,
+            consumido_kg=0.0,
+            es_complemento=False,
+            estado="PENDIENTE",
+            reporte_tejeduria_nro_rollos=10,
+            reporte_tejeduria_cantidad_kg=200.0,
+        )
+        for partida in range(size)
+        for suborden in range(SUBORDENES_PER_PARTIDA)
+    )
+    await db.commit()
+
+
+async def _count_statements(size: int) -> tuple[int, float]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Color.metadata.create_all(
+                sync_conn,
+                tables=[Color.__table__, OrdenServicioTejeduriaDetalle.__table__],
+            )
+        )
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await _populate(db, size)
+
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+
+    partidas = _build_partidas(size)
+    async with session_factory() as db:
+        service = ProgramacionTintoreriaService(db)
+        start = time.perf_counter()
+        colores = await service._retrieve_colores(
+            color_ids={partida.color_id for partida in partidas}
+        )
+        stock_result = await service._update_subordenes_stock(partidas)
+        await db.commit()
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+
+    if stock_result.is_failure or len(colores) != min(size, COLORES):
+        logger.error(f"{size} partidas: the partida pipeline did not load every row")
+        raise SystemExit(1)
+
+    return statements, elapsed
+
+
+async def run_programacion_queries_check() -> None:
+    """
+    Counts the statements the partida pipeline of a programación de tintorería
+    (colors, subórdenes and their stock) issues, and checks it only grows with
+    the number of subórdenes chunks, not with every partida.
+    """
+    for size in PARTIDAS:
+        statements, elapsed = await _count_statements(size)
+        logger.info(
+            f"{size:4d} partidas ({size * SUBORDENES_PER_PARTIDA} subórdenes) | "
+            f"{statements} statements | {elapsed * 1000:7.1f} ms"
+        )
+        expected = _expected_statements(size)
+        if statements != expected:
+            logger.error(f"Expected {expected} statements, got {statements}")
+            raise SystemExit(1)
+
+    logger.success("The statement count does not grow per partida")
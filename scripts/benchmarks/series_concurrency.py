@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+from config import settings
+from loguru import logger
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.constants import MECSA_COMPANY_CODE
+from src.operations.models import Series
+from src.operations.services.series_service import SeriesService
+
+DOCUMENT_CODE = "TST"
+SERVICE_NUMBER = 999
+
+
+async def _next_number(engine) -> int:
+    async with AsyncSession(bind=engine, expire_on_commit=False) as db:
+        result = await SeriesService(promec_db=db).next_number(
+            document_code=DOCUMENT_CODE, service_number=SERVICE_NUMBER
+        )
+        await db.commit()
+        return result.value
+
+
+def _is_promec_database(database_url: str) -> bool:
+    url = make_url(database_url)
+    promec_url = make_url(settings.PROMEC_DATABASE_URL_ASYNC)
+
+    return (url.host, url.port, url.database) == (
+        promec_url.host,
+        promec_url.port,
+        promec_url.database,
+    )
+
+
+async def run_series_concurrency(
+    calls: int, concurrency: int, database_url: str
+) -> None:
+    """
+    Runs `calls` simultaneous `next_number()` reservations against a test series
+    and checks that no number was handed out twice.
+
+    The test series row is created and updated in `database_url`, so it refuses
+    to run against the configured PROMEC database.
+    """
+    if _is_promec_database(database_url):
+        logger.error("Refusing to write the test series to the PROMEC database")
+        raise SystemExit(1)
+
+    engine = create_async_engine(
+        database_url,
+        pool_size=concurrency,
+        max_overflow=0,
+    )
+
+    async with AsyncSession(bind=engine) as db:
+        series = await db.get(
+            Series,
+            {
+                "company_code": MECSA_COMPANY_CODE,
+                "document_code": DOCUMENT_CODE,
+                "service_number": SERVICE_NUMBER,
+            },
+        )
+        if series is None:
+            db.add(
+                Series(
+                    document_code=DOCUMENT_CODE, service_number=SERVICE_NUMBER, number=1
+                )
+            )
+            await db.commit()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def reserve() -> int:
+        async with semaphore:
+            return await _next_number(engine)
+
+    start = time.perf_counter()
+    numbers = await asyncio.gather(*(reserve() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    duplicated = calls - len(set(numbers))
+    logger.info(
+        f"{calls} reservations with concurrency {concurrency} in {elapsed:.2f}s "
+        f"({calls / elapsed:.0f} numbers/s)"
+    )
+    if duplicated:
+        logger.error(f"{duplicated} duplicated numbers")
+        raise SystemExit(1)
+
+    logger.success(f"All numbers are unique ({min(numbers)} - {max(numbers)})")
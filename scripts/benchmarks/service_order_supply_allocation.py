@@ -0,0 +1,99 @@
+import time
+
+from config import settings  # noqa: F401
+from loguru import logger
+
+from src.operations.models import ServiceOrderSupplyDetail
+from src.operations.services.service_order_supply_service import (
+    ServiceOrderSupplyDetailService,
+)
+
+SUPPLY_LINES = (50, 200, 500, 1000)
+YARNS = 4
+DETAILS = 20
+REPEAT = 5
+
+
+def _build_supply_lines(lines: int) -> list[ServiceOrderSupplyDetail]:
+    return [
+        ServiceOrderSupplyDetail(
+            product_code1=f"YARN{item_number % YARNS}",
+            item_number=item_number,
+            current_stock=10.0,
+            provided_quantity=10.0,
+            quantity_received=0.0,
+        )
+        for item_number in range(lines)
+    ]
+
+
+def _legacy_saves(
+    service_orders_stock: list[ServiceOrderSupplyDetail], yarn_id: str, quantity: float
+) -> int:
+    """
+    Walks the supply lines like the former row-by-row implementation and counts
+    the `save(..., flush=True)` calls it issued.
+    """
+    saves = 0
+    for service_order_supply_stock in service_orders_stock:
+        if service_order_supply_stock.product_code1 == yarn_id:
+            if service_order_supply_stock.current_stock <= 0:
+                continue
+            if quantity <= 0:
+                break
+
+            consumed = min(service_order_supply_stock.current_stock, quantity)
+            service_order_supply_stock.current_stock -= consumed
+            quantity -= consumed
+            saves += 1
+
+    return saves + (1 if quantity > 0 else 0)
+
+
+def _consumptions(lines: int) -> list[tuple[str, float]]:
+    # Every detail consumes half of the stock of its yarn, spread over the entry.
+    quantity = lines * 10.0 / YARNS / 2 / DETAILS * YARNS
+    return [(f"YARN{detail % YARNS}", quantity) for detail in range(DETAILS)]
+
+
+def _allocate(lines: int) -> int:
+    service_orders_stock = _build_supply_lines(lines)
+    changed: dict[int, ServiceOrderSupplyDetail] = {}
+    for yarn_id, quantity in _consumptions(lines):
+        for row in ServiceOrderSupplyDetailService._allocate_supply_stock_by_yarn(
+            service_orders_stock=service_orders_stock,
+            yarn_id=yarn_id,
+            quantity=quantity,
+        ):
+            changed[id(row)] = row
+
+    return len(changed)
+
+
+def _measure(func) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+async def run_service_order_supply_allocation_benchmark() -> None:
+    logger.info(f"{DETAILS} fabric details over {YARNS} yarns per weaving entry")
+    for lines in SUPPLY_LINES:
+        service_orders_stock = _build_supply_lines(lines)
+        legacy_saves = sum(
+            _legacy_saves(service_orders_stock, yarn_id, quantity)
+            for yarn_id, quantity in _consumptions(lines)
+        )
+
+        changed_rows = _allocate(lines)
+        elapsed = _measure(lambda: _allocate(lines))
+
+        logger.info(
+            f"lines={lines:>5} | row-by-row: {legacy_saves:>5} flushes | "
+            f"batch: {changed_rows:>5} rows in 1 flush, "
+            f"allocation {elapsed * 1000:7.2f} ms"
+        )
@@ -129,6 +129,20 @@ def detect_altered():
     loop.run_until_complete(detect_altered())
 
 
+@cli.command()
+def backfill_recipe_fingerprints():
+    """Compute or repair the recipe fingerprints of existing yarns and fabrics"""
+    from db import backfill_recipe_fingerprints
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    loop.run_until_complete(backfill_recipe_fingerprints())
+
+
 @cli.command()
 @click.option("-o", "--output", help="Output file name", default="", required=False)
 @click.option(
@@ -144,6 +158,90 @@ def generate_sql(output, dialect):
     generate_sql_create_tables(output, dialect)
 
 
+@cli.command()
+def bench_audit_snapshot():
+    """Benchmark audit snapshots by number of movement rows"""
+    from benchmarks.audit_snapshot import run_audit_snapshot_benchmark
+
+    asyncio.run(run_audit_snapshot_benchmark())
+
+
+@cli.command()
+def bench_supply_allocation():
+    """Benchmark service order supply allocation by number of supply lines"""
+    from benchmarks.service_order_supply_allocation import (
+        run_service_order_supply_allocation_benchmark,
+    )
+
+    asyncio.run(run_service_order_supply_allocation_benchmark())
+
+
+@cli.command()
+def bench_auth_claims():
+    """Benchmark access token verification on a protected endpoint"""
+    from benchmarks.auth_claims import run_auth_claims_benchmark
+
+    asyncio.run(run_auth_claims_benchmark())
+
+
+@cli.command()
+@click.option(
+    "--url",
+    default="sqlite+aiosqlite:///keyset_pagination.db",
+    help="Async URL of a scratch database (its almcmovi table is recreated)",
+)
+def bench_keyset_pagination(url):
+    """Benchmark offset versus keyset pagination of movements"""
+    from benchmarks.keyset_pagination import run_keyset_pagination_benchmark
+
+    asyncio.run(run_keyset_pagination_benchmark(url))
+
+
+@cli.command()
+def bench_card_labels():
+    """Benchmark card label PDF rendering with reportlab versus LaTeX"""
+    from benchmarks.card_labels import run_card_labels_benchmark
+
+    run_card_labels_benchmark()
+
+
+@cli.command()
+def bench_email_templates():
+    """Benchmark email template rendering with a shared template registry"""
+    from benchmarks.email_templates import run_email_templates_benchmark
+
+    run_email_templates_benchmark()
+
+
+@cli.command()
+def check_programacion_queries():
+    """Check the statements issued by a large dyeing schedule"""
+    from benchmarks.programacion_queries import run_programacion_queries_check
+
+    asyncio.run(run_programacion_queries_check())
+
+
+@cli.command()
+def stress_audit_context():
+    """Check audit ids under concurrent requests"""
+    from benchmarks.audit_context_stress import run_audit_context_stress
+
+    asyncio.run(run_audit_context_stress())
+
+
+@cli.command()
+@click.option("--calls", default=500, help="Number of reservations")
+@click.option("--concurrency", default=20, help="Simultaneous sessions")
+@click.option(
+    "--url", required=True, help="Async URL of a test database, never the PROMEC one"
+)
+def stress_series(calls, concurrency, url):
+    """Check document series uniqueness under concurrent reservations"""
+    from benchmarks.series_concurrency import run_series_concurrency
+
+    asyncio.run(run_series_concurrency(calls, concurrency, url))
+
+
 @cli.command()
 def insert_data():
     """Insert dummy data"""
@@ -45,7 +45,8 @@ def test_database_connection(_engine: Engine) -> bool:
 
 
 def import_models() -> None:
-    from src.operations.models import Proveedor  # noqa: F401
+    from src.core.models import OutboxEmail  # noqa: F401
+    from src.operations.models import Proveedor, RecipeFingerprint  # noqa: F401
     from src.security.models import Usuario  # noqa: F401
 
 
@@ -192,6 +193,18 @@ async def detect_altered() -> None:
     await promec_async_silent_engine.dispose()
 
 
+async def backfill_recipe_fingerprints() -> None:
+    from recipe_fingerprints import backfill_recipe_fingerprints
+
+    await backfill_recipe_fingerprints(
+        promec_engine=promec_async_silent_engine,
+        pcp_engine=pcp_async_silent_engine,
+    )
+
+    await promec_async_silent_engine.dispose()
+    await pcp_async_silent_engine.dispose()
+
+
 def create_promec_sequences() -> None:
     from src.core.database import PromecBase  # noqa: F401
     from src.operations.sequences import product_id_seq  # noqa: F401
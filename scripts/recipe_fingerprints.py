@@ -0,0 +1,153 @@
+from collections import defaultdict
+
+from config import settings  # noqa: F401
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.repository import BaseRepository
+from src.operations.constants import RecipeFingerprintItemType
+from src.operations.models import RecipeFingerprint, YarnDistinction
+from src.operations.repositories import (
+    FabricRepository,
+    RecipeFingerprintRepository,
+    YarnRecipeRepository,
+    YarnRepository,
+)
+from src.operations.utils.recipe_fingerprint import (
+    fabric_fingerprint,
+    yarn_fingerprint,
+)
+
+
+async def _yarn_fingerprints(
+    db: AsyncSession, promec_db: AsyncSession
+) -> dict[tuple[str, str], str]:
+    yarns = await YarnRepository(db=promec_db).find_yarns()
+
+    recipes: dict[str, list] = {yarn.id: [] for yarn in yarns}
+    for item in await YarnRecipeRepository(db=db).find_all():
+        if item.yarn_id in recipes:
+            recipes[item.yarn_id].append(item)
+
+    distinctions: dict[str, list[int]] = {yarn.id: [] for yarn in yarns}
+    for item in await BaseRepository[YarnDistinction](
+        model=YarnDistinction, db=db
+    ).find_all():
+        if item.yarn_id in distinctions:
+            distinctions[item.yarn_id].append(item.distinction_id)
+
+    return {
+        (RecipeFingerprintItemType.YARN, yarn.id): yarn_fingerprint(
+            yarn_count_id=yarn.field1,
+            spinning_method_id=yarn.field2,
+            color_id=yarn.field3,
+            manufactured_in_id=yarn.field4,
+            distinction_ids=distinctions[yarn.id],
+            recipe=recipes[yarn.id],
+        )
+        for yarn in yarns
+    }
+
+
+async def _fabric_fingerprints(promec_db: AsyncSession) -> dict[tuple[str, str], str]:
+    fabrics = await FabricRepository(db=promec_db).find_fabrics(
+        include_simple_recipe=True
+    )
+
+    return {
+        (RecipeFingerprintItemType.FABRIC, fabric.id): fabric_fingerprint(
+            width=fabric.field2,
+            fabric_type_id=fabric.field4,
+            color_id=fabric.field3,
+            structure_pattern=fabric.field5,
+            recipe=fabric.fabric_recipe,
+        )
+        for fabric in fabrics
+    }
+
+
+def _unique_fingerprints(
+    fingerprints: dict[tuple[str, str], str],
+) -> dict[tuple[str, str], str]:
+    """
+    Keeps, for every fingerprint shared by several items of a type, only the
+    item with the lowest id, as the table allows one item per fingerprint, and
+    logs the other ones.
+    """
+    owners: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for (item_type, item_id), fingerprint in sorted(fingerprints.items()):
+        owners[(item_type, fingerprint)].append(item_id)
+
+    for item_type in (RecipeFingerprintItemType.YARN, RecipeFingerprintItemType.FABRIC):
+        shared = [
+            item_ids
+            for (type_, _), item_ids in owners.items()
+            if type_ == item_type and len(item_ids) > 1
+        ]
+        logger.info(f"{item_type}: {len(shared)} fingerprints shared by several items")
+        for item_ids in shared:
+            logger.warning(
+                f"{item_type}: {', '.join(item_ids[1:])} skipped, same as {item_ids[0]}"
+            )
+
+    return {
+        (item_type, item_ids[0]): fingerprint
+        for (item_type, fingerprint), item_ids in owners.items()
+    }
+
+
+async def backfill_recipe_fingerprints(
+    promec_engine: AsyncEngine, pcp_engine: AsyncEngine
+) -> None:
+    """
+    Computes the recipe fingerprint of every yarn and fabric in the catalog and
+    makes the stored ones match: missing fingerprints are created, outdated ones
+    updated, and those of items that no longer exist deleted.
+
+    Items live in PROMEC and fingerprints in the main database, which commit
+    separately. Running it again is the way to recover when one of the commits
+    fails, or after items are changed outside the application.
+    """
+    async with (
+        AsyncSession(bind=pcp_engine, expire_on_commit=False) as db,
+        AsyncSession(bind=promec_engine, expire_on_commit=False) as promec_db,
+    ):
+        fingerprints = await _yarn_fingerprints(db=db, promec_db=promec_db)
+        fingerprints.update(await _fabric_fingerprints(promec_db=promec_db))
+        fingerprints = _unique_fingerprints(fingerprints)
+
+        existing = {
+            (instance.item_type, instance.item_id): instance
+            for instance in await RecipeFingerprintRepository(db=db).find_all()
+        }
+
+        # Outdated rows are deleted before inserting, so that the unique
+        # fingerprints never collide in the middle of the update.
+        for key, instance in existing.items():
+            if fingerprints.get(key) != instance.fingerprint:
+                await db.delete(instance)
+        await db.flush()
+
+        created = updated = 0
+        for (item_type, item_id), fingerprint in fingerprints.items():
+            instance = existing.get((item_type, item_id))
+            if instance is not None and instance.fingerprint == fingerprint:
+                continue
+
+            db.add(
+                RecipeFingerprint(
+                    item_type=item_type, item_id=item_id, fingerprint=fingerprint
+                )
+            )
+            if instance is None:
+                created += 1
+            else:
+                updated += 1
+
+        deleted = sum(1 for key in existing if key not in fingerprints)
+        await db.commit()
+
+    logger.info(
+        f"{len(fingerprints)} fingerprints | {created} created | {updated} updated"
+        f" | {deleted} deleted"
+    )
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Per-process key/value cache whose entries expire `ttl` seconds after they
+    were stored.
+
+    Every worker keeps its own copy, so writers must call `invalidate` (or
+    `clear`) on the instance that changed the data and rely on the TTL for the
+    other workers.
+    """
+
+    def __init__(self, ttl: float, max_size: int | None = None) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[K, tuple[float, V]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> V:
+        if self.max_size is not None and len(self._entries) >= self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        if self._entries.pop(key, _MISSING) is not _MISSING:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def metrics(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 3) if requests else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+class RefreshingCache(Generic[K, V]):
+    """
+    Per-process cache that keeps serving the last value of a key once it is
+    older than `ttl` seconds, while a background task reloads it.
+
+    Only the first read of a key waits for `loader`, so it suits values that are
+    expensive to compute and may be slightly out of date, such as the totals of
+    large listings. A failed refresh is logged and counted in the metrics, and
+    the old value is served until the next one succeeds.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._refreshing: dict[K, asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.failed_refreshes = 0
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        value = await loader()
+        self._entries[key] = (time.monotonic(), value)
+        return value
+
+    async def _refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> None:
+        try:
+            await self._load(key, loader)
+            self.refreshes += 1
+        except Exception:
+            self.failed_refreshes += 1
+            logger.exception("Refresh of cache key %r failed", key)
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def get(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return await self._load(key, loader)
+
+        self.hits += 1
+        stored_at, value = entry
+        if stored_at + self.ttl <= time.monotonic() and key not in self._refreshing:
+            self._refreshing[key] = asyncio.create_task(self._refresh(key, loader))
+
+        return value
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def metrics(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 3) if requests else 0.0,
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "refreshing": len(self._refreshing),
+        }
@@ -39,6 +39,34 @@ class ProjectSettings(ProjectBaseSettings):
     SENDER_EMAIL: str
     FRONTEND_URL: str
 
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    AUDIT_QUEUE_BATCH_SIZE: int = 500
+    AUDIT_QUEUE_FLUSH_INTERVAL: float = 1.0
+    AUDIT_LOG_COUNT_TTL: float = 60.0
+    AUDIT_RESPONSE_MAX_BYTES: int = 4096
+
+    PARAMETER_CACHE_TTL: float = 300.0
+    PERMISSION_CACHE_TTL: float = 60.0
+    SERVICE_RATE_CACHE_TTL: float = 3600.0
+    FABRIC_CATALOG_TTL: float = 600.0
+
+    HASH_POOL_SIZE: int = 4
+    PDF_RENDER_POOL_SIZE: int = 2
+    PDF_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_CONCURRENCY: int = 4
+    EMAIL_OUTBOX_POLL_INTERVAL: float = 2.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_RETRY_DELAY: float = 30.0
+    EMAIL_OUTBOX_LEASE: float = 300.0
+    EMAIL_OUTBOX_RETENTION_DAYS: float = 7.0
+    EMAIL_OUTBOX_PURGE_INTERVAL: float = 3600.0
+
+    CARD_SEQUENCE_BLOCK_SIZE: int = 100
+    PRODUCT_SEQUENCE_BLOCK_SIZE: int = 0
+    BARCODE_SERIES_BLOCK_SIZE: int = 20
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         sys.path.append(BASE_DIR)
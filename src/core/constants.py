@@ -14,3 +14,13 @@ ACTIVE_STATUS_PROMEC = "A"
 INACTIVE_STATUS_PROMEC = "I"
 
 PAGE_SIZE = 20
+
+EMAIL_STATUS_MAX_LENGTH = 10
+EMAIL_ERROR_MAX_LENGTH = 500
+EMAIL_CLAIM_TOKEN_MAX_LENGTH = 36
+
+
+class EmailOutboxStatus:
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from uuid import UUID
+
+
+@dataclass
+class RequestContext:
+    """
+    State carried through services and repositories for the current request.
+
+    It lives in a `ContextVar`, so concurrent requests served by the same worker
+    never see each other's audit id, user or caches.
+    """
+
+    audit_id: UUID | None = None
+    audit_save: bool = False
+    user_id: int | None = None
+    claims: dict | None = None
+    cache: dict[str, Any] = field(default_factory=dict)
+
+
+_request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
+def get_request_context() -> RequestContext:
+    """
+    Returns the context of the current request.
+
+    Outside a request (scripts, background tasks) an empty context is returned,
+    which is not stored.
+    """
+    context = _request_context.get()
+    return context if context is not None else RequestContext()
+
+
+def has_request_context() -> bool:
+    return _request_context.get() is not None
+
+
+@contextmanager
+def request_context(**kwargs) -> Iterator[RequestContext]:
+    context = RequestContext(**kwargs)
+    token = _request_context.set(context)
+    try:
+        yield context
+    finally:
+        _request_context.reset(token)
@@ -1,11 +1,12 @@
 import json
+from contextlib import asynccontextmanager
 from datetime import date, datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Callable
 
-from sqlalchemy import CLOB, TypeDecorator, create_engine
+from sqlalchemy import CLOB, TypeDecorator, create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
@@ -124,6 +125,48 @@ async def get_promec_db() -> AsyncGenerator[AsyncSession, None]:
             await db.close()
 
 
+@asynccontextmanager
+async def open_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Opens a separate session on the engine of `db`, to run reads concurrently
+    with it (a session does not support concurrent operations).
+
+    Objects loaded through it belong to that session, so they must not be
+    modified and saved through `db`.
+    """
+    async with AsyncSession(
+        bind=db.bind, expire_on_commit=False, autoflush=False
+    ) as session:
+        yield session
+
+
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        callback()
+
+
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the transaction of `db` commits, so in-process caches
+    are invalidated, or background workers notified, only when the change is
+    visible to other sessions. The callback is discarded when the transaction
+    rolls back.
+    """
+    session = db.sync_session
+    if not event.contains(session, "after_commit", _run_after_commit):
+        event.listen(session, "after_commit", _run_after_commit)
+        event.listen(session, "after_rollback", _discard_after_commit)
+
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
 def transactional(func):
     """
     Transactional decorator that enables `flush` in the repository to ensure that pending
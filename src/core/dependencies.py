@@ -1,11 +1,11 @@
-from fastapi import Cookie
+from fastapi import Request
 
 from src.security.services import TokenService
 
 
-def get_current_user_id(access_token: str = Cookie()):
-    result = TokenService.verify_access_token(access_token)
+def get_current_user_id(request: Request):
+    result = TokenService.get_request_claims(request)
     if result.is_failure:
         raise result.error
 
-    return result.value.user_id
+    return result.value["sub"]
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, Identity, Index, PrimaryKeyConstraint, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.constants import (
+    EMAIL_CLAIM_TOKEN_MAX_LENGTH,
+    EMAIL_ERROR_MAX_LENGTH,
+    EMAIL_STATUS_MAX_LENGTH,
+    EmailOutboxStatus,
+)
+from src.core.database import JSONCLOB, Base
+
+
+class OutboxEmail(Base):
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(Identity(start=1))
+    payload: Mapped[dict] = mapped_column(JSONCLOB)
+    status: Mapped[str] = mapped_column(
+        String(EMAIL_STATUS_MAX_LENGTH), default=EmailOutboxStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(default=0)
+    claim_token: Mapped[str] = mapped_column(
+        String(EMAIL_CLAIM_TOKEN_MAX_LENGTH), nullable=True
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(TIMESTAMP)
+    last_error: Mapped[str] = mapped_column(
+        String(EMAIL_ERROR_MAX_LENGTH), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP)
+    sent_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("id"),
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,109 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Builds an opaque cursor from the keyset values of the last row of a page.
+    """
+    payload = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type | None] | None = None) -> list[Any]:
+    """
+    Returns the keyset values stored in `cursor`. When the Python `types` of the
+    keyset columns are given, the cursor must hold one value per column and
+    every value is converted to its type (`None` leaves it as is).
+
+    Raises:
+        ValueError: If the cursor was not built by `encode_cursor` for a keyset
+            of those types.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Cursor inválido.") from e
+
+    if not isinstance(values, list) or not values:
+        raise ValueError("Cursor inválido.")
+
+    if types is None:
+        return values
+
+    if len(values) != len(types):
+        raise ValueError("Cursor inválido.")
+
+    try:
+        return [
+            _coerce(python_type, value) for python_type, value in zip(types, values)
+        ]
+    except (TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido.") from e
+
+
+def keyset_types(keyset: Sequence[InstrumentedAttribute]) -> list[type | None]:
+    """
+    Python types of the `keyset` columns, as expected by `decode_cursor`.
+    """
+    types = []
+    for column in keyset:
+        try:
+            types.append(column.type.python_type)
+        except NotImplementedError:
+            types.append(None)
+
+    return types
+
+
+def _coerce(python_type: type | None, value: Any) -> Any:
+    if python_type is None or value is None or isinstance(value, python_type):
+        return value
+
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+
+    return python_type(value)
+
+
+def keyset_filter(
+    keyset: Sequence[InstrumentedAttribute], cursor: str
+) -> ColumnElement[bool]:
+    """
+    Filter selecting the rows that follow `cursor` when ordering by `keyset` in
+    descending order. The cursor is expected to be validated with
+    `decode_cursor` and the keyset types when the request is parsed.
+
+    The comparison is expanded into `a <= x AND (a < x OR (a = x AND b < y))`
+    instead of a row value comparison, which OpenEdge does not support. The
+    leading `a <= x` lets the database seek an index whose columns follow the
+    keyset order.
+    """
+    values = decode_cursor(cursor, types=keyset_types(keyset))
+
+    conditions = []
+    for index, column in enumerate(keyset):
+        equalities = [keyset[i] == values[i] for i in range(index)]
+        conditions.append(and_(*equalities, column < values[index]))
+
+    return and_(keyset[0] <= values[0], or_(*conditions))
+
+
+def next_cursor(
+    items: Sequence[Any], keyset: Sequence[InstrumentedAttribute], limit: int | None
+) -> str | None:
+    """
+    Cursor of the page after `items`, or `None` when `items` is the last page.
+    """
+    if not items or limit is None or len(items) < limit:
+        return None
+
+    return encode_cursor([getattr(items[-1], column.key) for column in keyset])
@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+import multiprocessing
+import pickle
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from src.core.config import settings
+
+
+class PdfRenderer:
+    """
+    Runs PDF rendering functions in a bounded process pool, so that CPU-bound
+    rendering does not block the event loop, and keeps their results in a LRU
+    cache of at most `max_bytes`.
+
+    Results are keyed by a hash of the function and its pickled arguments, so
+    printing an unchanged document again returns the stored PDF. Rendering
+    functions must be defined at module level and return `bytes`, and their
+    arguments must be picklable.
+    """
+
+    def __init__(self, max_workers: int, max_bytes: int) -> None:
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self._executor: ProcessPoolExecutor | None = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._rendering: dict[str, asyncio.Future[bytes]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.max_render_seconds = 0.0
+
+    @staticmethod
+    def _key(func: Callable[..., bytes], args: tuple) -> str:
+        content = pickle.dumps(
+            (func.__module__, func.__qualname__, args),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        return hashlib.sha256(content).hexdigest()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forked workers would inherit the event loop, the database pools and
+            # the locks held by other threads of the server.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._executor
+
+    def _store(self, key: str, pdf: bytes) -> None:
+        if len(pdf) > self.max_bytes:
+            return
+
+        self._entries[key] = pdf
+        self._size += len(pdf)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    async def _render(self, key: str, func: Callable[..., bytes], args: tuple) -> bytes:
+        async with self._semaphore:
+            start = time.perf_counter()
+            pdf = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), func, *args
+            )
+            elapsed = time.perf_counter() - start
+
+        self.renders += 1
+        self.render_seconds += elapsed
+        self.max_render_seconds = max(self.max_render_seconds, elapsed)
+        self._store(key, pdf)
+        return pdf
+
+    async def render(self, func: Callable[..., bytes], *args) -> bytes:
+        """
+        Returns `func(*args)`, from the cache or rendered in the pool. Concurrent
+        requests for the same document share a single rendering.
+        """
+        key = self._key(func, args)
+        pdf = self._entries.get(key)
+        if pdf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pdf
+
+        self.misses += 1
+        rendering = self._rendering.get(key)
+        if rendering is None:
+            rendering = asyncio.ensure_future(self._render(key, func, args))
+            rendering.add_done_callback(lambda _: self._rendering.pop(key, None))
+            self._rendering[key] = rendering
+
+        # A cancelled request must not cancel the rendering shared with others.
+        return await asyncio.shield(rendering)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def metrics(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 3) if requests else 0.0,
+            "evictions": self.evictions,
+            "renders": self.renders,
+            "rendering": len(self._rendering),
+            "avg_render_ms": (
+                round(self.render_seconds / self.renders * 1000, 1)
+                if self.renders
+                else 0.0
+            ),
+            "max_render_ms": round(self.max_render_seconds * 1000, 1),
+        }
+
+
+pdf_renderer = PdfRenderer(
+    max_workers=settings.PDF_RENDER_POOL_SIZE,
+    max_bytes=settings.PDF_CACHE_MAX_BYTES,
+)
@@ -1,12 +1,113 @@
-from sqlalchemy import Sequence
+import asyncio
+
+from sqlalchemy import Sequence, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+class SequencePool:
+    """
+    Per-process pool of values reserved in blocks from a database sequence.
+
+    Every worker reserves its own blocks, so the values handed out stay unique
+    across workers. Values left in the pool when the process ends are never used,
+    which leaves gaps in the numbering.
+    """
+
+    _pools: dict[str, "SequencePool"] = {}
+
+    def __init__(self, block_size: int) -> None:
+        self.block_size = block_size
+        self.values: list[int] = []
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    def get(cls, sequence: Sequence, block_size: int) -> "SequencePool":
+        pool = cls._pools.get(sequence.name)
+        if pool is None:
+            pool = cls._pools[sequence.name] = cls(block_size=block_size)
+        return pool
+
+
 class SequenceRepository:
-    def __init__(self, sequence: Sequence, db: AsyncSession):
+    MAX_BLOCK_SIZE = 500
+
+    def __init__(self, sequence: Sequence, db: AsyncSession, block_size: int = 0):
         self.sequence = sequence
         self.db = db
+        self.pool = SequencePool.get(sequence, block_size) if block_size > 1 else None
 
     async def next_value(self) -> int:
+        if self.pool is not None:
+            return (await self.take_values(1))[0]
+
         value: int = (await self.db.execute(self.sequence.next_value())).scalar()
         return value
+
+    async def next_values(self, count: int) -> list[int]:
+        """
+        Reserves `count` values of the sequence, one round trip per block of at
+        most `MAX_BLOCK_SIZE` values. If a block comes back short or with
+        repeated values (the row source has fewer rows, or the database
+        evaluates NEXTVAL once per statement) its distinct values are kept and
+        the rest are reserved one by one.
+        """
+        values: list[int] = []
+        use_blocks = True
+        while len(values) < count:
+            block_size = min(count - len(values), self.MAX_BLOCK_SIZE)
+            stmt = self._next_values_statement(block_size) if use_blocks else None
+            if stmt is None:
+                values.append(
+                    (await self.db.execute(self.sequence.next_value())).scalar()
+                )
+                continue
+
+            rows = [row[0] for row in (await self.db.execute(stmt)).all()]
+            block = list(dict.fromkeys(rows))
+            if len(block) < block_size:
+                use_blocks = False
+            values.extend(block)
+
+        return values
+
+    async def take_values(self, count: int) -> list[int]:
+        """
+        Returns `count` values, served from the process pool when the repository
+        was created with a `block_size`, otherwise reserved with `next_values`.
+        """
+        if self.pool is None:
+            return await self.next_values(count)
+
+        async with self.pool.lock:
+            missing = count - len(self.pool.values)
+            if missing > 0:
+                block_size = max(self.pool.block_size, missing)
+                self.pool.values.extend(await self.next_values(block_size))
+
+            values = self.pool.values[:count]
+            del self.pool.values[:count]
+
+        return values
+
+    def _next_values_statement(self, count: int):
+        if count == 1:
+            return None
+
+        name = self.sequence.name
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "openedge":
+            return text(
+                f"SELECT PUB.{name}.NEXTVAL FROM SYSPROGRESS.SYSCOLUMNS "
+                f"FETCH FIRST {int(count)} ROWS ONLY"
+            )
+        if dialect == "postgresql":
+            return text(
+                f"SELECT nextval('{name}') FROM generate_series(1, {int(count)})"
+            )
+        if dialect == "oracle":
+            return text(
+                f"SELECT {name}.NEXTVAL FROM DUAL CONNECT BY LEVEL <= {int(count)}"
+            )
+
+        return None
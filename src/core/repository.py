@@ -1,10 +1,13 @@
-from typing import Any, Generic, Sequence, TypeVar, Union
+from typing import Any, Generic, Hashable, Sequence, TypeVar, Union
 
-from sqlalchemy import BinaryExpression, ClauseElement, Column, func, select
+from sqlalchemy import BinaryExpression, ClauseElement, Column, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm.strategy_options import Load
 
-from src.core.database import Base, get_db
+from src.core.cache import RefreshingCache
+from src.core.database import Base
+from src.core.pagination import keyset_filter
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -32,13 +35,11 @@ class BaseRepository(Generic[ModelType]):
 
         values_after = await AuditService.get_after_values(instance=object)
 
-        async for db in get_db():
-            await AuditService.audit_data_log(
-                db=db,
-                instance=object,
-                values_before=values_before,
-                values_after=values_after,
-            )
+        AuditService.audit_data_log(
+            instance=object,
+            values_before=values_before,
+            values_after=values_after,
+        )
 
         return object
 
@@ -47,31 +48,23 @@ class BaseRepository(Generic[ModelType]):
     ) -> Sequence[ModelType]:
         from ..security.audit.audit_service import AuditService
 
-        values_before_list = []
-        for obj in objects:
-            values_before_list.append(
-                await AuditService.get_before_values(instance=obj)
-            )
+        values_before_list = await AuditService.get_before_values_list(
+            instances=objects
+        )
 
         self.db.add_all(objects)
 
         if flush:
             await self.db.flush()
 
-        values_after_list = []
-        for obj in objects:
-            values_after_list.append(await AuditService.get_after_values(instance=obj))
-
-        async for db in get_db():
-            for obj, before, after in zip(
-                objects, values_before_list, values_after_list
-            ):
-                await AuditService.audit_data_log(
-                    db=db,
-                    instance=obj,
-                    values_before=before,
-                    values_after=after,
-                )
+        values_after_list = await AuditService.get_after_values_list(instances=objects)
+
+        for obj, before, after in zip(objects, values_before_list, values_after_list):
+            AuditService.audit_data_log(
+                instance=obj,
+                values_before=before,
+                values_after=after,
+            )
         return objects
 
     async def find(
@@ -111,20 +104,33 @@ class BaseRepository(Generic[ModelType]):
 
         return object
 
-    async def find_all(
+    def _select_all(
         self,
         filter: BinaryExpression = None,
         options: Sequence[Load] = None,
         joins: Sequence[tuple] = None,
-        apply_unique: bool = False,
         offset: int = None,
         limit: int = None,
         use_outer_joins: bool = False,
         order_by: Union[
             Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
         ] = None,
-    ) -> list[ModelType]:
-        stmt = select(self.model)
+        keyset: Sequence[InstrumentedAttribute] = None,
+        cursor: str = None,
+        columns: Sequence[ClauseElement] = (),
+    ) -> Select:
+        stmt = select(self.model, *columns)
+
+        if keyset:
+            order_by = [column.desc() for column in keyset]
+            if cursor:
+                keyset_condition = keyset_filter(keyset=keyset, cursor=cursor)
+                filter = (
+                    filter & keyset_condition
+                    if filter is not None
+                    else keyset_condition
+                )
+                offset = None
 
         if filter is not None:
             stmt = stmt.where(filter)
@@ -157,6 +163,48 @@ class BaseRepository(Generic[ModelType]):
         if limit is not None:
             stmt = stmt.limit(limit)
 
+        return stmt
+
+    def _select_count(self, filter: BinaryExpression = None) -> Select:
+        stmt = select(func.count()).select_from(self.model)
+
+        if filter is not None:
+            stmt = stmt.where(filter)
+
+        return stmt
+
+    async def find_all(
+        self,
+        filter: BinaryExpression = None,
+        options: Sequence[Load] = None,
+        joins: Sequence[tuple] = None,
+        apply_unique: bool = False,
+        offset: int = None,
+        limit: int = None,
+        use_outer_joins: bool = False,
+        order_by: Union[
+            Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
+        ] = None,
+        keyset: Sequence[InstrumentedAttribute] = None,
+        cursor: str = None,
+    ) -> list[ModelType]:
+        """
+        When `keyset` is given the rows are ordered by its columns in descending
+        order, and `cursor` (see `src.core.pagination`) seeks past the last row of
+        the previous page instead of skipping `offset` rows.
+        """
+        stmt = self._select_all(
+            filter=filter,
+            options=options,
+            joins=joins,
+            offset=offset,
+            limit=limit,
+            use_outer_joins=use_outer_joins,
+            order_by=order_by,
+            keyset=keyset,
+            cursor=cursor,
+        )
+
         if apply_unique:
             results = (await self.db.execute(stmt)).scalars().unique().all()
         else:
@@ -164,13 +212,76 @@ class BaseRepository(Generic[ModelType]):
 
         return results
 
-    async def count(self, filter: BinaryExpression = None) -> int:
-        stmt = select(func.count()).select_from(self.model)
+    async def find_page(
+        self,
+        filter: BinaryExpression = None,
+        options: Sequence[Load] = None,
+        joins: Sequence[tuple] = None,
+        apply_unique: bool = False,
+        offset: int = None,
+        limit: int = None,
+        use_outer_joins: bool = False,
+        order_by: Union[
+            Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
+        ] = None,
+        keyset: Sequence[InstrumentedAttribute] = None,
+        cursor: str = None,
+        count_cache: RefreshingCache[Hashable, int] = None,
+        count_key: Hashable = None,
+    ) -> tuple[list[ModelType], int]:
+        """
+        Same as `find_all`, also returning how many rows match `filter`.
+
+        The total is a scalar subquery of the page query, so both come back in
+        one round trip. With `count_cache` the total is read from the cache
+        under `count_key` instead, and refreshed in the background in its own
+        session; use it only where an approximate total is acceptable.
+        """
+        find_params = dict(
+            filter=filter,
+            options=options,
+            joins=joins,
+            offset=offset,
+            limit=limit,
+            use_outer_joins=use_outer_joins,
+            order_by=order_by,
+            keyset=keyset,
+            cursor=cursor,
+        )
+
+        if count_cache is not None:
+            items = await self.find_all(apply_unique=apply_unique, **find_params)
+            total = await count_cache.get(
+                key=self.model if count_key is None else count_key,
+                loader=lambda: self._count_in_new_session(filter=filter),
+            )
+            return items, total
 
-        if filter is not None:
-            stmt = stmt.where(filter)
+        total_column = (
+            self._select_count(filter=filter)
+            .correlate(None)
+            .scalar_subquery()
+            .label("total")
+        )
+        stmt = self._select_all(columns=(total_column,), **find_params)
+
+        result = await self.db.execute(stmt)
+        rows = result.unique().all() if apply_unique else result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+
+        # Past the last page the total cannot be read from the page.
+        if offset or cursor:
+            return [], await self.count(filter=filter)
+
+        return [], 0
 
-        return (await self.db.execute(stmt)).scalar()
+    async def count(self, filter: BinaryExpression = None) -> int:
+        return (await self.db.execute(self._select_count(filter=filter))).scalar()
+
+    async def _count_in_new_session(self, filter: BinaryExpression = None) -> int:
+        async with AsyncSession(bind=self.db.bind) as db:
+            return (await db.execute(self._select_count(filter=filter))).scalar()
 
     async def exists(self, filter: BinaryExpression) -> tuple[bool, ModelType | None]:
         stmt = select(self.model).where(filter).limit(1)
@@ -188,22 +299,20 @@ class BaseRepository(Generic[ModelType]):
         if self.flush:
             await self.db.flush()
 
-        async for db in get_db():
-            await AuditService.audit_data_log(
-                db=db,
-                instance=object,
-                values_before=values_before,
-                values_after={},
-            )
+        AuditService.audit_data_log(
+            instance=object,
+            values_before=values_before,
+            values_after={},
+        )
 
     async def delete_all(
         self, objects: Sequence[ModelType], flush: bool = False
     ) -> None:
         from ..security.audit.audit_service import AuditService
 
-        values_before_list = [
-            await AuditService.get_before_values(instance=obj) for obj in objects
-        ]
+        values_before_list = await AuditService.get_before_values_list(
+            instances=objects
+        )
 
         for object in objects:
             await self.db.delete(object)
@@ -212,13 +321,11 @@ class BaseRepository(Generic[ModelType]):
             await self.db.flush()
 
         for obj, before in zip(objects, values_before_list):
-            async for db in get_db():
-                await AuditService.audit_data_log(
-                    db=db,
-                    instance=obj,
-                    values_before=before,
-                    values_after={},
-                )
+            AuditService.audit_data_log(
+                instance=obj,
+                values_before=before,
+                values_after={},
+            )
 
     def expunge_all(self) -> None:
         self.db.expunge_all()
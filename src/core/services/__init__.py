@@ -1,9 +1,11 @@
-__all__ = ["EmailService", "PermissionService"]
+__all__ = ["EmailOutbox", "EmailService", "PermissionService", "email_outbox"]
 
 
 _module_map = {
+    "EmailOutbox": "email_outbox",
     "EmailService": "email_service",
     "PermissionService": "permission_service",
+    "email_outbox": "email_outbox",
 }
 
 
@@ -0,0 +1,350 @@
+import asyncio
+import base64
+import logging
+import time
+import uuid
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.constants import EMAIL_ERROR_MAX_LENGTH, EmailOutboxStatus
+from src.core.database import after_commit, get_db
+from src.core.models import OutboxEmail
+from src.core.schemas import EmailSchema
+from src.core.utils import PERU_TIMEZONE, calculate_time
+
+from .email_transport import EmailTransport, get_email_transport
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutbox:
+    """
+    Persistent outbox for outgoing emails.
+
+    `enqueue` adds the email to the `email_outbox` table in the session of the
+    caller, so it is stored only if the caller's transaction commits, and the
+    request does not wait for the mail provider. A background dispatcher claims
+    due emails, delivers them through the transport in batches with at most
+    `concurrency` batches in flight, and retries failures with exponential
+    backoff until `max_attempts`. Sent emails are deleted once they are older
+    than `retention_days`, checked every `purge_interval` seconds.
+
+    Emails are claimed with a random token and a lease: several workers can run
+    a dispatcher, and emails claimed by a worker that stops are retried once the
+    lease expires.
+    """
+
+    def __init__(
+        self,
+        transport: EmailTransport | None = None,
+        batch_size: int = settings.EMAIL_OUTBOX_BATCH_SIZE,
+        concurrency: int = settings.EMAIL_OUTBOX_CONCURRENCY,
+        poll_interval: float = settings.EMAIL_OUTBOX_POLL_INTERVAL,
+        max_attempts: int = settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_delay: float = settings.EMAIL_OUTBOX_RETRY_DELAY,
+        lease: float = settings.EMAIL_OUTBOX_LEASE,
+        retention_days: float = settings.EMAIL_OUTBOX_RETENTION_DAYS,
+        purge_interval: float = settings.EMAIL_OUTBOX_PURGE_INTERVAL,
+    ) -> None:
+        self._transport = transport
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease = lease
+        self.retention_days = retention_days
+        self.purge_interval = purge_interval
+
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._stopping = False
+        self._last_purge = 0.0
+
+        self.enqueued = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.purged = 0
+        self.dispatch_errors = 0
+        self.last_dispatch_time = 0.0
+
+    @property
+    def transport(self) -> EmailTransport:
+        if self._transport is None:
+            self._transport = get_email_transport()
+        return self._transport
+
+    @property
+    def is_running(self) -> bool:
+        return self._dispatcher is not None and not self._dispatcher.done()
+
+    def _get_wakeup(self) -> asyncio.Event:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    @staticmethod
+    def _to_payload(email: EmailSchema) -> dict:
+        payload = email.model_dump(exclude={"attachments"})
+        # Attachments are stored in base64, the encoding Resend expects for
+        # string contents.
+        payload["attachments"] = [
+            {
+                "filename": attachment.filename,
+                "content": base64.b64encode(attachment.content).decode("utf-8")
+                if isinstance(attachment.content, bytes)
+                else attachment.content,
+                "content_type": attachment.content_type,
+            }
+            for attachment in email.attachments
+        ]
+        return payload
+
+    @staticmethod
+    def _from_payload(payload: dict) -> EmailSchema:
+        email = EmailSchema.model_validate(payload)
+        for attachment in email.attachments:
+            attachment.content = base64.b64decode(attachment.content)
+        return email
+
+    def enqueue(self, email: EmailSchema, db: AsyncSession) -> None:
+        """
+        Adds `email` to the outbox in `db`. The dispatcher is woken up once the
+        transaction commits, and the email is discarded if it rolls back.
+        """
+        now = calculate_time(tz=PERU_TIMEZONE)
+        db.add(
+            OutboxEmail(
+                payload=self._to_payload(email),
+                status=EmailOutboxStatus.PENDING,
+                attempts=0,
+                next_attempt_at=now,
+                created_at=now,
+            )
+        )
+        after_commit(db, self._notify)
+
+    def _notify(self) -> None:
+        self.enqueued += 1
+        self._get_wakeup().set()
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._get_wakeup()
+        self._stopping = False
+        self._dispatcher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._get_wakeup().set()
+        if self._dispatcher is not None:
+            await self._dispatcher
+            self._dispatcher = None
+
+    async def _run(self) -> None:
+        wakeup = self._get_wakeup()
+        while not self._stopping:
+            try:
+                dispatched = await self.dispatch()
+            except Exception:
+                self.dispatch_errors += 1
+                logger.exception("Email outbox dispatch failed")
+                dispatched = 0
+
+            if time.monotonic() - self._last_purge >= self.purge_interval:
+                try:
+                    await self.purge()
+                except Exception:
+                    logger.exception("Email outbox purge failed")
+                self._last_purge = time.monotonic()
+
+            # A full batch means more emails may be due.
+            if dispatched >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+
+    async def _claim(self) -> list[OutboxEmail]:
+        now = calculate_time(tz=PERU_TIMEZONE)
+        token = str(uuid.uuid4())
+
+        outbox_emails: list[OutboxEmail] = []
+        async for db in get_db():
+            ids = (
+                await db.scalars(
+                    select(OutboxEmail.id)
+                    .where(
+                        (OutboxEmail.status == EmailOutboxStatus.PENDING)
+                        & (OutboxEmail.next_attempt_at <= now)
+                    )
+                    .order_by(OutboxEmail.next_attempt_at)
+                    .limit(self.batch_size)
+                )
+            ).all()
+            if not ids:
+                continue
+
+            # Only the emails still due are claimed, in case another worker took
+            # some of them in the meantime.
+            await db.execute(
+                update(OutboxEmail)
+                .where(
+                    (OutboxEmail.id.in_(ids))
+                    & (OutboxEmail.status == EmailOutboxStatus.PENDING)
+                    & (OutboxEmail.next_attempt_at <= now)
+                )
+                .values(
+                    claim_token=token,
+                    next_attempt_at=calculate_time(
+                        minutes=self.lease / 60, tz=PERU_TIMEZONE
+                    ),
+                )
+            )
+            outbox_emails = list(
+                (
+                    await db.scalars(
+                        select(OutboxEmail).where(OutboxEmail.claim_token == token)
+                    )
+                ).all()
+            )
+
+        return outbox_emails
+
+    async def _send(
+        self, batch: list[OutboxEmail], semaphore: asyncio.Semaphore
+    ) -> list[Exception | None]:
+        results: list[Exception | None] = [None] * len(batch)
+        emails: list[EmailSchema] = []
+        indexes: list[int] = []
+        for index, outbox_email in enumerate(batch):
+            try:
+                emails.append(self._from_payload(outbox_email.payload))
+                indexes.append(index)
+            except Exception as e:
+                results[index] = e
+
+        if emails:
+            async with semaphore:
+                sent = await self.transport.send_batch(emails)
+            for index, result in zip(indexes, sent):
+                results[index] = result
+
+        return results
+
+    async def _record(
+        self, outbox_emails: list[OutboxEmail], results: list[Exception | None]
+    ) -> None:
+        now = calculate_time(tz=PERU_TIMEZONE)
+        async for db in get_db():
+            sent_ids = [
+                outbox_email.id
+                for outbox_email, error in zip(outbox_emails, results)
+                if error is None
+            ]
+            if sent_ids:
+                await db.execute(
+                    update(OutboxEmail)
+                    .where(OutboxEmail.id.in_(sent_ids))
+                    .values(
+                        status=EmailOutboxStatus.SENT,
+                        sent_at=now,
+                        claim_token=None,
+                        last_error=None,
+                    )
+                )
+                self.sent += len(sent_ids)
+
+            for outbox_email, error in zip(outbox_emails, results):
+                if error is None:
+                    continue
+
+                attempts = outbox_email.attempts + 1
+                values = {
+                    "attempts": attempts,
+                    "claim_token": None,
+                    "last_error": str(error)[:EMAIL_ERROR_MAX_LENGTH],
+                }
+                if attempts >= self.max_attempts:
+                    values["status"] = EmailOutboxStatus.FAILED
+                    self.failed += 1
+                else:
+                    delay = self.retry_delay * 2 ** (attempts - 1)
+                    values["next_attempt_at"] = calculate_time(
+                        minutes=delay / 60, tz=PERU_TIMEZONE
+                    )
+                    self.retried += 1
+
+                await db.execute(
+                    update(OutboxEmail)
+                    .where(OutboxEmail.id == outbox_email.id)
+                    .values(**values)
+                )
+
+    async def dispatch(self) -> int:
+        """
+        Claims and delivers one batch of due emails, and returns its size.
+        """
+        outbox_emails = await self._claim()
+        if not outbox_emails:
+            return 0
+
+        start = time.perf_counter()
+        size = self.transport.batch_size
+        batches = [
+            outbox_emails[index : index + size]
+            for index in range(0, len(outbox_emails), size)
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *[self._send(batch, semaphore) for batch in batches]
+        )
+
+        await self._record(
+            outbox_emails, [result for batch in results for result in batch]
+        )
+        self.last_dispatch_time = time.perf_counter() - start
+
+        return len(outbox_emails)
+
+    async def purge(self) -> int:
+        """
+        Deletes the sent emails older than `retention_days`, and returns how many
+        were deleted. Failed emails are kept for inspection.
+        """
+        cutoff = calculate_time(days=-self.retention_days, tz=PERU_TIMEZONE)
+        purged = 0
+        async for db in get_db():
+            result = await db.execute(
+                delete(OutboxEmail).where(
+                    (OutboxEmail.status == EmailOutboxStatus.SENT)
+                    & (OutboxEmail.sent_at < cutoff)
+                )
+            )
+            purged = result.rowcount
+
+        self.purged += purged
+        return purged
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.is_running,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "purged": self.purged,
+            "dispatch_errors": self.dispatch_errors,
+            "last_dispatch_time": round(self.last_dispatch_time, 3),
+        }
+
+
+email_outbox = EmailOutbox()
@@ -0,0 +1,170 @@
+import asyncio
+import base64
+from abc import ABC, abstractmethod
+from email.message import Message
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import aiosmtplib
+import resend
+
+from src.core.config import settings
+from src.core.constants import AppEnvironment
+from src.core.schemas import EmailSchema
+
+
+class EmailTransport(ABC):
+    """
+    Delivers batches of emails for the outbox dispatcher.
+
+    `send_batch` returns, for each email and in the same order, `None` when it
+    was accepted or the exception that prevented it, so that only the failed
+    emails are retried.
+    """
+
+    batch_size: int = 1
+
+    @abstractmethod
+    async def send_batch(self, emails: list[EmailSchema]) -> list[Exception | None]:
+        pass
+
+
+class ResendTransport(EmailTransport):
+    """
+    Resend API. Emails without attachments go through the batch endpoint, which
+    does not accept them; the rest are sent one by one. The client is blocking,
+    so calls run in a thread.
+    """
+
+    batch_size = 100
+
+    def __init__(self) -> None:
+        resend.api_key = settings.RESEND_API_KEY
+
+    @staticmethod
+    def _to_params(email: EmailSchema) -> resend.Emails.SendParams:
+        params: resend.Emails.SendParams = {
+            "from": email.from_,
+            "to": email.to,
+            "subject": email.subject,
+        }
+
+        if email.cc:
+            params["cc"] = email.cc
+        if email.bcc:
+            params["bcc"] = email.bcc
+        if email.body_text:
+            params["text"] = email.body_text
+        if email.body_html:
+            params["html"] = email.body_html
+        if email.attachments:
+            params["attachments"] = [
+                {
+                    "filename": attachment.filename,
+                    "content": base64.b64encode(attachment.content).decode("utf-8")
+                    if isinstance(attachment.content, bytes)
+                    else attachment.content,
+                    "content_type": attachment.content_type,
+                }
+                for attachment in email.attachments
+            ]
+
+        return params
+
+    async def _send(self, email: EmailSchema) -> Exception | None:
+        try:
+            await asyncio.to_thread(resend.Emails.send, self._to_params(email))
+        except Exception as e:
+            return e
+
+        return None
+
+    async def send_batch(self, emails: list[EmailSchema]) -> list[Exception | None]:
+        results: list[Exception | None] = [None] * len(emails)
+
+        plain = [index for index, email in enumerate(emails) if not email.attachments]
+        if plain:
+            try:
+                await asyncio.to_thread(
+                    resend.Batch.send, [self._to_params(emails[i]) for i in plain]
+                )
+            except Exception as e:
+                for index in plain:
+                    results[index] = e
+
+        for index, email in enumerate(emails):
+            if email.attachments:
+                results[index] = await self._send(email)
+
+        return results
+
+
+class SmtpTransport(EmailTransport):
+    """
+    SMTP server, such as the MailHog instance used outside production. A batch
+    is delivered over a single connection.
+    """
+
+    batch_size = 50
+
+    def __init__(
+        self,
+        hostname: str = settings.MAILHOG_HOSTNAME,
+        port: int = settings.MAILHOG_PORT,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+
+    @staticmethod
+    def _to_message(email: EmailSchema) -> Message:
+        message = MIMEMultipart()
+        message["From"] = email.from_
+        message["To"] = ", ".join(email.to)
+        message["Subject"] = email.subject
+
+        if email.cc:
+            message["Cc"] = ", ".join(email.cc)
+        if email.bcc:
+            message["Bcc"] = ", ".join(email.bcc)
+        if email.body_text:
+            message.attach(MIMEText(email.body_text, "plain"))
+        if email.body_html:
+            message.attach(MIMEText(email.body_html, "html"))
+
+        for attachment in email.attachments:
+            part = MIMEApplication(attachment.content, Name=attachment.filename)
+            part.add_header(
+                "Content-Disposition",
+                "attachment",
+                filename=("utf-8", "", attachment.filename),
+            )
+            part.add_header("Content-Type", attachment.content_type)
+            message.attach(part)
+
+        return message
+
+    async def send_batch(self, emails: list[EmailSchema]) -> list[Exception | None]:
+        results: list[Exception | None] = []
+        try:
+            async with aiosmtplib.SMTP(hostname=self.hostname, port=self.port) as smtp:
+                for email in emails:
+                    recipients = email.to + (email.cc or []) + (email.bcc or [])
+                    try:
+                        await smtp.send_message(
+                            self._to_message(email), recipients=recipients
+                        )
+                        results.append(None)
+                    except aiosmtplib.SMTPResponseException as e:
+                        results.append(e)
+        except Exception as e:
+            results.extend([e] * (len(emails) - len(results)))
+
+        return results
+
+
+def get_email_transport() -> EmailTransport:
+    if settings.ENVIRONMENT == AppEnvironment.PRODUCTION:
+        return ResendTransport()
+
+    return SmtpTransport()
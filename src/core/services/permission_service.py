@@ -21,20 +21,14 @@ class PermissionService:
             async def wrapper(
                 request: Request, db: AsyncSession = Depends(get_db), *args, **kwargs
             ):
-                access_token = request.cookies.get("access_token")
-                token_service = TokenService(db=db)
                 auth_service = AuthService(db=db)
 
-                verification_result = token_service.verify_access_token(
-                    token=access_token
-                )
+                verification_result = TokenService.get_request_claims(request)
                 if verification_result.is_failure:
                     raise verification_result.error
 
-                token_data = token_service.decode_token(token=access_token)
-
                 auth_result = await auth_service.is_valid_access_operation_to_user(
-                    user_id=token_data["sub"],
+                    user_id=verification_result.value["sub"],
                     access_id=access,
                     operation_id=operation,
                 )
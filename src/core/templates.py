@@ -0,0 +1,55 @@
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from src.core.config import settings
+from src.core.constants import AppEnvironment
+
+
+class TemplateRegistry:
+    """
+    Process-wide Jinja environment for the templates under `searchpath`.
+
+    Templates are compiled once and kept in memory. With `auto_reload` (local
+    and development environments) each lookup checks whether the file changed;
+    otherwise templates are never reloaded and their compiled bytecode is kept
+    in a `FileSystemBytecodeCache`, so new workers skip the parsing as well.
+    """
+
+    def __init__(self, searchpath: str, auto_reload: bool) -> None:
+        self.searchpath = searchpath
+        self.auto_reload = auto_reload
+        self._env: Environment | None = None
+
+    @property
+    def env(self) -> Environment:
+        if self._env is None:
+            self._env = Environment(
+                loader=FileSystemLoader(searchpath=self.searchpath),
+                auto_reload=self.auto_reload,
+                bytecode_cache=None if self.auto_reload else FileSystemBytecodeCache(),
+                cache_size=-1,
+            )
+        return self._env
+
+    def get_template(self, name: str) -> Template:
+        return self.env.get_template(name)
+
+    def warm_up(self) -> int:
+        """
+        Compiles every template, and returns how many there are.
+        """
+        names = self.env.list_templates()
+        for name in names:
+            self.env.get_template(name)
+
+        return len(names)
+
+    def clear(self) -> None:
+        if self._env is not None:
+            self._env.cache.clear()
+
+
+email_templates = TemplateRegistry(
+    searchpath=settings.ASSETS_DIR + "email_templates",
+    auto_reload=settings.ENVIRONMENT
+    in (AppEnvironment.LOCAL, AppEnvironment.DEVELOPMENT),
+)
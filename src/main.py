@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from core.config import settings
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -5,14 +9,63 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from routing import api_router
 
-from src.core.database import get_db
+from src.core.database import get_db, get_promec_db
 from src.core.exceptions import CustomException
-from src.security.audit import AuditService
+from src.core.rendering import pdf_renderer
+from src.core.services import email_outbox
+from src.core.templates import email_templates
+from src.operations.services import FabricService
+from src.security.audit import (
+    AuditService,
+    audit_action_log_queue,
+    audit_data_log_queue,
+)
+from src.security.loaders import parameter_cache
 from src.security.services import AuthService, TokenService
 
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_fabric_catalog() -> None:
+    """
+    Fills the fabric catalog in the background, so the startup does not wait
+    for it. Requests made in the meantime load the fabrics they need.
+    """
+    try:
+        async for db in get_db():
+            async for promec_db in get_promec_db():
+                await FabricService(db=db, promec_db=promec_db).warm_up_catalog()
+    except Exception:
+        logger.exception("Fabric catalog warm-up failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await audit_action_log_queue.start()
+    await audit_data_log_queue.start()
+    await email_outbox.start()
+    email_templates.warm_up()
+
+    try:
+        async for db in get_db():
+            await parameter_cache.warm_up(db)
+    except Exception:
+        logger.exception("Parameter cache warm-up failed")
+
+    fabric_catalog_warm_up = asyncio.create_task(warm_up_fabric_catalog())
+
+    yield
+    fabric_catalog_warm_up.cancel()
+    await audit_action_log_queue.stop()
+    await audit_data_log_queue.stop()
+    await email_outbox.stop()
+    pdf_renderer.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
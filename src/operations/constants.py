@@ -127,6 +127,15 @@ INVENTORY_ITEM_FIELD1_MAX_LENGTH = 16
 
 YARN_ID_MAX_LENGTH = PRODUCT_ID_MAX_LENGTH
 
+RECIPE_FINGERPRINT_ITEM_TYPE_MAX_LENGTH = 6
+RECIPE_FINGERPRINT_MAX_LENGTH = 64
+
+
+class RecipeFingerprintItemType:
+    YARN = "YARN"
+    FABRIC = "FABRIC"
+
+
 YARN_PURCHASE_ENTRY_STORAGE_CODE = "006"
 YARN_PURCHASE_ENTRY_MOVEMENT_TYPE = "I"
 YARN_PURCHASE_ENTRY_MOVEMENT_CODE = "01"
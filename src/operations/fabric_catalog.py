@@ -0,0 +1,138 @@
+from typing import Awaitable, Callable
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.operations.schemas import FabricSchema
+
+_MISSING = object()
+
+FABRIC_CATALOG_IDS_CHUNK_SIZE = 500
+
+FabricLoader = Callable[[list[str] | None], Awaitable[list[FabricSchema]]]
+
+
+class FabricCatalog:
+    """
+    Process-wide index of the fabrics with their type, color and recipe, whose
+    items (`operectej`) hold the yarns they use.
+
+    Entries are detached `FabricSchema` copies with every related data resolved,
+    so they can be shared between requests and sessions. Reads return copies
+    with only the related data that was requested. Misses and expired entries
+    are loaded again by `loader` in batches, and ids that are not fabrics are
+    cached as well, until the TTL expires or the fabric is invalidated.
+
+    Writers must invalidate the fabric they changed, and the whole catalog when
+    a yarn or color used by the recipes changes.
+    """
+
+    def __init__(self, ttl: float = settings.FABRIC_CATALOG_TTL) -> None:
+        self.by_id: TTLCache[str, FabricSchema | None] = TTLCache(ttl=ttl)
+
+    @staticmethod
+    def _copy(
+        fabric: FabricSchema,
+        include_fabric_type: bool = False,
+        include_color: bool = False,
+        include_recipe: bool = False,
+        include_yarn_instance_to_recipe: bool = False,
+    ) -> FabricSchema:
+        recipe = []
+        if include_recipe:
+            recipe = [
+                item.model_copy(
+                    update={
+                        "yarn": item.yarn.model_copy(deep=True)
+                        if include_yarn_instance_to_recipe and item.yarn is not None
+                        else None
+                    }
+                )
+                for item in fabric.recipe
+            ]
+
+        return fabric.model_copy(
+            update={
+                "fabric_type": fabric.fabric_type.model_copy()
+                if include_fabric_type and fabric.fabric_type is not None
+                else None,
+                "color": fabric.color.model_copy()
+                if include_color and fabric.color is not None
+                else None,
+                "recipe": recipe,
+                "supplier_yarn_ids": list(fabric.supplier_yarn_ids),
+            }
+        )
+
+    def _store(self, fabrics: list[FabricSchema]) -> None:
+        for fabric in fabrics:
+            self.by_id.set(fabric.id, fabric)
+
+    async def get_by_ids(
+        self,
+        fabric_ids: list[str],
+        loader: FabricLoader,
+        include_fabric_type: bool = False,
+        include_color: bool = False,
+        include_recipe: bool = False,
+        include_yarn_instance_to_recipe: bool = False,
+    ) -> dict[str, FabricSchema]:
+        fabrics: dict[str, FabricSchema | None] = {}
+        missing_ids: list[str] = []
+        for fabric_id in dict.fromkeys(fabric_ids):
+            fabric = self.by_id.get(fabric_id, _MISSING)
+            if fabric is _MISSING:
+                missing_ids.append(fabric_id)
+            else:
+                fabrics[fabric_id] = fabric
+
+        for start in range(0, len(missing_ids), FABRIC_CATALOG_IDS_CHUNK_SIZE):
+            chunk = missing_ids[start : start + FABRIC_CATALOG_IDS_CHUNK_SIZE]
+            found = await loader(chunk)
+            self._store(found)
+            for fabric in found:
+                fabrics[fabric.id] = fabric
+
+            for fabric_id in chunk:
+                if fabric_id not in fabrics:
+                    fabrics[fabric_id] = self.by_id.set(fabric_id, None)
+
+        return {
+            fabric_id: self._copy(
+                fabric,
+                include_fabric_type=include_fabric_type,
+                include_color=include_color,
+                include_recipe=include_recipe,
+                include_yarn_instance_to_recipe=include_yarn_instance_to_recipe,
+            )
+            for fabric_id, fabric in fabrics.items()
+            if fabric is not None
+        }
+
+    async def get_by_id(
+        self, fabric_id: str, loader: FabricLoader, **kwargs
+    ) -> FabricSchema | None:
+        return (
+            await self.get_by_ids(fabric_ids=[fabric_id], loader=loader, **kwargs)
+        ).get(fabric_id)
+
+    async def warm_up(self, loader: FabricLoader) -> int:
+        """
+        Loads every fabric in one pass and fills the index.
+        """
+        fabrics = await loader(None)
+        self._store(fabrics)
+
+        return len(fabrics)
+
+    def invalidate(self, fabric_id: str | None = None) -> None:
+        if fabric_id is None:
+            self.by_id.clear()
+            return
+
+        self.by_id.invalidate(fabric_id)
+
+    def metrics(self) -> dict:
+        return self.by_id.metrics()
+
+
+fabric_catalog = FabricCatalog()
@@ -81,6 +81,8 @@ from src.operations.constants import (
     PRODUCT_CODE_MAX_LENGTH,
     PURCHASE_ORDER_NUMBER_MAX_LENGTH,
     PURCHASE_ORDER_TYPE_MAX_LENGTH,
+    RECIPE_FINGERPRINT_ITEM_TYPE_MAX_LENGTH,
+    RECIPE_FINGERPRINT_MAX_LENGTH,
     REFERENCE_CODE_MAX_LENGTH,
     REFERENCE_DOCUMENT_MAX_LENGTH,
     REFERENCE_NUMBER_MAX_LENGTH,
@@ -1779,6 +1781,27 @@ class YarnDistinction(Base):
     distinction_id: Mapped[int] = mapped_column("distincion_id", primary_key=True)
 
 
+class RecipeFingerprint(Base):
+    __tablename__ = "recipe_fingerprints"
+
+    item_type: Mapped[str] = mapped_column(
+        String(length=RECIPE_FINGERPRINT_ITEM_TYPE_MAX_LENGTH)
+    )
+    item_id: Mapped[str] = mapped_column(String(length=PRODUCT_CODE_MAX_LENGTH))
+    fingerprint: Mapped[str] = mapped_column(
+        String(length=RECIPE_FINGERPRINT_MAX_LENGTH)
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("item_type", "item_id"),
+        UniqueConstraint(
+            "item_type",
+            "fingerprint",
+            name="uq_recipe_fingerprints_item_type_fingerprint",
+        ),
+    )
+
+
 class Series(PromecBase):
     __tablename__ = "admseries"
 
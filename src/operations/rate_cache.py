@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.constants import MECSA_COMPANY_CODE
+from src.core.repository import BaseRepository
+from src.operations.models import ServiceCardOperation
+
+
+@dataclass(frozen=True)
+class ServiceRate:
+    rate: float
+    extended_rate: float
+
+
+# (serial_code, fabric_id, width, codcol)
+ServiceRateKey = tuple[str, str, float, str]
+
+
+class ServiceRateCache:
+    """
+    Process-wide index of the service rates (`opetarserv`), by period, month and
+    supplier.
+
+    A miss loads every rate of the supplier for that month in one query, and
+    later lookups are answered from a dict. Entries of previous months are
+    dropped as soon as a later month is requested. Lookups of rates that are
+    not registered are counted in `missing_rates`.
+    """
+
+    def __init__(self, ttl: float = settings.SERVICE_RATE_CACHE_TTL) -> None:
+        self.by_supplier: TTLCache[
+            tuple[int, int, str], dict[ServiceRateKey, ServiceRate]
+        ] = TTLCache(ttl=ttl)
+        self._month: tuple[int, int] | None = None
+        self.missing_rates = 0
+
+    def _roll_over(self, period: int, month: int) -> None:
+        if self._month is not None and (period, month) <= self._month:
+            return
+
+        if self._month is not None:
+            self.by_supplier.clear()
+
+        self._month = (period, month)
+
+    async def get_by_suppliers(
+        self, db: AsyncSession, period: int, month: int, supplier_ids: list[str]
+    ) -> dict[str, dict[ServiceRateKey, ServiceRate]]:
+        self._roll_over(period=period, month=month)
+
+        rates: dict[str, dict[ServiceRateKey, ServiceRate]] = {}
+        missing_ids: list[str] = []
+        for supplier_id in dict.fromkeys(supplier_ids):
+            supplier_rates = self.by_supplier.get((period, month, supplier_id))
+            if supplier_rates is None:
+                missing_ids.append(supplier_id)
+            else:
+                rates[supplier_id] = supplier_rates
+
+        if missing_ids:
+            found = await BaseRepository(model=ServiceCardOperation, db=db).find_all(
+                filter=(ServiceCardOperation.company_code == MECSA_COMPANY_CODE)
+                & (ServiceCardOperation.period == period)
+                & (ServiceCardOperation.month_number == month)
+                & (ServiceCardOperation.supplier_id.in_(missing_ids))
+            )
+
+            loaded: dict[str, dict[ServiceRateKey, ServiceRate]] = {
+                supplier_id: {} for supplier_id in missing_ids
+            }
+            for rate in found:
+                loaded[rate.supplier_id][
+                    (rate.serial_code, rate.fabric_id, rate.width, rate.codcol)
+                ] = ServiceRate(rate=rate.rate, extended_rate=rate.extended_rate)
+
+            for supplier_id, supplier_rates in loaded.items():
+                rates[supplier_id] = self.by_supplier.set(
+                    (period, month, supplier_id), supplier_rates
+                )
+
+        return rates
+
+    async def get_rate(
+        self,
+        db: AsyncSession,
+        period: int,
+        month: int,
+        supplier_id: str,
+        key: ServiceRateKey,
+    ) -> ServiceRate | None:
+        rates = await self.get_by_suppliers(
+            db=db, period=period, month=month, supplier_ids=[supplier_id]
+        )
+        return rates[supplier_id].get(key)
+
+    def invalidate(
+        self,
+        period: int | None = None,
+        month: int | None = None,
+        supplier_id: str | None = None,
+    ) -> None:
+        if period is None or month is None or supplier_id is None:
+            self.by_supplier.clear()
+            return
+
+        self.by_supplier.invalidate((period, month, supplier_id))
+
+    def record_missing_rate(self) -> None:
+        self.missing_rates += 1
+
+    def metrics(self) -> dict:
+        return {**self.by_supplier.metrics(), "missing_rates": self.missing_rates}
+
+
+service_rate_cache = ServiceRateCache()
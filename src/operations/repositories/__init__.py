@@ -22,6 +22,7 @@ from .product_inventory_repository import ProductInventoryRepository
 from .programacion_tintoreria_repository import ProgramacionTintoreriaRepository
 from .proveedor_repository import ProveedorRepository
 from .purchase_order_detail_repository import PurchaseOrderDetailRepository
+from .recipe_fingerprint_repository import RecipeFingerprintRepository
 from .series_repository import SeriesRepository
 from .service_order_repository import ServiceOrderRepository
 from .service_order_supply_stock_repository import ServiceOrderSupplyDetailRepository
@@ -66,4 +67,5 @@ __all__ = [
     "DyeingServiceDispatchRepository",
     "CardOperationRepository",
     "FabricRecipeRepository",
+    "RecipeFingerprintRepository",
 ]
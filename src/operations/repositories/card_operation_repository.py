@@ -8,6 +8,8 @@ from src.core.constants import MECSA_COMPANY_CODE
 from src.core.repository import BaseRepository
 from src.operations.models import CardOperation
 
+CARD_OPERATION_IDS_CHUNK_SIZE = 500
+
 
 class CardOperationRepository(BaseRepository[CardOperation]):
     def __init__(self, promec_db: AsyncSession, flush: bool = False) -> None:
@@ -51,3 +53,24 @@ class CardOperationRepository(BaseRepository[CardOperation]):
             options=options,
             **kwargs,
         )
+
+    async def find_card_operations_by_ids(
+        self,
+        ids: list[str],
+        chunk_size: int = CARD_OPERATION_IDS_CHUNK_SIZE,
+    ) -> list[CardOperation]:
+        """
+        Loads the cards in `ids` with an IN query per `chunk_size` ids, which
+        keeps the statement within the parameter limits of the database.
+        """
+        ids = list(dict.fromkeys(ids))
+        card_operations: list[CardOperation] = []
+        for start in range(0, len(ids), chunk_size):
+            card_operations.extend(
+                await self.find_all(
+                    filter=(CardOperation.company_code == MECSA_COMPANY_CODE)
+                    & (CardOperation.id.in_(ids[start : start + chunk_size])),
+                )
+            )
+
+        return card_operations
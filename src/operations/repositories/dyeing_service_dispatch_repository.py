@@ -95,8 +95,9 @@ class DyeingServiceDispatchRepository(MovementRepository):
         include_detail_card: bool = False,
         limit: int = None,
         offset: int = None,
+        cursor: str = None,
         filter: BinaryExpression = None,
-    ) -> Movement:
+    ) -> tuple[list[Movement], int]:
         base_filter = (
             (Movement.storage_code == WEAVING_STORAGE_CODE)
             & (Movement.movement_type == DISPATCH_MOVEMENT_TYPE)
@@ -115,16 +116,15 @@ class DyeingServiceDispatchRepository(MovementRepository):
             period=period,
         )
 
-        dyeing_service_dispatches = await self.find_movements(
+        return await self.find_movements_page(
             filter=filter,
             options=options,
             limit=limit,
             offset=offset,
-            order_by=[Movement.document_number.desc()],
+            keyset=self.get_movement_keyset(),
+            cursor=cursor,
         )
 
-        return dyeing_service_dispatches
-
     async def find_dyeing_service_dispatch_by_dispatch_number(
         self,
         dispatch_number: str,
@@ -184,24 +184,3 @@ class DyeingServiceDispatchRepository(MovementRepository):
         )
 
         return dyeing_service_dispatch_details
-
-    async def count_dyeing_service_dispatches(
-        self,
-        period: int,
-        include_annulled: bool = False,
-        filter: BinaryExpression = None,
-    ) -> int:
-        base_filter = (
-            (Movement.storage_code == WEAVING_STORAGE_CODE)
-            & (Movement.movement_type == DISPATCH_MOVEMENT_TYPE)
-            & (Movement.movement_code == DYEING_SERVICE_DISPATCH_MOVEMENT_CODE)
-            & (Movement.document_code == DYEING_SERVICE_DISPATCH_DOCUMENT_CODE)
-            & (Movement.period == period)
-        )
-
-        if not include_annulled:
-            base_filter = base_filter & (Movement.status_flag == "P")
-
-        filter = base_filter & filter if filter is not None else base_filter
-
-        return await self.count_movements(filter=filter)
@@ -2,7 +2,7 @@ from typing import Sequence, Union
 
 from sqlalchemy import BinaryExpression, ClauseElement, Column
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 from sqlalchemy.orm.strategy_options import Load
 
 from src.core.constants import MECSA_COMPANY_CODE
@@ -21,6 +21,16 @@ class MovementRepository(BaseRepository[Movement]):
     def get_movement_fields() -> tuple:
         return (Movement.auxiliary_code,)
 
+    @staticmethod
+    def get_movement_keyset() -> tuple[InstrumentedAttribute, ...]:
+        # Same order as the primary key of almcmovi, so the cursor seeks the index.
+        return (Movement.document_number, Movement.period)
+
+    @staticmethod
+    def get_movement_creation_date_keyset() -> tuple[InstrumentedAttribute, ...]:
+        # Newest movements first; document number and period make the order unique.
+        return (Movement.creation_date, Movement.document_number, Movement.period)
+
     async def find_movement_by_document_number(
         self,
         document_number: str,
@@ -60,6 +70,8 @@ class MovementRepository(BaseRepository[Movement]):
         order_by: Union[
             Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
         ] = None,
+        keyset: Sequence[InstrumentedAttribute] = None,
+        cursor: str = None,
     ) -> list[Movement]:
         base_filter = Movement.company_code == MECSA_COMPANY_CODE
         filter = base_filter & filter if filter is not None else base_filter
@@ -73,16 +85,40 @@ class MovementRepository(BaseRepository[Movement]):
             use_outer_joins=use_outer_joins,
             offset=offset,
             order_by=order_by,
+            keyset=keyset,
+            cursor=cursor,
         )
 
-    async def count_movements(
+    async def find_movements_page(
         self,
         filter: BinaryExpression = None,
-    ) -> int:
+        options: Sequence[Load] = None,
+        apply_unique: bool = False,
+        joins: list[tuple] = None,
+        use_outer_joins: bool = False,
+        limit: int = None,
+        offset: int = None,
+        order_by: Union[
+            Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
+        ] = None,
+        keyset: Sequence[InstrumentedAttribute] = None,
+        cursor: str = None,
+    ) -> tuple[list[Movement], int]:
         base_filter = Movement.company_code == MECSA_COMPANY_CODE
         filter = base_filter & filter if filter is not None else base_filter
 
-        return await self.count(filter=filter)
+        return await self.find_page(
+            filter=filter,
+            options=options,
+            joins=joins,
+            apply_unique=apply_unique,
+            limit=limit,
+            use_outer_joins=use_outer_joins,
+            offset=offset,
+            order_by=order_by,
+            keyset=keyset,
+            cursor=cursor,
+        )
 
     async def find_movements_detail(
         self,
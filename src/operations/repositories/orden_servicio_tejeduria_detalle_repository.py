@@ -1,9 +1,13 @@
-from sqlalchemy import BinaryExpression
+from typing import Iterable
+
+from sqlalchemy import BinaryExpression, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.repository import BaseRepository
 from src.operations.models import OrdenServicioTejeduriaDetalle
 
+SUBORDEN_IDS_CHUNK_SIZE = 500
+
 
 class OrdenServicioTejeduriaDetalleRepository(
     BaseRepository[OrdenServicioTejeduriaDetalle]
@@ -17,3 +21,28 @@ class OrdenServicioTejeduriaDetalleRepository(
         suborden = await self.find(filter=filter)
 
         return suborden
+
+    async def find_subordenes_by_ids(
+        self,
+        ids: Iterable[tuple[str, str]],
+        chunk_size: int = SUBORDEN_IDS_CHUNK_SIZE,
+    ) -> dict[tuple[str, str], OrdenServicioTejeduriaDetalle]:
+        """
+        Loads the subórdenes with the given `(orden_servicio_tejeduria_id,
+        crudo_id)` keys, mapped by key, with a composite-key IN query per
+        `chunk_size` keys. Missing keys are left out.
+        """
+        ids = list(dict.fromkeys(ids))
+        subordenes: dict[tuple[str, str], OrdenServicioTejeduriaDetalle] = {}
+        for start in range(0, len(ids), chunk_size):
+            for suborden in await self.find_all(
+                filter=tuple_(
+                    OrdenServicioTejeduriaDetalle.orden_servicio_tejeduria_id,
+                    OrdenServicioTejeduriaDetalle.crudo_id,
+                ).in_(ids[start : start + chunk_size])
+            ):
+                subordenes[
+                    (suborden.orden_servicio_tejeduria_id, suborden.crudo_id)
+                ] = suborden
+
+        return subordenes
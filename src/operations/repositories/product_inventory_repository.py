@@ -1,6 +1,6 @@
 from typing import Sequence, Union
 
-from sqlalchemy import BinaryExpression, ClauseElement, Column
+from sqlalchemy import BinaryExpression, ClauseElement, Column, and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.strategy_options import Load
 
@@ -60,3 +60,46 @@ class ProductInventoryRepository(BaseRepository[ProductInventory]):
             offset=offset,
             order_by=order_by,
         )
+
+    async def add_current_stock(
+        self,
+        product_code1: str,
+        storage_code: str,
+        period: int,
+        quantity: float,
+    ) -> ProductInventory | None:
+        """
+        Adds `quantity` to the stock in a single `UPDATE ... SET stkact = stkact +
+        :quantity` and returns the updated inventory row, or `None` when the
+        product has no inventory row for the storage and period.
+
+        The UPDATE locks the `almprodalm` row until the transaction ends, so
+        concurrent movements on the same product never overwrite each other.
+        """
+        filter = and_(
+            ProductInventory.company_code == MECSA_COMPANY_CODE,
+            ProductInventory.product_code1 == product_code1,
+            ProductInventory.storage_code == storage_code,
+            ProductInventory.period == period,
+        )
+        stmt = (
+            update(ProductInventory)
+            .where(filter)
+            .values(current_stock=ProductInventory.current_stock + quantity)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        if self.db.get_bind().dialect.update_returning:
+            return (await self.db.execute(stmt.returning(ProductInventory))).scalar()
+
+        result = await self.db.execute(stmt)
+        if result.rowcount == 0:
+            return None
+
+        return (
+            await self.db.execute(
+                select(ProductInventory)
+                .where(filter)
+                .execution_options(populate_existing=True)
+            )
+        ).scalar()
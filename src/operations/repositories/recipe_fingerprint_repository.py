@@ -0,0 +1,40 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repository import BaseRepository
+from src.operations.models import RecipeFingerprint
+
+
+class RecipeFingerprintRepository(BaseRepository[RecipeFingerprint]):
+    def __init__(self, db: AsyncSession, flush: bool = False) -> None:
+        super().__init__(RecipeFingerprint, db, flush)
+
+    async def find_item_ids_by_fingerprint(
+        self, item_type: str, fingerprint: str
+    ) -> list[str]:
+        stmt = select(RecipeFingerprint.item_id).where(
+            (RecipeFingerprint.item_type == item_type)
+            & (RecipeFingerprint.fingerprint == fingerprint)
+        )
+
+        return list((await self.db.scalars(stmt)).all())
+
+    async def save_fingerprint(
+        self, item_type: str, item_id: str, fingerprint: str
+    ) -> RecipeFingerprint | None:
+        """
+        Stores the fingerprint of the item, and returns `None` when another item
+        of the same type already has it. The row is flushed in a savepoint, so
+        the session can still be used after a conflict.
+        """
+        instance = await self.find_by_id((item_type, item_id))
+        if instance is None:
+            instance = RecipeFingerprint(item_type=item_type, item_id=item_id)
+
+        try:
+            async with self.db.begin_nested():
+                instance.fingerprint = fingerprint
+                return await self.save(instance, flush=True)
+        except IntegrityError:
+            return None
@@ -1,3 +1,4 @@
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MECSA_COMPANY_CODE
@@ -18,3 +19,39 @@ class SeriesRepository(BaseRepository[Series]):
             "service_number": service_number,
         }
         return await self.find_by_id(id=id)
+
+    async def reserve_numbers(
+        self, document_code: str, service_number: int, count: int = 1
+    ) -> Series | None:
+        """
+        Advances the series by `count` in a single UPDATE and returns the updated
+        row, whose `number` is the last reserved number, or `None` when the series
+        does not exist.
+
+        The UPDATE locks the `admseries` row until the transaction ends, so
+        concurrent reservations never hand out the same number.
+        """
+        filter = and_(
+            Series.company_code == MECSA_COMPANY_CODE,
+            Series.document_code == document_code,
+            Series.service_number == service_number,
+        )
+        stmt = (
+            update(Series)
+            .where(filter)
+            .values(number=Series.number + count)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        if self.db.get_bind().dialect.update_returning:
+            return (await self.db.execute(stmt.returning(Series))).scalar()
+
+        result = await self.db.execute(stmt)
+        if result.rowcount == 0:
+            return None
+
+        return (
+            await self.db.execute(
+                select(Series).where(filter).execution_options(populate_existing=True)
+            )
+        ).scalar()
@@ -2,7 +2,7 @@ from typing import Sequence, Union
 
 from sqlalchemy import BinaryExpression, ClauseElement, Column
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.sql import func
 
@@ -15,6 +15,10 @@ class ServiceOrderRepository(BaseRepository[ServiceOrder]):
     def __init__(self, promec_db: AsyncSession, flush: bool = False) -> None:
         super().__init__(ServiceOrder, promec_db, flush)
 
+    @staticmethod
+    def get_service_order_keyset() -> tuple[InstrumentedAttribute, ...]:
+        return (ServiceOrder.issue_date, ServiceOrder.id)
+
     def get_load_options(
         self,
         include_detail: bool = False,
@@ -37,11 +41,16 @@ class ServiceOrderRepository(BaseRepository[ServiceOrder]):
         filter: BinaryExpression = None,
         limit: int = None,
         offset: int = None,
+        cursor: str = None,
         apply_unique: bool = False,
         order_by: Union[
             Column, ClauseElement, Sequence[Union[Column, ClauseElement]]
         ] = None,
     ) -> list[ServiceOrder]:
+        """
+        Service orders are returned newest first and paged by `cursor`. An
+        explicit `order_by` replaces that order and disables the cursor.
+        """
         base_filter = (ServiceOrder.company_code == MECSA_COMPANY_CODE) & (
             ServiceOrder._type == order_type
         )
@@ -67,8 +76,30 @@ class ServiceOrderRepository(BaseRepository[ServiceOrder]):
             options=options,
             limit=limit,
             offset=offset,
-            order_by=order_by,
             apply_unique=True,
+            order_by=order_by,
+            keyset=self.get_service_order_keyset() if order_by is None else None,
+            cursor=cursor,
+        )
+
+    async def find_service_orders_by_ids(
+        self,
+        order_ids: list[str],
+        order_type: str,
+        include_detail: bool = False,
+    ) -> list[ServiceOrder]:
+        filter = (
+            (ServiceOrder.company_code == MECSA_COMPANY_CODE)
+            & (ServiceOrder._type == order_type)
+            & (ServiceOrder.id.in_(order_ids))
+        )
+
+        options = self.get_load_options(include_detail=include_detail)
+
+        return await self.find_all(
+            filter=filter,
+            options=options,
+            apply_unique=include_detail,
         )
 
     async def find_service_order_by_order_id_and_order_type(
@@ -54,6 +54,27 @@ class ServiceOrderSupplyDetailRepository(BaseRepository[ServiceOrderSupplyDetail
             order_by=ServiceOrderSupplyDetail.item_number.asc(),
         )
 
+    async def find_service_order_supply_stocks_by_service_order_ids_and_storage_code(
+        self,
+        storage_code: str,
+        service_order_ids: list[str],
+        period: int,
+    ) -> list[ServiceOrderSupplyDetail]:
+        filter = (
+            (ServiceOrderSupplyDetail.company_code == MECSA_COMPANY_CODE)
+            & (ServiceOrderSupplyDetail.reference_number.in_(service_order_ids))
+            & (ServiceOrderSupplyDetail.period == period)
+            & (ServiceOrderSupplyDetail.storage_code == storage_code)
+        )
+
+        return await self.find_all(
+            filter=filter,
+            order_by=[
+                ServiceOrderSupplyDetail.reference_number.asc(),
+                ServiceOrderSupplyDetail.item_number.asc(),
+            ],
+        )
+
     async def find_service_orders_supply_stock(
         self,
         storage_code: str = None,
@@ -158,8 +158,9 @@ class WeavingServiceEntryRepository(MovementRepository):
         include_annulled: bool = False,
         limit: int = None,
         offset: int = None,
+        cursor: str = None,
         filter: BinaryExpression = None,
-    ) -> list[Movement]:
+    ) -> tuple[list[Movement], int]:
         joins: list[tuple] = []
         base_filter = (
             (Movement.storage_code == WEAVING_STORAGE_CODE)
@@ -195,7 +196,7 @@ class WeavingServiceEntryRepository(MovementRepository):
 
         options = self.get_load_options(include_detail=include_detail)
 
-        weaving_service_entries = await self.find_movements(
+        return await self.find_movements_page(
             filter=filter,
             options=options,
             joins=joins,
@@ -203,47 +204,6 @@ class WeavingServiceEntryRepository(MovementRepository):
             offset=offset,
             use_outer_joins=True,
             apply_unique=True,
-            order_by=Movement.creation_date.desc(),
+            keyset=self.get_movement_creation_date_keyset(),
+            cursor=cursor,
         )
-
-        return weaving_service_entries
-
-    async def count_weaving_service_entries(
-        self,
-        period: int,
-        entry_number: str = None,
-        supplier_ids: list[str] = None,
-        start_date: date = None,
-        end_date: date = None,
-        service_order_id: str = None,
-        include_annulled: bool = False,
-        filter: BinaryExpression = None,
-    ) -> int:
-        base_filter = (
-            (Movement.storage_code == WEAVING_STORAGE_CODE)
-            & (Movement.movement_type == ENTRY_MOVEMENT_TYPE)
-            & (Movement.movement_code == WEAVING_SERVICE_ENTRY_MOVEMENT_CODE)
-            & (Movement.document_code == ENTRY_DOCUMENT_CODE)
-            & (Movement.period == period)
-        )
-
-        if not include_annulled:
-            base_filter = base_filter & (Movement.status_flag == "P")
-
-        if entry_number:
-            base_filter = base_filter & (
-                Movement.document_number.like(f"%{entry_number}%")
-            )
-
-        if supplier_ids:
-            base_filter = base_filter & Movement.auxiliary_code.in_(supplier_ids)
-
-        if start_date:
-            base_filter = base_filter & (Movement.creation_date >= start_date)
-
-        if end_date:
-            base_filter = base_filter & (Movement.creation_date <= end_date)
-
-        filter = base_filter & filter if filter is not None else base_filter
-
-        return await self.count_movements(filter=filter)
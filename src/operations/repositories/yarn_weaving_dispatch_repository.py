@@ -181,11 +181,12 @@ class YarnWeavingDispatchRepository(MovementRepository):
         end_date: date = None,
         limit: int = None,
         offset: int = None,
+        cursor: str = None,
         include_annulled: bool = False,
         include_detail: bool = False,
         apply_unique: bool = False,
         filter: BinaryExpression = None,
-    ) -> list[Movement]:
+    ) -> tuple[list[Movement], int]:
         base_filter = (
             (Movement.storage_code == YARN_WEAVING_DISPATCH_STORAGE_CODE)
             & (Movement.movement_type == YARN_WEAVING_DISPATCH_MOVEMENT_TYPE)
@@ -217,55 +218,12 @@ class YarnWeavingDispatchRepository(MovementRepository):
             include_detail=include_detail,
         )
 
-        yarn_weaving_dispatches = await self.find_movements(
+        return await self.find_movements_page(
             filter=filter,
             options=options,
             limit=limit,
             offset=offset,
             apply_unique=apply_unique,
-            order_by=Movement.creation_date.desc(),
+            keyset=self.get_movement_creation_date_keyset(),
+            cursor=cursor,
         )
-
-        return yarn_weaving_dispatches
-
-    async def count_yarn_weaving_dispatches(
-        self,
-        period: int,
-        dispatch_number: str = None,
-        supplier_ids: list[str] = None,
-        start_date: date = None,
-        end_date: date = None,
-        limit: int = None,
-        offset: int = None,
-        include_annulled: bool = False,
-        apply_unique: bool = False,
-        filter: BinaryExpression = None,
-    ) -> int:
-        base_filter = (
-            (Movement.storage_code == YARN_WEAVING_DISPATCH_STORAGE_CODE)
-            & (Movement.movement_type == YARN_WEAVING_DISPATCH_MOVEMENT_TYPE)
-            & (Movement.movement_code == YARN_WEAVING_DISPATCH_MOVEMENT_CODE)
-            & (Movement.document_code == YARN_WEAVING_DISPATCH_DOCUMENT_CODE)
-            & (Movement.period == period)
-        )
-
-        if not include_annulled:
-            base_filter = base_filter & (Movement.status_flag == "P")
-
-        if dispatch_number:
-            base_filter = base_filter & (
-                Movement.document_number.like(f"%{dispatch_number}%")
-            )
-
-        if supplier_ids:
-            base_filter = base_filter & Movement.auxiliary_code.in_(supplier_ids)
-
-        if start_date:
-            base_filter = base_filter & (Movement.creation_date >= start_date)
-
-        if end_date:
-            base_filter = base_filter & (Movement.creation_date <= end_date)
-
-        filter = base_filter & filter if filter is not None else base_filter
-
-        return await self.count_movements(filter=filter)
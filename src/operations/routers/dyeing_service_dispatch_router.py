@@ -13,7 +13,11 @@ from src.operations.schemas import (
     DyeingServiceDispatchUpdateSchema,
 )
 from src.operations.services import DyeingServiceDispatchService
-from src.security.audit import AuditService
+from src.security.audit import (
+    METADATA_AUDIT_POLICY,
+    TRUNCATED_AUDIT_POLICY,
+    AuditService,
+)
 
 router = APIRouter()
 
@@ -23,7 +27,7 @@ router = APIRouter()
     response_model=DyeingServiceDispatchesListSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_dyeing_service_dispatches(
     request: Request,
     filter_params: DyeingServiceDispatchFilterParams = Query(
@@ -46,7 +50,7 @@ async def read_dyeing_service_dispatches(
     response_model=DyeingServiceDispatchSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=TRUNCATED_AUDIT_POLICY)
 async def read_dyeing_service_dispatch(
     request: Request,
     dyeing_service_dispatch_number: str,
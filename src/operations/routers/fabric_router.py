@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db, get_promec_db
 from src.core.schemas import ItemStatusUpdateSchema
 from src.core.services import PermissionService
+from src.operations.fabric_catalog import fabric_catalog
 from src.operations.schemas import (
     FabricCreateSchema,
     FabricListSchema,
@@ -13,11 +14,34 @@ from src.operations.schemas import (
     FabricUpdateSchema,
 )
 from src.operations.services import FabricService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
+from src.security.constants import (
+    EDIT_OPERATION_ID,
+    SYSTEM_ACCESS_ID,
+    VISUALIZE_OPERATION_ID,
+)
 
 router = APIRouter()
 
 
+@router.get("/catalog/metrics", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID)
+async def read_fabric_catalog_metrics(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    return fabric_catalog.metrics()
+
+
+@router.post("/catalog/invalidate", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, EDIT_OPERATION_ID)
+@AuditService.audit_action_log()
+async def invalidate_fabric_catalog(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    fabric_catalog.invalidate()
+    return {"message": "Catálogo de tejidos invalidado con éxito."}
+
+
 @router.get("/{fabric_id}", response_model=FabricSchema, status_code=status.HTTP_200_OK)
 @AuditService.audit_action_log()
 async def read_fabric(
@@ -42,7 +66,7 @@ async def read_fabric(
 
 
 @router.get("/", response_model=FabricListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_fabrics(
     request: Request,
     include_inactives: bool = Query(default=False, alias="includeInactives"),
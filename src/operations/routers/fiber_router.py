@@ -15,7 +15,7 @@ from src.operations.schemas import (
     FiberUpdateSchema,
 )
 from src.operations.services import FiberService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter()
 
@@ -53,7 +53,7 @@ async def read_fiber(
     responses={200: {"model": FiberExtendedListSchema}},
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_fibers(
     request: Request,
     include_inactives: bool = Query(default=False, alias="includeInactives"),
@@ -12,7 +12,7 @@ from src.operations.schemas import (
     MecsaColorUpdateSchema,
 )
 from src.operations.services import MecsaColorService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter()
 
@@ -34,7 +34,7 @@ async def read_mecsa_color(
 
 
 @router.get("/", response_model=MecsaColorListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_mecsa_colors(
     request: Request,
     filter_params: MecsaColorFilterParams = Query(MecsaColorFilterParams()),
@@ -9,7 +9,7 @@ from src.operations.schemas import (
     YarnPurchaseOrderSchema,
 )
 from src.operations.services import OrdenCompraService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter(
     tags=["Area Operaciones - Ordenes de Compra"],
@@ -20,7 +20,7 @@ router = APIRouter(
 @router.get(
     "/yarns", response_model=YarnPurchaseOrderListSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def get_ordenes_yarns(
     request: Request,
     filter_params: PurchaseOrderFilterParams = Query(PurchaseOrderFilterParams()),
@@ -13,13 +13,17 @@ from src.operations.schemas import (
     ServiceOrderUpdateSchema,
 )
 from src.operations.services import ServiceOrderService
-from src.security.audit import AuditService
+from src.security.audit import (
+    METADATA_AUDIT_POLICY,
+    TRUNCATED_AUDIT_POLICY,
+    AuditService,
+)
 
 router = APIRouter()
 
 
 @router.get("/", response_model=ServiceOrderListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_service_orders(
     request: Request,
     filter_params: ServiceOrderFilterParams = Query(ServiceOrderFilterParams()),
@@ -44,7 +48,7 @@ async def read_service_orders(
     response_model=ServiceOrderProgressReviewListSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_service_orders_in_progress_review(
     request: Request,
     period: int | None = Query(
@@ -69,7 +73,7 @@ async def read_service_orders_in_progress_review(
 @router.get(
     "/{order_id}", response_model=ServiceOrderSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=TRUNCATED_AUDIT_POLICY)
 async def read_service_order(
     request: Request,
     order_id: str,
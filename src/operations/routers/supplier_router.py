@@ -5,7 +5,7 @@ from src.core.database import get_promec_db
 from src.core.services import PermissionService
 from src.operations.schemas import SupplierFilterParams, SupplierSimpleListSchema
 from src.operations.services import SupplierService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
     description="Obtén una lista de proveedores según el código del servicio. Códigos disponibles: HIL (Servicio de Hilado), 003 (Servicio de Tejeduria), 004 (Servicio de Tintoreria).",
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_suppliers_by_service(
     request: Request,
     service_code: str,
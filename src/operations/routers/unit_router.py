@@ -5,7 +5,7 @@ from src.core.database import get_promec_db
 from src.core.services import PermissionService
 from src.operations.schemas import DerivedUnitListSchema, UnitListSchema, UnitSchema
 from src.operations.services import UnitService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter()
 
@@ -25,7 +25,7 @@ async def read_base_unit(
 
 
 @router.get("/", response_model=UnitListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_base_units(
     request: Request, promec_db: AsyncSession = Depends(get_promec_db)
 ):
@@ -43,7 +43,7 @@ async def read_base_units(
     response_model=DerivedUnitListSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_derived_units_by_base_code(
     request: Request, base_code: str, promec_db: AsyncSession = Depends(get_promec_db)
 ):
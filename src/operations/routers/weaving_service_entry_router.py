@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db, get_promec_db
 from src.core.services import PermissionService
 from src.core.utils import PERU_TIMEZONE, calculate_time
+from src.operations.rate_cache import service_rate_cache
 from src.operations.schemas import (
     WeavingServiceEntriesListSchema,
     WeavingServiceEntryCreateSchema,
@@ -17,15 +18,42 @@ from src.operations.schemas import (
 from src.operations.services import (
     WeavingServiceEntryService,
 )
-from src.security.audit import AuditService
+from src.security.audit import (
+    METADATA_AUDIT_POLICY,
+    TRUNCATED_AUDIT_POLICY,
+    AuditService,
+)
+from src.security.constants import (
+    EDIT_OPERATION_ID,
+    SYSTEM_ACCESS_ID,
+    VISUALIZE_OPERATION_ID,
+)
 
 router = APIRouter()
 
 
+@router.get("/rate-cache/metrics", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID)
+async def read_service_rate_cache_metrics(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    return service_rate_cache.metrics()
+
+
+@router.post("/rate-cache/invalidate", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, EDIT_OPERATION_ID)
+@AuditService.audit_action_log()
+async def invalidate_service_rate_cache(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    service_rate_cache.invalidate()
+    return {"message": "Caché de tarifas de servicio invalidada con éxito."}
+
+
 @router.get(
     "/", response_model=WeavingServiceEntriesListSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_weaving_service_entries(
     request: Request,
     filter_params: WeavingServiceEntryFilterParams = Query(
@@ -49,7 +77,7 @@ async def read_weaving_service_entries(
     response_model=WeavingServiceEntrySchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=TRUNCATED_AUDIT_POLICY)
 async def read_weaving_service_entry(
     request: Request,
     weaving_service_entry_number: str,
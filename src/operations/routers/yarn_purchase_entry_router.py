@@ -16,7 +16,11 @@ from src.operations.schemas import (
 from src.operations.services import (
     YarnPurchaseEntryService,
 )
-from src.security.audit import AuditService
+from src.security.audit import (
+    METADATA_AUDIT_POLICY,
+    TRUNCATED_AUDIT_POLICY,
+    AuditService,
+)
 
 router = APIRouter()
 
@@ -26,7 +30,7 @@ router = APIRouter()
     response_model=YarnPurchaseEntriesSimpleListSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_purchase_entries(
     request: Request,
     filter_params: YarnPurchaseEntryFilterParams = Query(
@@ -46,7 +50,7 @@ async def read_yarn_purchase_entries(
 
 
 @router.get("/search/items-groups-availability", status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_purchase_entries_items_groups_availability(
     request: Request,
     period: int | None = Query(
@@ -73,7 +77,7 @@ async def read_yarn_purchase_entries_items_groups_availability(
     response_model=YarnPurchaseEntrySchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=TRUNCATED_AUDIT_POLICY)
 async def read_yarn_purchase_entry(
     request: Request,
     yarn_purchase_entry_number: str,
@@ -15,7 +15,7 @@ from src.operations.schemas import (
     YarnUpdateSchema,
 )
 from src.operations.services import YarnService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 
 router = APIRouter()
 
@@ -38,7 +38,7 @@ async def read_yarn(
 
 
 @router.get("/", response_model=YarnListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarns(
     request: Request,
     include_inactives: bool = Query(default=False, alias="includeInactives"),
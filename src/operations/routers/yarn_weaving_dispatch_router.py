@@ -14,7 +14,11 @@ from src.operations.schemas import (
     YarnWeavingDispatchUpdateSchema,
 )
 from src.operations.services import YarnWeavingDispatchService
-from src.security.audit import AuditService
+from src.security.audit import (
+    METADATA_AUDIT_POLICY,
+    TRUNCATED_AUDIT_POLICY,
+    AuditService,
+)
 
 router = APIRouter()
 
@@ -22,7 +26,7 @@ router = APIRouter()
 @router.get(
     "/", response_model=YarnWeavingDispatchListSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_weaving_dispatches(
     request: Request,
     filter_params: YarnWeavingDispatchFilterParams = Query(
@@ -47,7 +51,7 @@ async def read_yarn_weaving_dispatches(
     response_model=YarnWeavingDispatchSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=TRUNCATED_AUDIT_POLICY)
 async def read_yarn_weaving_dispatch(
     request: Request,
     yarn_weaving_dispatch_number: str,
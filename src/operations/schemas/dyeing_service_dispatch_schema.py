@@ -5,9 +5,11 @@ from pydantic import (
     AliasChoices,
     Field,
     computed_field,
+    field_validator,
 )
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
 from src.core.schemas import CustomBaseModel
 from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.constants import (
@@ -16,6 +18,7 @@ from src.operations.constants import (
     SUPPLIER_CODE_MAX_LENGTH,
     SUPPLIER_COLOR_ID_MAX_LENGTH,
 )
+from src.operations.repositories.movement_repository import MovementRepository
 
 from .dyeing_service_dispatch_detail_schema import (
     DyeingServiceDispatchDetailCreateSchema,
@@ -53,6 +56,7 @@ class DyeingServiceDispatchSchema(DyeingServiceDispatchBase):
 
 class DyeingServiceDispatchesListSchema(CustomBaseModel):
     dyeing_service_dispatches: list[DyeingServiceDispatchSchema] = []
+    next_cursor: str | None = None
 
     amount: int = Field(default=0, exclude=True)
 
@@ -66,8 +70,17 @@ class DyeingServiceDispatchFilterParams(CustomBaseModel):
         default=calculate_time(tz=PERU_TIMEZONE).date().year, ge=2000
     )
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
     include_annulled: bool | None = Field(default=False)
 
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value, types=keyset_types(MovementRepository.get_movement_keyset())
+            )
+        return value
+
     @computed_field
     def limit(self) -> int:
         return PAGE_SIZE
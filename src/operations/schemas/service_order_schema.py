@@ -1,10 +1,14 @@
 from datetime import date
 
-from pydantic import Field, computed_field, field_serializer
+from pydantic import Field, computed_field, field_serializer, field_validator
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
 from src.core.schemas import CustomBaseModel
 from src.core.utils import PERU_TIMEZONE, calculate_time
+from src.operations.repositories.service_order_repository import (
+    ServiceOrderRepository,
+)
 from src.security.schemas import ParameterValueSchema
 
 from .service_order_detail_schema import (
@@ -47,6 +51,7 @@ class ServiceOrderSchema(ServiceOrderSimpleSchema):
 
 class ServiceOrderListSchema(CustomBaseModel):
     service_orders: list[ServiceOrderSchema] | None = []
+    next_cursor: str | None = None
 
 
 class ServiceOrderOptionsParams(CustomBaseModel):
@@ -61,6 +66,16 @@ class ServiceOrderFilterParams(CustomBaseModel):
     include_annulled: bool | None = Field(default=False)
 
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
+
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value,
+                types=keyset_types(ServiceOrderRepository.get_service_order_keyset()),
+            )
+        return value
 
     @computed_field
     def limit(self) -> int:
@@ -1,9 +1,16 @@
 import math
 from datetime import date
 
-from pydantic import Field, computed_field, field_serializer, model_validator
+from pydantic import (
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
 from src.core.schemas import CustomBaseModel
 from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.constants import (
@@ -13,6 +20,7 @@ from src.operations.constants import (
     SERGF_MAX_LENGTH,
     SUPPLIER_CODE_MAX_LENGTH,
 )
+from src.operations.repositories.movement_repository import MovementRepository
 
 from .promec_schema import PromecStatusSchema
 from .weaving_service_entry_detail_schema import (
@@ -75,6 +83,7 @@ class WeavingServiceEntrySchema(WeavingServiceEntrySimpleSchema):
 
 class WeavingServiceEntriesListSchema(CustomBaseModel):
     weaving_service_entries: list[WeavingServiceEntrySchema] = []
+    next_cursor: str | None = None
 
     amount: int = Field(default=0, exclude=True)
 
@@ -95,6 +104,18 @@ class WeavingServiceEntryFilterParams(CustomBaseModel):
     include_annulled: bool | None = Field(default=False)
     # include_detail: bool | None = Field(default=False)
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
+
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value,
+                types=keyset_types(
+                    MovementRepository.get_movement_creation_date_keyset()
+                ),
+            )
+        return value
 
     @computed_field
     def limit(self) -> int:
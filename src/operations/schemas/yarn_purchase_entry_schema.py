@@ -6,10 +6,12 @@ from pydantic import (
     Field,
     computed_field,
     field_serializer,
+    field_validator,
     model_validator,
 )
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
 from src.core.schemas import CustomBaseModel
 from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.constants import (
@@ -19,6 +21,7 @@ from src.operations.constants import (
     SERGF_MAX_LENGTH,
     SUPPLIER_BATCH_MAX_LENGTH,
 )
+from src.operations.repositories.movement_repository import MovementRepository
 
 from .orden_compra_schema import OrdenCompraWithDetailSchema
 from .promec_schema import PromecStatusSchema
@@ -92,6 +95,18 @@ class YarnPurchaseEntryFilterParams(CustomBaseModel):
     end_date: date | None = Field(default=None)
     include_annulled: bool | None = Field(default=False)
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
+
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value,
+                types=keyset_types(
+                    MovementRepository.get_movement_creation_date_keyset()
+                ),
+            )
+        return value
 
     @computed_field
     # @property
@@ -106,6 +121,7 @@ class YarnPurchaseEntryFilterParams(CustomBaseModel):
 
 class YarnPurchaseEntriesSimpleListSchema(CustomBaseModel):
     yarn_purchase_entries: list[YarnPurchaseEntrySimpleSchema] = []
+    next_cursor: str | None = None
     amount: int = Field(default=0, exclude=True)
 
     @computed_field
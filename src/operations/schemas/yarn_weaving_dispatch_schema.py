@@ -6,10 +6,12 @@ from pydantic import (
     Field,
     computed_field,
     field_serializer,
+    field_validator,
     model_validator,
 )
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
 from src.core.schemas import CustomBaseModel
 from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.constants import (
@@ -18,6 +20,7 @@ from src.operations.constants import (
     SERVICE_ORDER_ID_MAX_LENGTH,
     SUPPLIER_CODE_MAX_LENGTH,
 )
+from src.operations.repositories.movement_repository import MovementRepository
 
 from .promec_schema import PromecStatusSchema
 from .yarn_weaving_dispatch_detail_schema import (
@@ -76,6 +79,18 @@ class YarnWeavingDispatchFilterParams(CustomBaseModel):
     end_date: date | None = Field(default=None)
     include_annulled: bool | None = Field(default=False)
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
+
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value,
+                types=keyset_types(
+                    MovementRepository.get_movement_creation_date_keyset()
+                ),
+            )
+        return value
 
     @computed_field
     def limit(self) -> int:
@@ -102,6 +117,7 @@ class YarnWeavingDispatchSchema(YarnWeavingDispatchSimpleSchema):
 
 class YarnWeavingDispatchListSchema(CustomBaseModel):
     yarn_weaving_dispatches: list[YarnWeavingDispatchSchema] | None = []
+    next_cursor: str | None = None
 
     amount: int = Field(default=0, exclude=True)
 
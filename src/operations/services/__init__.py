@@ -1,4 +1,4 @@
-from .card_operation_service import CardOperationService
+from .card_operation_service import CardOperationService, CardOperationsLookup
 from .color_service import ColorService
 from .dyeing_service_dispatch_service import DyeingServiceDispatchService
 from .especialidad_empresa_service import EspecialidadEmpresaService
@@ -58,4 +58,5 @@ __all__ = [
     "WeavingServiceEntryService",
     "DyeingServiceDispatchService",
     "CardOperationService",
+    "CardOperationsLookup",
 ]
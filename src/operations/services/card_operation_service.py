@@ -1,3 +1,5 @@
+from dataclasses import dataclass, field
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import CustomException
@@ -17,6 +19,30 @@ from src.operations.schemas import (
 from .supplier_service import SupplierService
 
 
+@dataclass
+class CardOperationsLookup:
+    """
+    Cards loaded by `CardOperationService.read_card_operations_by_ids`, by id,
+    and the requested ids that did not pass each check. An id appears in at most
+    one list: missing, then dispatched, then annulled, then other supplier.
+    """
+
+    card_operations: dict[str, CardOperation] = field(default_factory=dict)
+    missing_ids: list[str] = field(default_factory=list)
+    dispatched_ids: list[str] = field(default_factory=list)
+    annulled_ids: list[str] = field(default_factory=list)
+    other_supplier_ids: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not (
+            self.missing_ids
+            or self.dispatched_ids
+            or self.annulled_ids
+            or self.other_supplier_ids
+        )
+
+
 class CardOperationService:
     def __init__(self, promec_db: AsyncSession) -> None:
         self.repository = CardOperationRepository(promec_db=promec_db)
@@ -45,18 +71,53 @@ class CardOperationService:
 
         return Success(CardOperationSchema.model_validate(card_operation_result.value))
 
-    async def reads_card_operation_by_id(
+    async def read_card_operations_by_ids(
         self,
         ids: list[str],
-    ) -> Result[CardOperationListSchema, CustomException]:
-        card_operations = []
-        for id in ids:
-            card_operation_result = await self.read_card_operation(id=id)
+        tint_supplier_id: str | None = None,
+    ) -> Result[CardOperationsLookup, CustomException]:
+        """
+        Loads the cards in `ids` in bulk and classifies the ids that are missing,
+        already dispatched (with an exit number), annulled or, when
+        `tint_supplier_id` is given, assigned to another dyeing supplier.
+        """
+        card_operations = {
+            card_operation.id: card_operation
+            for card_operation in await self.repository.find_card_operations_by_ids(
+                ids=ids
+            )
+        }
 
-            if card_operation_result.is_failure:
-                continue
+        lookup = CardOperationsLookup(card_operations=card_operations)
+        for id in dict.fromkeys(ids):
+            card_operation = card_operations.get(id)
+            if card_operation is None:
+                lookup.missing_ids.append(id)
+            elif card_operation.exit_number:
+                lookup.dispatched_ids.append(id)
+            elif card_operation.status_flag == "A":
+                lookup.annulled_ids.append(id)
+            elif (
+                tint_supplier_id is not None
+                and card_operation.tint_supplier_id
+                and card_operation.tint_supplier_id != tint_supplier_id
+            ):
+                lookup.other_supplier_ids.append(id)
+
+        return Success(lookup)
 
-            card_operations.append(card_operation_result.value)
+    async def reads_card_operation_by_id(
+        self,
+        ids: list[str],
+    ) -> Result[CardOperationListSchema, CustomException]:
+        lookup_result = await self.read_card_operations_by_ids(ids=ids)
+        if lookup_result.is_failure:
+            return lookup_result
+
+        found = lookup_result.value.card_operations
+        card_operations = [
+            CardOperationSchema.model_validate(found[id]) for id in ids if id in found
+        ]
 
         suppliers_tint = {
             card.tint_supplier_id: ""
@@ -5,6 +5,7 @@ from sqlalchemy.orm import joinedload
 
 from src.core.constants import MECSA_COMPANY_CODE
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
 from src.core.result import Result, Success
 from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.constants import (
@@ -17,6 +18,7 @@ from src.operations.constants import (
     WEAVING_STORAGE_CODE,
 )
 from src.operations.failures import (
+    CARD_OPERATION_NOT_FOUND_FAILURE,
     DYEING_SERVICE_DISPATCH_ALREADY_ACCOUNTED_FAILURE,
     DYEING_SERVICE_DISPATCH_ANULLED_FAILURE,
     DYEING_SERVICE_DISPATCH_CARD_OPERATION_ALREADY_ASSOCIATED_FAILURE,
@@ -87,20 +89,22 @@ class DyeingServiceDispatchService(MovementService):
         self,
         filter_params: DyeingServiceDispatchFilterParams = DyeingServiceDispatchFilterParams(),
     ) -> Result[DyeingServiceDispatchesListSchema, CustomException]:
-        dyeing_service_dispatches = (
-            await self.repository.find_dyeing_service_dispatches(
-                **filter_params.model_dump(exclude={"page"})
-            )
-        )
-
-        amount = await self.repository.count_dyeing_service_dispatches(
-            **filter_params.model_dump(exclude={"page", "limit", "offset"})
+        (
+            dyeing_service_dispatches,
+            amount,
+        ) = await self.repository.find_dyeing_service_dispatches(
+            **filter_params.model_dump(exclude={"page"}),
         )
 
         return Success(
             DyeingServiceDispatchesListSchema(
                 dyeing_service_dispatches=dyeing_service_dispatches,
                 amount=amount,
+                next_cursor=next_cursor(
+                    items=dyeing_service_dispatches,
+                    keyset=self.repository.get_movement_keyset(),
+                    limit=filter_params.limit,
+                ),
             )
         )
 
@@ -185,26 +189,34 @@ class DyeingServiceDispatchService(MovementService):
         supplier: SupplierSchema,
         data: list[DyeingServiceDispatchDetailCreateSchema],
     ) -> Result[None, CustomException]:
+        lookup_result = await self.card_operation_service.read_card_operations_by_ids(
+            ids=[detail.card_id for detail in data],
+            tint_supplier_id=supplier.code,
+        )
+        if lookup_result.is_failure:
+            return lookup_result
+
+        lookup = lookup_result.value
+        failures = {
+            **dict.fromkeys(lookup.missing_ids, CARD_OPERATION_NOT_FOUND_FAILURE),
+            **dict.fromkeys(
+                lookup.dispatched_ids,
+                DYEING_SERVICE_DISPATCH_CARD_OPERATION_ALREADY_ASSOCIATED_FAILURE,
+            ),
+            **dict.fromkeys(
+                lookup.annulled_ids,
+                DYEING_SERVICE_DISPATCH_CARD_OPERATION_ANULLED_FAILURE,
+            ),
+            **dict.fromkeys(
+                lookup.other_supplier_ids,
+                DYEING_SERVICE_DISPATCH_CARD_OPERATION_NOT_ASSOCIATED_SUPPLIER_FAILURE,
+            ),
+        }
         for detail in data:
-            validation_result = await self.card_operation_service._read_card_operation(
-                id=detail.card_id,
-            )
-
-            if validation_result.is_failure:
-                return validation_result
-
-            card_operation = validation_result.value
-            if card_operation.exit_number:
-                return DYEING_SERVICE_DISPATCH_CARD_OPERATION_ALREADY_ASSOCIATED_FAILURE
-
-            if card_operation.status_flag == "A":
-                return DYEING_SERVICE_DISPATCH_CARD_OPERATION_ANULLED_FAILURE
-
-            if card_operation.tint_supplier_id:
-                if card_operation.tint_supplier_id != supplier.code:
-                    return DYEING_SERVICE_DISPATCH_CARD_OPERATION_NOT_ASSOCIATED_SUPPLIER_FAILURE
+            if detail.card_id in failures:
+                return failures[detail.card_id]
 
-            detail._card_operation = card_operation
+            detail._card_operation = lookup.card_operations[detail.card_id]
 
         return Success(data)
 
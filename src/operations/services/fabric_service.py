@@ -1,11 +1,14 @@
 from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.database import after_commit
 from src.core.exceptions import CustomException
 from src.core.repositories import SequenceRepository
 from src.core.result import Result, Success
 from src.core.utils import is_active_status, map_active_status
-from src.operations.constants import FABRIC_FAMILY_ID
+from src.operations.constants import FABRIC_FAMILY_ID, RecipeFingerprintItemType
+from src.operations.fabric_catalog import fabric_catalog
 from src.operations.failures import (
     DUPLICATE_YARN_IN_FABRIC_RECIPE_FAILURE,
     FABRIC_ALREADY_EXISTS_FAILURE,
@@ -20,7 +23,11 @@ from src.operations.failures import (
     YARN_NOT_FOUND_IN_FABRIC_RECIPE_FAILURE,
 )
 from src.operations.models import FabricYarn, InventoryItem
-from src.operations.repositories import FabricRecipeRepository, FabricRepository
+from src.operations.repositories import (
+    FabricRecipeRepository,
+    FabricRepository,
+    RecipeFingerprintRepository,
+)
 from src.operations.schemas import (
     FabricCreateSchema,
     FabricListSchema,
@@ -30,6 +37,7 @@ from src.operations.schemas import (
     YarnOptions,
 )
 from src.operations.sequences import product_id_seq
+from src.operations.utils.recipe_fingerprint import fabric_fingerprint
 from src.security.loaders import FabricTypes, JerseyFabric, RibBvdFabric
 from src.security.services import ParameterService
 
@@ -37,14 +45,19 @@ from .mecsa_color_service import MecsaColorService
 from .series_service import BarcodeSeries
 from .yarn_service import YarnService
 
+OLD_RECIPE_KEYS_CHUNK_SIZE = 100
+
 
 class FabricService:
     def __init__(self, db: AsyncSession, promec_db: AsyncSession):
         self.repository = FabricRepository(db=promec_db)
         self.recipe_repository = FabricRecipeRepository(db=promec_db)
+        self.fingerprint_repository = RecipeFingerprintRepository(db=db)
         self.mecsa_color_service = MecsaColorService(promec_db=promec_db)
         self.product_sequence = SequenceRepository(
-            sequence=product_id_seq, db=promec_db
+            sequence=product_id_seq,
+            db=promec_db,
+            block_size=settings.PRODUCT_SEQUENCE_BLOCK_SIZE,
         )
         self.yarn_service = YarnService(db=db, promec_db=promec_db)
         self.parameter_service = ParameterService(db=db)
@@ -245,43 +258,35 @@ class FabricService:
             current_recipe=new_recipe, fabrics=[current_fabric]
         )
 
-    async def _is_fabric_unique(
+    async def _get_fabric_fingerprint(
         self,
-        fabric_type_id_: str,
-        width_: str,
-        color_id: str,
-        structure_pattern: str,
-        current_fabric: InventoryItem | None = None,
-        current_recipe: list[FabricRecipeItemSimpleSchema] | None = None,
-        **kwargs,
-    ) -> bool:
-        filter = (
-            (InventoryItem.field2 == width_)
-            & (InventoryItem.field4 == fabric_type_id_)
-            & (InventoryItem.field3 == color_id)
-            & (InventoryItem.field5 == structure_pattern)
-        )
-        _fabrics = await self.repository.find_fabrics(
-            filter=filter, include_simple_recipe=True
-        )
-        fabrics = (
-            _fabrics
-            if current_fabric is None
-            else [fabric for fabric in _fabrics if fabric != current_fabric]
+        fabric: InventoryItem,
+        recipe: list[FabricRecipeItemSimpleSchema] | None = None,
+    ) -> str:
+        if recipe is None:
+            if not fabric.fabric_recipe:
+                fabric.fabric_recipe = await self.recipe_repository.find_all(
+                    filter=FabricYarn.fabric_id == fabric.id
+                )
+            recipe = fabric.fabric_recipe
+
+        return fabric_fingerprint(
+            width=fabric.field2,
+            fabric_type_id=fabric.field4,
+            color_id=fabric.field3,
+            structure_pattern=fabric.field5,
+            recipe=recipe,
         )
-        if len(fabrics) == 0:  # fabric has unique attributes
-            return True
 
-        if current_recipe is None:
-            current_recipe = [
-                FabricRecipeItemSimpleSchema.model_validate(item)
-                for item in current_fabric.recipe
-            ]
-
-        return self._is_fabric_recipe_unique(
-            current_recipe=current_recipe, fabrics=fabrics
+    async def _is_fabric_unique(
+        self, fingerprint: str, current_fabric_id: str | None = None
+    ) -> bool:
+        fabric_ids = await self.fingerprint_repository.find_item_ids_by_fingerprint(
+            item_type=RecipeFingerprintItemType.FABRIC, fingerprint=fingerprint
         )
 
+        return all(fabric_id == current_fabric_id for fabric_id in fabric_ids)
+
     async def _read_fabric(
         self,
         fabric_id: str,
@@ -308,6 +313,31 @@ class FabricService:
 
         return Success(fabric)
 
+    async def _load_catalog_fabrics(
+        self, fabric_ids: list[str] | None = None
+    ) -> list[FabricSchema]:
+        """
+        Loads the fabrics in `fabric_ids`, or every fabric when it is `None`,
+        with all their related data for the fabric catalog.
+        """
+        fabrics = await self.repository.find_fabrics(
+            filter=InventoryItem.id.in_(fabric_ids) if fabric_ids is not None else None,
+            include_color=True,
+            include_simple_recipe=True,
+        )
+
+        await self._load_related_data_for_fabrics(
+            fabrics=fabrics,
+            include_fabric_type=True,
+            include_recipe=True,
+            include_yarn_instance_to_recipe=True,
+        )
+
+        return [FabricSchema.model_validate(fabric) for fabric in fabrics]
+
+    async def warm_up_catalog(self) -> int:
+        return await fabric_catalog.warm_up(loader=self._load_catalog_fabrics)
+
     async def read_fabric(
         self,
         fabric_id: str,
@@ -316,18 +346,19 @@ class FabricService:
         include_recipe: bool = False,
         include_yarn_instance_to_recipe: bool = False,
     ) -> Result[FabricSchema, CustomException]:
-        fabric_result = await self._read_fabric(
+        fabric = await fabric_catalog.get_by_id(
             fabric_id=fabric_id,
-            include_color=include_color,
+            loader=self._load_catalog_fabrics,
             include_fabric_type=include_fabric_type,
+            include_color=include_color,
             include_recipe=include_recipe,
             include_yarn_instance_to_recipe=include_yarn_instance_to_recipe,
         )
 
-        if fabric_result.is_failure:
-            return fabric_result
+        if fabric is None:
+            return FABRIC_NOT_FOUND_FAILURE
 
-        return Success(FabricSchema.model_validate(fabric_result.value))
+        return Success(fabric)
 
     async def read_fabrics(
         self,
@@ -377,11 +408,14 @@ class FabricService:
         if recipe_validation.is_failure:
             return recipe_validation
 
-        if not (
-            await self._is_fabric_unique(
-                **form.model_dump(), current_recipe=form.recipe
-            )
-        ):
+        fingerprint = fabric_fingerprint(
+            width=form.width_,
+            fabric_type_id=form.fabric_type_id_,
+            color_id=form.color_id,
+            structure_pattern=form.structure_pattern,
+            recipe=form.recipe,
+        )
+        if not (await self._is_fabric_unique(fingerprint=fingerprint)):
             return FABRIC_ALREADY_EXISTS_FAILURE
 
         fabric_id = str(await self.product_sequence.next_value())
@@ -408,6 +442,14 @@ class FabricService:
         await self.recipe_repository.save_all(
             FabricYarn(fabric_id=fabric_id, **item.model_dump()) for item in form.recipe
         )
+        stored = await self.fingerprint_repository.save_fingerprint(
+            item_type=RecipeFingerprintItemType.FABRIC,
+            item_id=fabric_id,
+            fingerprint=fingerprint,
+        )
+        if stored is None:
+            return FABRIC_ALREADY_EXISTS_FAILURE
+        after_commit(self.repository.db, lambda: fabric_catalog.invalidate(fabric_id))
 
         return Success(None)
 
@@ -451,6 +493,7 @@ class FabricService:
             if recipe_validation_result.is_failure:
                 return recipe_validation_result
 
+        fingerprint = None
         if any(
             field in fabric_data
             for field in (
@@ -460,19 +503,27 @@ class FabricService:
                 "structure_pattern",
                 "recipe",
             )
-        ) and not (
-            await self._is_fabric_unique(
-                fabric_type_id_=fabric.field4,
-                width_=fabric.field2,
-                color_id=fabric.field3,
-                structure_pattern=fabric.field5,
-                current_fabric=fabric,
-                current_recipe=form.recipe,
-            )
         ):
-            return FABRIC_ALREADY_EXISTS_FAILURE
+            fingerprint = await self._get_fabric_fingerprint(
+                fabric=fabric, recipe=form.recipe
+            )
+            if not (
+                await self._is_fabric_unique(
+                    fingerprint=fingerprint, current_fabric_id=fabric.id
+                )
+            ):
+                return FABRIC_ALREADY_EXISTS_FAILURE
 
         await self.repository.save(fabric)
+        if fingerprint is not None:
+            stored = await self.fingerprint_repository.save_fingerprint(
+                item_type=RecipeFingerprintItemType.FABRIC,
+                item_id=fabric.id,
+                fingerprint=fingerprint,
+            )
+            if stored is None:
+                return FABRIC_ALREADY_EXISTS_FAILURE
+        after_commit(self.repository.db, lambda: fabric_catalog.invalidate(fabric.id))
         if form.recipe is None:
             return Success(None)
 
@@ -512,6 +563,7 @@ class FabricService:
         fabric: InventoryItem = fabric_result.value
         fabric.is_active = map_active_status(is_active)
         await self.repository.save(fabric)
+        after_commit(self.repository.db, lambda: fabric_catalog.invalidate(fabric.id))
 
         return Success(None)
 
@@ -528,22 +580,25 @@ class FabricService:
         if not fabric_ids:
             return Success(FabricListSchema(fabrics=[]))
 
-        fabrics = await self.repository.find_fabrics(
-            filter=InventoryItem.id.in_(fabric_ids),
-            include_inactives=include_inactives,
-            include_color=include_color,
-            include_simple_recipe=include_recipe,
-            exclude_legacy=exclude_legacy,
-        )
-
-        await self._load_related_data_for_fabrics(
-            fabrics=fabrics,
+        fabrics = await fabric_catalog.get_by_ids(
+            fabric_ids=fabric_ids,
+            loader=self._load_catalog_fabrics,
             include_fabric_type=include_fabric_type,
+            include_color=include_color,
             include_recipe=include_recipe,
             include_yarn_instance_to_recipe=include_yarn_instance_to_recipe,
         )
 
-        return Success(FabricListSchema(fabrics=fabrics))
+        return Success(
+            FabricListSchema(
+                fabrics=[
+                    fabric
+                    for fabric in fabrics.values()
+                    if (include_inactives or fabric.is_active)
+                    and not (exclude_legacy and not fabric.id.isdigit())
+                ]
+            )
+        )
 
     async def map_fabrics_by_ids(
         self,
@@ -583,17 +638,26 @@ class FabricService:
         if not ids:
             return None
 
-        items = await self.recipe_repository.find_all(
-            filter=or_(
-                and_(FabricYarn.fabric_id == fabric_id, FabricYarn.color_id == color_id)
-                for fabric_id, color_id in ids
-            )
-        )
+        # The keys are sent in chunks so that loading the whole catalog does not
+        # build a single filter over every legacy fabric.
+        ids = list(ids)
         recipe_mapping = {id: [] for id in ids}
-        for item in items:
-            key = (item.fabric_id, item.color_id)
-            if key in recipe_mapping:
-                recipe_mapping[key].append(item)
+        for start in range(0, len(ids), OLD_RECIPE_KEYS_CHUNK_SIZE):
+            items = await self.recipe_repository.find_all(
+                filter=or_(
+                    and_(
+                        FabricYarn.fabric_id == fabric_id,
+                        FabricYarn.color_id == color_id,
+                    )
+                    for fabric_id, color_id in ids[
+                        start : start + OLD_RECIPE_KEYS_CHUNK_SIZE
+                    ]
+                )
+            )
+            for item in items:
+                key = (item.fabric_id, item.color_id)
+                if key in recipe_mapping:
+                    recipe_mapping[key].append(item)
 
         for fabric in fabrics_:
             key = (fabric.subfamily_id + fabric.field1, fabric.field3)
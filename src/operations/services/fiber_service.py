@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.exceptions import CustomException
 from src.core.repositories import SequenceRepository
 from src.core.result import Result, Success
@@ -28,7 +29,9 @@ class FiberService:
         self.repository = FiberRepository(db=db)
         self.mecsa_color_service = MecsaColorService(promec_db=promec_db)
         self.product_sequence = SequenceRepository(
-            sequence=product_id_seq, db=promec_db
+            sequence=product_id_seq,
+            db=promec_db,
+            block_size=settings.PRODUCT_SEQUENCE_BLOCK_SIZE,
         )
         self.fiber_categories = FiberCategories(db=db)
         self.fiber_denominations = FiberDenominations(db=db)
@@ -1,9 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import after_commit
 from src.core.exceptions import CustomException
 from src.core.repositories import SequenceRepository
 from src.core.result import Result, Success
 from src.core.utils import map_active_status
+from src.operations.fabric_catalog import fabric_catalog
 from src.operations.failures import (
     MECSA_COLOR_NAME_ALREADY_EXISTS_FAILURE,
     MECSA_COLOR_NOT_FOUND_FAILURE,
@@ -129,6 +131,7 @@ class MecsaColorService:
             setattr(color, key, value)
 
         await self.repository.save(color)
+        after_commit(self.repository.db, fabric_catalog.invalidate)
 
         return Success(color)
 
@@ -142,5 +145,6 @@ class MecsaColorService:
         color = result.value
         color.is_active = map_active_status(is_active)
         await self.repository.save(color)
+        after_commit(self.repository.db, fabric_catalog.invalidate)
 
         return Success(None)
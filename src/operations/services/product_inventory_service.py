@@ -1,16 +1,23 @@
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.constants import MECSA_COMPANY_CODE
 from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.operations.failures import PRODUCT_INVENTORY_NOT_FOUND_FAILURE
 from src.operations.models import ProductInventory
 from src.operations.repositories import ProductInventoryRepository
+from src.security.audit import AuditService
+
+logger = logging.getLogger(__name__)
 
 
 class ProductInventoryService:
     def __init__(self, promec_db: AsyncSession) -> None:
         self.promec_db = promec_db
         self.repository = ProductInventoryRepository(promec_db=promec_db)
+        self.stock_deltas: dict[tuple[str, str, int], float] = {}
 
     async def _read_product_inventory(
         self,
@@ -46,41 +53,116 @@ class ProductInventoryService:
 
         return Success(products_inventory)
 
-    async def rollback_currents_stock(
+    async def _add_current_stock(
         self,
+        product_code1: str,
         storage_code: str,
         period: int,
-        product_code1: str,
-        quantity: int,
+        quantity: float,
+        enable_create: bool = False,
     ) -> Result[None, CustomException]:
-        result = await self._read_product_inventory(
-            product_code1=product_code1, storage_code=storage_code, period=period
+        product_inventory = await self.repository.add_current_stock(
+            product_code1=product_code1,
+            storage_code=storage_code,
+            period=period,
+            quantity=quantity,
         )
 
-        if result.is_failure:
-            return result
+        if product_inventory is None:
+            if not enable_create:
+                return PRODUCT_INVENTORY_NOT_FOUND_FAILURE
+
+            return await self.create_product_inventory(
+                ProductInventory(
+                    company_code=MECSA_COMPANY_CODE,
+                    storage_code=storage_code,
+                    product_code1=product_code1,
+                    period=period,
+                    current_stock=quantity,
+                )
+            )
 
-        product_inventory: ProductInventory = result.value
+        values_after = await AuditService.get_after_values(product_inventory)
+        AuditService.audit_data_log(
+            instance=product_inventory,
+            values_before={
+                **values_after,
+                ProductInventory.current_stock.expression.name: (
+                    product_inventory.current_stock - quantity
+                ),
+            },
+            values_after=values_after,
+        )
 
-        product_inventory.current_stock -= quantity
+        return Success(None)
 
-        await self.repository.save(product_inventory, flush=True)
+    def add_stock_delta(
+        self, product_code1: str, storage_code: str, period: int, quantity: float
+    ) -> None:
+        """
+        Accumulates a stock change to be applied by `flush_stock_deltas`, merged
+        with the pending changes of the same product, storage and period.
+        """
+        key = (product_code1, storage_code, period)
+        self.stock_deltas[key] = self.stock_deltas.get(key, 0) + quantity
+
+    async def flush_stock_deltas(
+        self, enable_create: bool = False, skip_missing: bool = False
+    ) -> Result[None, CustomException]:
+        """
+        Applies the accumulated stock changes with one atomic UPDATE per product,
+        storage and period. Missing inventory rows are a failure unless
+        `enable_create` is set, which only entries into a storage should do, or
+        `skip_missing` is set, which leaves them unchanged with a warning.
+
+        Rows are updated in key order, so concurrent movements lock them in the
+        same order.
+        """
+        stock_deltas, self.stock_deltas = self.stock_deltas, {}
+
+        for (product_code1, storage_code, period), quantity in sorted(
+            stock_deltas.items()
+        ):
+            result = await self._add_current_stock(
+                product_code1=product_code1,
+                storage_code=storage_code,
+                period=period,
+                quantity=quantity,
+                enable_create=enable_create,
+            )
+            if result.is_failure:
+                if not skip_missing:
+                    return result
+
+                logger.warning(
+                    "Stock of %s not updated: no inventory row in storage %s for %s",
+                    product_code1,
+                    storage_code,
+                    period,
+                )
 
         return Success(None)
 
+    async def rollback_currents_stock(
+        self,
+        storage_code: str,
+        period: int,
+        product_code1: str,
+        quantity: int,
+    ) -> Result[None, CustomException]:
+        return await self._add_current_stock(
+            product_code1=product_code1,
+            storage_code=storage_code,
+            period=period,
+            quantity=-quantity,
+        )
+
     async def update_current_stock(
         self, product_code1: str, storage_code: str, period: int, new_stock: int
     ) -> Result[None, CustomException]:
-        result = await self._read_product_inventory(
-            product_code1=product_code1, storage_code=storage_code, period=period
+        return await self._add_current_stock(
+            product_code1=product_code1,
+            storage_code=storage_code,
+            period=period,
+            quantity=new_stock,
         )
-
-        if result.is_failure:
-            return result
-
-        product_inventory: ProductInventory = result.value
-        product_inventory.current_stock += new_stock
-
-        await self.repository.save(product_inventory)
-
-        return Success(None)
@@ -2,9 +2,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import transactional
 from src.core.exceptions import CustomException
+from src.core.rendering import pdf_renderer
 from src.core.result import Result, Success
 from src.core.services import EmailService
+from src.core.utils import PERU_TIMEZONE, calculate_time
+from src.operations.failures import OrdenServicioTejeduriaDetalleFailures
 from src.operations.models import (
+    Color,
     OrdenServicioTejeduria,
     ProgramacionTintoreria,
     Proveedor,
@@ -22,9 +26,6 @@ from src.operations.schemas import (
 from src.operations.services import OrdenServicioTintoreriaService
 from src.operations.utils.programacion_tintoreria import generate_pdf
 
-from .orden_servicio_tejeduria_detalle_service import (
-    OrdenServicioTejeduriaDetalleService,
-)
 from .orden_servicio_tejeduria_service import OrdenServicioTejeduriaService
 from .proveedor_service import ProveedorService
 
@@ -35,9 +36,8 @@ class ProgramacionTintoreriaService:
         self.color_repository = ColorRepository(db)
         self.proveedor_service = ProveedorService(db)
         self.orden_service = OrdenServicioTintoreriaService(db)
-        self.email_service = EmailService()
+        self.email_service = EmailService(db)
         self.orden_tejeduria_service = OrdenServicioTejeduriaService(db)
-        self.suborden_tejeduria_service = OrdenServicioTejeduriaDetalleService(db)
         self.suborden_tejeduria_repository = OrdenServicioTejeduriaDetalleRepository(db)
 
     async def retrieve_parameters(
@@ -110,7 +110,10 @@ class ProgramacionTintoreriaService:
             )
             for partida in programacion.partidas
         ]
-        await self._update_subordenes_stock(programacion.partidas)
+        stock_result = await self._update_subordenes_stock(programacion.partidas)
+        if stock_result.is_failure:
+            return stock_result
+
         creation_result = await self.orden_service.create_ordenes_with_detalle(
             ordenes=ordenes
         )
@@ -121,22 +124,25 @@ class ProgramacionTintoreriaService:
         return Success(None)
 
     async def _get_subordenes_tejeduria(self, partidas):
-        mapping = dict()
         suborden_ids = {
             (suborden.orden_servicio_tejeduria_id, suborden.crudo_id)
             for partida in partidas
             for suborden in partida.detail
         }
 
-        for suborden_id in suborden_ids:
-            mapping[suborden_id] = (
-                await self.suborden_tejeduria_service.read_suborden(*suborden_id)
-            ).value
-
-        return mapping
+        return await self.suborden_tejeduria_repository.find_subordenes_by_ids(
+            suborden_ids
+        )
 
-    async def _update_subordenes_stock(self, partidas):
+    async def _update_subordenes_stock(self, partidas) -> Result[None, CustomException]:
         subordenes = await self._get_subordenes_tejeduria(partidas)
+        if any(
+            (suborden.orden_servicio_tejeduria_id, suborden.crudo_id) not in subordenes
+            for partida in partidas
+            for suborden in partida.detail
+        ):
+            return OrdenServicioTejeduriaDetalleFailures.SUBORDER_NOT_FOUND_FAILURE
+
         for partida in partidas:
             for suborden in partida.detail:
                 suborden_id = (suborden.orden_servicio_tejeduria_id, suborden.crudo_id)
@@ -147,14 +153,17 @@ class ProgramacionTintoreriaService:
                     suborden.cantidad_kg
                 )
 
-        await self.suborden_tejeduria_repository.save_all(subordenes.values())
+        # The subórdenes share the changed columns, so the flush sends their
+        # updates as a single batch.
+        await self.suborden_tejeduria_repository.save_all(list(subordenes.values()))
+        return Success(None)
 
     async def _retrieve_colores(self, color_ids: set):
-        mapping = dict()
-        for color_id in color_ids:
-            mapping[color_id] = await self.color_repository.find_by_id(color_id)
+        colores = await self.color_repository.find_all(
+            filter=Color.color_id.in_(color_ids)
+        )
 
-        return mapping
+        return {color.color_id: color for color in colores}
 
     async def _generate_table(self, partidas, colores, headers):
         table = [
@@ -196,7 +205,16 @@ class ProgramacionTintoreriaService:
             ],
         )
 
-        pdf = generate_pdf(tejeduria, tintoreria, comment, partidas_size, values)
+        # The date and week printed in the PDF are part of the render cache key.
+        pdf = await pdf_renderer.render(
+            generate_pdf,
+            tejeduria,
+            tintoreria,
+            comment,
+            partidas_size,
+            values,
+            calculate_time(tz=PERU_TIMEZONE).date(),
+        )
 
         await self.email_service.send_programacion_tintoreria_email(
             pdf,
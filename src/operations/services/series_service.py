@@ -1,10 +1,15 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.database import get_promec_db
 from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.operations.failures import SERIES_NOT_FOUND_FAILURE
 from src.operations.models import Series
 from src.operations.repositories import SeriesRepository
+from src.security.audit import AuditService
 
 
 class SeriesService:
@@ -26,31 +31,71 @@ class SeriesService:
     async def next_number(
         self, document_code: str, service_number: int
     ) -> Result[int, CustomException]:
-        result = await self.read_series(
-            document_code=document_code, service_number=service_number
+        result = await self.next_numbers(
+            document_code=document_code, service_number=service_number, count=1
         )
 
         if result.is_failure:
             return result
 
-        series: Series = result.value
-        number = series.number
-        series.number += 1
-        await self.repository.save(series, flush=True)
+        return Success(result.value[0])
+
+    async def next_numbers(
+        self, document_code: str, service_number: int, count: int
+    ) -> Result[list[int], CustomException]:
+        series = await self.repository.reserve_numbers(
+            document_code=document_code, service_number=service_number, count=count
+        )
+
+        if series is None:
+            return SERIES_NOT_FOUND_FAILURE()
+
+        number = series.number - count
+        values_after = await AuditService.get_after_values(series)
+        AuditService.audit_data_log(
+            instance=series,
+            values_before={**values_after, Series.number.expression.name: number},
+            values_after=values_after,
+        )
+
+        return Success(list(range(number, number + count)))
+
+
+class SeriesPool:
+    """
+    Per-process block of numbers reserved from a high-volume series.
 
-        return Success(number)
+    Blocks are reserved in their own committed transaction, so a rollback of the
+    request that triggered the refill never returns numbers already handed out.
+    Numbers left in the pool when the process ends are lost, leaving gaps.
+    """
+
+    _pools: dict[tuple[str, int], "SeriesPool"] = {}
+
+    def __init__(self) -> None:
+        self.numbers: list[int] = []
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    def get(cls, document_code: str, service_number: int) -> "SeriesPool":
+        key = (document_code, service_number)
+        if key not in cls._pools:
+            cls._pools[key] = cls()
+        return cls._pools[key]
 
 
 class SeriesHelper(SeriesService):
     name: str = ""
     document_code: str
     service_number: int
+    block_size: int = 0
 
     def __init_subclass__(
         cls,
         name: str = "",
         document_code: str = None,
         service_number: int = None,
+        block_size: int = 0,
         **kwargs,
     ):
         if document_code is None:
@@ -60,23 +105,49 @@ class SeriesHelper(SeriesService):
         cls.name = name
         cls.document_code = document_code
         cls.service_number = service_number
+        cls.block_size = block_size
         super().__init_subclass__(**kwargs)
 
     def __init__(self, promec_db: AsyncSession):
         super().__init__(promec_db=promec_db)
 
     async def next_number(self) -> int:
+        if self.block_size > 1:
+            return await self._next_pooled_number()
+
         result = await super().next_number(
             document_code=self.document_code, service_number=self.service_number
         )
         if result.is_success:
             return result.value
 
-        raise SERIES_NOT_FOUND_FAILURE(series_name=self.name)
+        raise SERIES_NOT_FOUND_FAILURE(series_name=self.name).error
+
+    async def _next_pooled_number(self) -> int:
+        pool = SeriesPool.get(self.document_code, self.service_number)
+        async with pool.lock:
+            if not pool.numbers:
+                async for promec_db in get_promec_db():
+                    result = await SeriesService(promec_db=promec_db).next_numbers(
+                        document_code=self.document_code,
+                        service_number=self.service_number,
+                        count=self.block_size,
+                    )
+
+                if result.is_failure:
+                    raise SERIES_NOT_FOUND_FAILURE(series_name=self.name).error
+
+                pool.numbers.extend(result.value)
+
+            return pool.numbers.pop(0)
 
 
 class BarcodeSeries(
-    SeriesHelper, name="Código de Barras", document_code="BAR", service_number=1
+    SeriesHelper,
+    name="Código de Barras",
+    document_code="BAR",
+    service_number=1,
+    block_size=settings.BARCODE_SERIES_BLOCK_SIZE,
 ):
     pass
 
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MECSA_COMPANY_CODE
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
 from src.core.repository import BaseRepository
 from src.core.result import Result, Success
 from src.core.utils import PERU_TIMEZONE, calculate_time
@@ -72,7 +73,6 @@ class ServiceOrderService:
         service_orders = await self.repository.find_service_orders_by_order_type(
             order_type=order_type,
             **filter_params.model_dump(exclude={"page"}),
-            order_by=ServiceOrder.issue_date.desc(),
         )
 
         if include_status:
@@ -97,7 +97,16 @@ class ServiceOrderService:
                 #         else:
                 #             detail.status = status.value
 
-        return Success(ServiceOrderListSchema(service_orders=service_orders))
+        return Success(
+            ServiceOrderListSchema(
+                service_orders=service_orders,
+                next_cursor=next_cursor(
+                    items=service_orders,
+                    keyset=self.repository.get_service_order_keyset(),
+                    limit=filter_params.limit,
+                ),
+            )
+        )
 
     async def _read_service_order(
         self,
@@ -159,6 +168,28 @@ class ServiceOrderService:
 
         return Success(ServiceOrderSchema.model_validate(service_order))
 
+    async def map_service_orders_by_ids(
+        self,
+        order_ids: list[str],
+        order_type: str,
+        include_detail: bool = False,
+    ) -> Result[dict[str, ServiceOrderSchema], CustomException]:
+        if not order_ids:
+            return Success({})
+
+        service_orders = await self.repository.find_service_orders_by_ids(
+            order_ids=list(set(order_ids)),
+            order_type=order_type,
+            include_detail=include_detail,
+        )
+
+        return Success(
+            {
+                service_order.id: ServiceOrderSchema.model_validate(service_order)
+                for service_order in service_orders
+            }
+        )
+
     async def _validate_service_order_data(
         self,
         data: ServiceOrderCreateSchema,
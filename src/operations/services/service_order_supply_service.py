@@ -12,6 +12,7 @@ class ServiceOrderSupplyDetailService:
     def __init__(self, promec_db: AsyncSession) -> None:
         self.promec_db = promec_db
         self.repository = ServiceOrderSupplyDetailRepository(promec_db=promec_db)
+        self.pending_supply_stock: dict[int, ServiceOrderSupplyDetail] = {}
 
     async def _read_service_order_supply_stock(
         self,
@@ -48,6 +49,28 @@ class ServiceOrderSupplyDetailService:
 
         return Success(service_orders_stock)
 
+    async def _map_service_orders_supply_stock(
+        self,
+        storage_code: str,
+        period: int,
+        service_order_ids: list[str],
+    ) -> Result[dict[str, list[ServiceOrderSupplyDetail]], CustomException]:
+        service_orders_stock: dict[str, list[ServiceOrderSupplyDetail]] = {}
+        if not service_order_ids:
+            return Success(service_orders_stock)
+
+        supply_stocks = await self.repository.find_service_order_supply_stocks_by_service_order_ids_and_storage_code(
+            storage_code=storage_code,
+            period=period,
+            service_order_ids=list(set(service_order_ids)),
+        )
+        for supply_stock in supply_stocks:
+            service_orders_stock.setdefault(supply_stock.reference_number, []).append(
+                supply_stock
+            )
+
+        return Success(service_orders_stock)
+
     async def read_service_orders_supply_stock(
         self,
         period: int,
@@ -203,12 +226,30 @@ class ServiceOrderSupplyDetailService:
 
         return Success(None)
 
-    async def _update_remaining_supply_stock_by_yarn(
-        self,
+    @staticmethod
+    def _sort_by_item_number(
+        service_orders_stock: list[ServiceOrderSupplyDetail],
+    ) -> list[ServiceOrderSupplyDetail]:
+        return sorted(
+            service_orders_stock,
+            key=lambda x: (
+                x.item_number is None,
+                x.item_number if x.item_number is not None else float("inf"),
+            ),
+        )
+
+    @staticmethod
+    def _allocate_supply_stock_by_yarn(
         service_orders_stock: list[ServiceOrderSupplyDetail],
         yarn_id: str,
-        quantity: int,
-    ) -> Result[None, CustomException]:
+        quantity: float,
+    ) -> list[ServiceOrderSupplyDetail]:
+        """
+        Consumes `quantity` of the yarn from the supply lines in FIFO order and
+        returns the lines that changed. The quantity left once every line is
+        exhausted is received on the last line, when it belongs to the yarn.
+        """
+        changed = []
         for service_order_supply_stock in service_orders_stock:
             if service_order_supply_stock.product_code1 == yarn_id:
                 if service_order_supply_stock.current_stock <= 0:
@@ -225,7 +266,7 @@ class ServiceOrderSupplyDetailService:
                     service_order_supply_stock.current_stock -= quantity
                     service_order_supply_stock.quantity_received += quantity
                     quantity = 0
-                await self.repository.save(service_order_supply_stock, flush=True)
+                changed.append(service_order_supply_stock)
 
         if quantity > 0:
             if service_orders_stock:
@@ -234,15 +275,22 @@ class ServiceOrderSupplyDetailService:
                         service_orders_stock[-1].current_stock - quantity, 0
                     )
                     service_orders_stock[-1].quantity_received += quantity
-                    await self.repository.save(service_orders_stock[-1], flush=True)
-        return Success(None)
+                    changed.append(service_orders_stock[-1])
 
-    async def _rollback_remaining_supply_stock_by_yarn(
-        self,
+        return changed
+
+    @staticmethod
+    def _release_supply_stock_by_yarn(
         service_orders_stock: list[ServiceOrderSupplyDetail],
         yarn_id: str,
-        quantity: int,
-    ) -> Result[None, CustomException]:
+        quantity: float,
+    ) -> list[ServiceOrderSupplyDetail]:
+        """
+        Gives `quantity` of the yarn back to the supply lines in FIFO order, up to
+        their provided quantity, and returns the lines that changed. The quantity
+        left is given back to the last line.
+        """
+        changed = []
         for service_order_supply_stock in service_orders_stock:
             if service_order_supply_stock.product_code1 == yarn_id:
                 if quantity <= 0:
@@ -274,15 +322,36 @@ class ServiceOrderSupplyDetailService:
                         - service_order_supply_stock.current_stock
                     )
 
-                await self.repository.save(service_order_supply_stock, flush=True)
+                changed.append(service_order_supply_stock)
 
         if quantity > 0:
             if service_orders_stock:
                 service_orders_stock[-1].current_stock += quantity
                 service_orders_stock[-1].quantity_received -= quantity
-                await self.repository.save(service_orders_stock[-1], flush=True)
+                changed.append(service_orders_stock[-1])
 
-        return Success(service_orders_stock)
+        return changed
+
+    def _add_pending_supply_stock(
+        self, service_orders_stock: list[ServiceOrderSupplyDetail]
+    ) -> None:
+        for service_order_supply_stock in service_orders_stock:
+            self.pending_supply_stock[id(service_order_supply_stock)] = (
+                service_order_supply_stock
+            )
+
+    async def flush_supply_stock(self) -> Result[None, CustomException]:
+        """
+        Persists every supply line changed by the fabric recipe allocations since
+        the last call, in a single flush.
+        """
+        service_orders_stock = list(self.pending_supply_stock.values())
+        self.pending_supply_stock = {}
+
+        if service_orders_stock:
+            await self.repository.save_all(service_orders_stock, flush=True)
+
+        return Success(None)
 
     async def rollback_current_stock_by_fabric_recipe(
         self,
@@ -290,27 +359,16 @@ class ServiceOrderSupplyDetailService:
         quantity: int,
         service_orders_stock: list[ServiceOrderSupplyDetail],
     ) -> Result[None, CustomException]:
-        service_orders_stock = sorted(
-            service_orders_stock,
-            key=lambda x: (
-                x.item_number is None,
-                x.item_number if x.item_number is not None else float("inf"),
-            ),
-        )
+        service_orders_stock = self._sort_by_item_number(service_orders_stock)
         for yarn in fabric.recipe:
-            quantity_yarn = (yarn.proportion / 100.0) * quantity
-
-            rollback_result = await self._rollback_remaining_supply_stock_by_yarn(
-                service_orders_stock=service_orders_stock,
-                yarn_id=yarn.yarn_id,
-                quantity=quantity_yarn,
+            self._add_pending_supply_stock(
+                self._release_supply_stock_by_yarn(
+                    service_orders_stock=service_orders_stock,
+                    yarn_id=yarn.yarn_id,
+                    quantity=(yarn.proportion / 100.0) * quantity,
+                )
             )
 
-            if rollback_result.is_failure:
-                print(rollback_result.error)
-
-            service_orders_stock = rollback_result.value
-
         return Success(service_orders_stock)
 
     async def update_current_stock_by_fabric_recipe(
@@ -319,25 +377,16 @@ class ServiceOrderSupplyDetailService:
         quantity: int,
         service_orders_stock: list[ServiceOrderSupplyDetail],
     ) -> Result[None, CustomException]:
-        service_orders_stock = sorted(
-            service_orders_stock,
-            key=lambda x: (
-                x.item_number is None,
-                x.item_number if x.item_number is not None else float("inf"),
-            ),
-        )
+        service_orders_stock = self._sort_by_item_number(service_orders_stock)
         for yarn in fabric.recipe:
-            quantity_yarn = (yarn.proportion / 100.0) * quantity
-
-            update_result = await self._update_remaining_supply_stock_by_yarn(
-                service_orders_stock=service_orders_stock,
-                yarn_id=yarn.yarn_id,
-                quantity=quantity_yarn,
+            self._add_pending_supply_stock(
+                self._allocate_supply_stock_by_yarn(
+                    service_orders_stock=service_orders_stock,
+                    yarn_id=yarn.yarn_id,
+                    quantity=(yarn.proportion / 100.0) * quantity,
+                )
             )
 
-            if update_result.is_failure:
-                print(update_result.error)
-
         return Success(None)
 
     async def delete_service_order_supply_stock(
@@ -1,9 +1,16 @@
+import asyncio
+import io
+import logging
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.constants import MECSA_COMPANY_CODE
+from src.core.database import open_session
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
+from src.core.rendering import pdf_renderer
 from src.core.repositories import SequenceRepository
 from src.core.repository import (
     BaseRepository,
@@ -31,6 +38,8 @@ from src.operations.constants import (
     YARN_WEAVING_DISPATCH_MOVEMENT_CODE,
 )
 from src.operations.failures import (
+    FABRIC_NOT_FOUND_FAILURE,
+    SERVICE_ORDER_NOT_FOUND_FAILURE,
     WEAVING_SERVICE_ENTRY_ALREADY_ACCOUNTED_FAILURE,
     WEAVING_SERVICE_ENTRY_ALREADY_QUANTITY_RECEIVED_FAILURE,
     WEAVING_SERVICE_ENTRY_CARD_OPERATION_ALREADY_DISPATCHED_FAILURE,
@@ -52,7 +61,12 @@ from src.operations.models import (
     FabricWarehouse,
     Movement,
     MovementDetail,
-    ServiceCardOperation,
+    ServiceOrderSupplyDetail,
+)
+from src.operations.rate_cache import (
+    ServiceRate,
+    ServiceRateKey,
+    service_rate_cache,
 )
 from src.operations.repositories import WeavingServiceEntryRepository
 from src.operations.schemas import (
@@ -70,7 +84,7 @@ from src.operations.schemas import (
     WeavingServiceEntryUpdateSchema,
 )
 from src.operations.sequences import card_id_seq
-from src.operations.utils.card_operation.pdf import generate_pdf_cards
+from src.operations.utils.card_operation.pdf import render_pdf_cards
 
 from .card_operation_service import CardOperationService
 from .fabric_service import FabricService
@@ -84,10 +98,13 @@ from .service_order_service import ServiceOrderService
 from .service_order_supply_service import ServiceOrderSupplyDetailService
 from .supplier_service import SupplierService
 
+logger = logging.getLogger(__name__)
+
 
 class WeavingServiceEntryService(MovementService):
     def __init__(self, promec_db: AsyncSession, db: AsyncSession = None) -> None:
         super().__init__(promec_db=promec_db)
+        self.db = db
         self.repository = WeavingServiceEntryRepository(promec_db=promec_db)
         self.weaving_service_entry_series = WeavingServiceEntrySeries(
             promec_db=promec_db
@@ -95,12 +112,11 @@ class WeavingServiceEntryService(MovementService):
         self.supplier_service = SupplierService(promec_db=promec_db)
         self.fabric_service = FabricService(db=db, promec_db=promec_db)
         self.service_order_service = ServiceOrderService(db=db, promec_db=promec_db)
-        self.service_card_operation_service = BaseRepository(
-            model=ServiceCardOperation, db=promec_db
-        )
         self.mecsa_color_service = MecsaColorService(promec_db=promec_db)
         self.card_operation_sequence = SequenceRepository(
-            sequence=card_id_seq, db=promec_db
+            sequence=card_id_seq,
+            db=promec_db,
+            block_size=settings.CARD_SEQUENCE_BLOCK_SIZE,
         )
         self.dispatch_series = DispatchSeries(promec_db=promec_db)
         self.service_order_supply_service = ServiceOrderSupplyDetailService(
@@ -124,18 +140,22 @@ class WeavingServiceEntryService(MovementService):
         self,
         filter_params: WeavingServiceEntryFilterParams,
     ) -> Result[WeavingServiceEntriesSimpleListSchema, CustomException]:
-        weaving_service_entries = await self.repository.find_weaving_service_entries(
-            **filter_params.model_dump(exclude={"page"})
-        )
-
-        amount = await self.repository.count_weaving_service_entries(
-            **filter_params.model_dump(exclude={"page", "limit", "offset"})
+        (
+            weaving_service_entries,
+            amount,
+        ) = await self.repository.find_weaving_service_entries(
+            **filter_params.model_dump(exclude={"page"}),
         )
 
         return Success(
             WeavingServiceEntriesListSchema(
                 weaving_service_entries=weaving_service_entries,
                 amount=amount,
+                next_cursor=next_cursor(
+                    items=weaving_service_entries,
+                    keyset=self.repository.get_movement_creation_date_keyset(),
+                    limit=filter_params.limit,
+                ),
             )
         )
 
@@ -206,12 +226,8 @@ class WeavingServiceEntryService(MovementService):
 
         return Success(supplier.value)
 
-    async def _validate_rate_fabric(
-        self,
-        current_date: datetime,
-        supplier_id: str,
-        fabric: FabricSchema,
-    ) -> Result[None, CustomException]:
+    @staticmethod
+    def _get_rate_fabric_key(fabric: FabricSchema) -> ServiceRateKey:
         codcol = "CRUD"
         fabric_id = fabric.id
 
@@ -219,27 +235,80 @@ class WeavingServiceEntryService(MovementService):
             codcol = fabric.color.id
             fabric_id = fabric_id[0:3] + str(round(fabric.density))
 
-        filter = (
-            (ServiceCardOperation.company_code == MECSA_COMPANY_CODE)
-            & (ServiceCardOperation.period == current_date.date().year)
-            & (ServiceCardOperation.month_number == current_date.date().month)
-            & (ServiceCardOperation.serial_code == "003")
-            & (ServiceCardOperation.supplier_id == supplier_id)
-            & (ServiceCardOperation.fabric_id == fabric_id)
-            & (ServiceCardOperation.width == fabric.width)
-            & (ServiceCardOperation.codcol == codcol)
-        )
+        return "003", fabric_id, fabric.width, codcol
 
-        rate = await self.service_card_operation_service.find(
-            filter=filter,
-        )
-
-        if rate is None:
-            print("Fabric rate missing")
+    def _validate_rate_fabric(
+        self,
+        rates: dict[str, dict[ServiceRateKey, ServiceRate]],
+        supplier_id: str,
+        fabric: FabricSchema,
+    ) -> Result[None, CustomException]:
+        key = self._get_rate_fabric_key(fabric)
+        if key not in rates.get(supplier_id, {}):
+            service_rate_cache.record_missing_rate()
+            logger.warning("Fabric rate missing for supplier %s: %s", supplier_id, key)
             # return WEAVING_SERVICE_ENTRY_FABRIC_RATE_MISSING_FAILURE
 
         return Success(None)
 
+    async def _prefetch_weaving_service_entry_detail_data(
+        self,
+        supplier: SupplierSchema,
+        period: int,
+        data: list[WeavingServiceEntryDetailCreateSchema],
+    ) -> Result[
+        tuple[
+            dict[str, ServiceOrderSchema],
+            dict[str, FabricSchema],
+            dict[str, list[ServiceOrderSupplyDetail]],
+        ],
+        CustomException,
+    ]:
+        """
+        Loads the service orders, fabrics and supply stocks of every detail with
+        one query per kind. Service orders and fabrics are read concurrently on
+        their own sessions; supply stocks are read on the request session, since
+        they are updated when the entry is saved.
+        """
+        service_order_ids = list({detail.service_order_id for detail in data})
+        fabric_ids = list({detail.fabric_id for detail in data})
+
+        async def map_service_orders():
+            async with open_session(self.promec_db) as promec_db:
+                return await ServiceOrderService(
+                    db=self.db, promec_db=promec_db
+                ).map_service_orders_by_ids(
+                    order_ids=service_order_ids,
+                    order_type="TJ",
+                    include_detail=True,
+                )
+
+        async def map_fabrics():
+            async with open_session(self.promec_db) as promec_db:
+                return await FabricService(
+                    db=self.db, promec_db=promec_db
+                ).map_fabrics_by_ids(
+                    fabric_ids=fabric_ids,
+                    include_recipe=True,
+                    include_color=True,
+                )
+
+        results = await asyncio.gather(
+            map_service_orders(),
+            map_fabrics(),
+            self.service_order_supply_service._map_service_orders_supply_stock(
+                storage_code=supplier.storage_code,
+                period=period,
+                service_order_ids=service_order_ids,
+            ),
+        )
+
+        for result in results:
+            if result.is_failure:
+                return result
+
+        return Success(tuple(result.value for result in results))
+
     async def _validate_weaving_service_entry_detail_data(
         self,
         supplier: SupplierSchema,
@@ -247,19 +316,35 @@ class WeavingServiceEntryService(MovementService):
         current_date: datetime,
         data: list[WeavingServiceEntryDetailCreateSchema],
     ) -> Result[None, CustomException]:
+        prefetch_result = await self._prefetch_weaving_service_entry_detail_data(
+            supplier=supplier,
+            period=period,
+            data=data,
+        )
+        if prefetch_result.is_failure:
+            return prefetch_result
+
+        service_orders_mapping, fabrics_mapping, supply_stocks_mapping = (
+            prefetch_result.value
+        )
+
+        rates = await service_rate_cache.get_by_suppliers(
+            db=self.promec_db,
+            period=current_date.date().year,
+            month=current_date.date().month,
+            supplier_ids=[
+                service_order.supplier_id
+                for service_order in service_orders_mapping.values()
+            ],
+        )
+
         for detail in data:
             # Validación de existencia de la orden de servicio
             service_orders = []
-            service_order_result = await self.service_order_service.read_service_order(
-                order_id=detail.service_order_id,
-                order_type="TJ",
-                include_detail=True,
-            )
-
-            if service_order_result.is_failure:
-                return service_order_result
+            if detail.service_order_id not in service_orders_mapping:
+                return SERVICE_ORDER_NOT_FOUND_FAILURE
 
-            service_orders.append(service_order_result.value)
+            service_orders.append(service_orders_mapping[detail.service_order_id])
             # En caso sean multiples ordenes de servicio
 
             fabric_ids = {
@@ -271,28 +356,16 @@ class WeavingServiceEntryService(MovementService):
             if detail.fabric_id not in fabric_ids:
                 return WEAVING_SERVICE_ENTRY_FABRIC_NOT_FOUND_FAILURE
 
-            fabric_result = await self.fabric_service.read_fabric(
-                fabric_id=detail.fabric_id,
-                include_recipe=True,
-                include_color=True,
-                # include_yarn_instance_to_recipe=True,
+            if detail.fabric_id not in fabrics_mapping:
+                return FABRIC_NOT_FOUND_FAILURE
+            # Cada detalle asigna sus propios proveedores de hilado al tejido
+            fabric: FabricSchema = fabrics_mapping[detail.fabric_id].model_copy(
+                deep=True
             )
-            if fabric_result.is_failure:
-                return fabric_result
-            fabric: FabricSchema = fabric_result.value
 
             for service_order in service_orders:
-                service_orders_supply_stock_result = await self.service_order_supply_service._read_service_orders_supply_stock(
-                    storage_code=supplier.storage_code,
-                    period=period,
-                    service_order_id=service_order.id,
-                )
-
-                if service_orders_supply_stock_result.is_failure:
-                    return service_orders_supply_stock_result
-
-                service_orders_supply_stock: list[ServiceOrderSupplyDetailService] = (
-                    service_orders_supply_stock_result.value
+                service_orders_supply_stock: list[ServiceOrderSupplyDetail] = (
+                    supply_stocks_mapping.get(service_order.id, [])
                 )
 
                 if not service_orders_supply_stock:
@@ -367,8 +440,8 @@ class WeavingServiceEntryService(MovementService):
                 if fabric_ids[detail.fabric_id] == CANCELLED_SERVICE_ORDER_ID:
                     return WeavingServiceEntryFailures.WEAVING_SERVICE_ENTRY_SERVICE_ORDER_CANCELLED_FAILURE
 
-                validation_result = await self._validate_rate_fabric(
-                    current_date=current_date,
+                validation_result = self._validate_rate_fabric(
+                    rates=rates,
                     supplier_id=service_order.supplier_id,
                     fabric=fabric,
                 )
@@ -400,8 +473,9 @@ class WeavingServiceEntryService(MovementService):
         net_weight = round(detail.guide_net_weight / detail.roll_count, 2)
         gross_weight = net_weight
         sdoneto = net_weight
-        for i in range(detail.roll_count):
-            card_id = "C" + str(await self.card_operation_sequence.next_value())
+        card_numbers = await self.card_operation_sequence.take_values(detail.roll_count)
+        for card_number in card_numbers:
+            card_id = "C" + str(card_number)
             color = "CRUD"
             if detail._fabric.color:
                 color = detail._fabric.color.id
@@ -523,15 +597,19 @@ class WeavingServiceEntryService(MovementService):
                     entry_item_number=detail.item_number,
                 )
 
-                await self.product_inventory_service.update_current_stock(
+                self.product_inventory_service.add_stock_delta(
                     product_code1=yarn.yarn_id,
                     period=period,
                     storage_code=supplier.storage_code,
-                    new_stock=-quantity,
+                    quantity=-quantity,
                 )
 
                 yarn_weaving_dispatch_detail.append(yarn_weaving_dispatch_detail_value)
 
+        # As before batching, yarns without an inventory row in the supplier
+        # storage are left as they are.
+        await self.product_inventory_service.flush_stock_deltas(skip_missing=True)
+
         await self.save_movement(
             movement=yarn_weaving_dispatch,
             movement_detail=yarn_weaving_dispatch_detail,
@@ -648,16 +726,6 @@ class WeavingServiceEntryService(MovementService):
 
             mecsa_weight = sum([card.net_weight for card in card_operations_value])
 
-            product_inventory = await self._read_or_create_product_inventory(
-                product_code1=detail.fabric_id,
-                period=period,
-                storage_code=WEAVING_STORAGE_CODE,
-                enable_create=True,
-            )
-
-            if product_inventory.is_failure:
-                return product_inventory
-
             weaving_service_entry_detail_value = MovementDetail(
                 company_code=MECSA_COMPANY_CODE,
                 storage_code=WEAVING_STORAGE_CODE,
@@ -717,14 +785,12 @@ class WeavingServiceEntryService(MovementService):
                 tint_supplier_color_id="",
             )
 
-            update_result = await self.product_inventory_service.update_current_stock(
+            self.product_inventory_service.add_stock_delta(
                 product_code1=detail.fabric_id,
                 period=period,
                 storage_code=WEAVING_STORAGE_CODE,
-                new_stock=mecsa_weight,
+                quantity=mecsa_weight,
             )
-            if update_result.is_failure:
-                return update_result
 
             update_result = (
                 await self.service_order_service.update_quantity_supplied_by_fabric_id(
@@ -757,6 +823,16 @@ class WeavingServiceEntryService(MovementService):
 
         weaving_service_entry.detail = weaving_service_entry_detail
 
+        update_result = await self.product_inventory_service.flush_stock_deltas(
+            enable_create=True
+        )
+        if update_result.is_failure:
+            return update_result
+
+        update_result = await self.service_order_supply_service.flush_supply_stock()
+        if update_result.is_failure:
+            return update_result
+
         creation_result = await self.save_movement(
             movement=weaving_service_entry,
             movement_detail=weaving_service_entry_detail,
@@ -812,14 +888,16 @@ class WeavingServiceEntryService(MovementService):
                 yarn = detail.fabric.recipe[i]
                 quantity = round(guide_net_weight * (yarn.proportion / 100.0), 2)
 
-                await self.product_inventory_service.rollback_currents_stock(
+                self.product_inventory_service.add_stock_delta(
                     product_code1=yarn.yarn_id,
                     period=period,
                     storage_code=supplier.storage_code,
-                    quantity=-quantity,
+                    quantity=quantity,
                 )
 
-        return Success(None)
+        return await self.product_inventory_service.flush_stock_deltas(
+            skip_missing=True
+        )
 
     async def rollback_weaving_service_entry(
         self,
@@ -835,16 +913,12 @@ class WeavingServiceEntryService(MovementService):
         supplier: SupplierSchema = supplier_result.value
 
         for detail in weaving_service_entry.detail:
-            rollback_result = (
-                await self.product_inventory_service.rollback_currents_stock(
-                    product_code1=detail.product_code1,
-                    period=period,
-                    storage_code=WEAVING_STORAGE_CODE,
-                    quantity=detail.mecsa_weight,
-                )
+            self.product_inventory_service.add_stock_delta(
+                product_code1=detail.product_code1,
+                period=period,
+                storage_code=WEAVING_STORAGE_CODE,
+                quantity=-detail.mecsa_weight,
             )
-            if rollback_result.is_failure:
-                return rollback_result
 
             rollback_result = await self.service_order_service.rollback_quantity_supplied_by_fabric_id(
                 fabric_id=detail.product_code1,
@@ -886,6 +960,10 @@ class WeavingServiceEntryService(MovementService):
 
             detail.fabric = fabric
 
+        rollback_result = await self.service_order_supply_service.flush_supply_stock()
+        if rollback_result.is_failure:
+            return rollback_result
+
         rollback_result = await self._rollback_yarn_weaving_dispatch(
             supplier=supplier,
             period=period,
@@ -1189,11 +1267,11 @@ class WeavingServiceEntryService(MovementService):
                     service_order.id
                 )
 
-                await self.product_inventory_service.update_current_stock(
+                self.product_inventory_service.add_stock_delta(
                     product_code1=detail.fabric_id,
                     period=period,
                     storage_code=WEAVING_STORAGE_CODE,
-                    new_stock=mecsa_weight,
+                    quantity=mecsa_weight,
                 )
 
                 await self.service_order_service.update_quantity_supplied_by_fabric_id(
@@ -1226,16 +1304,6 @@ class WeavingServiceEntryService(MovementService):
 
                 mecsa_weight = sum([card.net_weight for card in card_operations_value])
 
-                product_inventory = await self._read_or_create_product_inventory(
-                    product_code1=detail.fabric_id,
-                    period=period,
-                    storage_code=WEAVING_STORAGE_CODE,
-                    enable_create=True,
-                )
-
-                if product_inventory.is_failure:
-                    return product_inventory
-
                 weaving_service_entry_detail_value = MovementDetail(
                     company_code=MECSA_COMPANY_CODE,
                     storage_code=WEAVING_STORAGE_CODE,
@@ -1295,11 +1363,11 @@ class WeavingServiceEntryService(MovementService):
                     tint_supplier_color_id="",
                 )
 
-                await self.product_inventory_service.update_current_stock(
+                self.product_inventory_service.add_stock_delta(
                     product_code1=detail.fabric_id,
                     period=period,
                     storage_code=WEAVING_STORAGE_CODE,
-                    new_stock=mecsa_weight,
+                    quantity=mecsa_weight,
                 )
 
                 await self.service_order_service.update_quantity_supplied_by_fabric_id(
@@ -1320,6 +1388,16 @@ class WeavingServiceEntryService(MovementService):
                 weaving_service_entry_detail_value.detail_card = card_operations_value
                 weaving_service_entry.detail.append(weaving_service_entry_detail_value)
 
+        update_result = await self.product_inventory_service.flush_stock_deltas(
+            enable_create=True
+        )
+        if update_result.is_failure:
+            return update_result
+
+        update_result = await self.service_order_supply_service.flush_supply_stock()
+        if update_result.is_failure:
+            return update_result
+
         creation_result = await self.save_movement(
             movement=weaving_service_entry,
             movement_detail=weaving_service_entry.detail,
@@ -1440,6 +1518,6 @@ class WeavingServiceEntryService(MovementService):
             return card_operations_value
         card_operations = card_operations_value.value
 
-        pdf = generate_pdf_cards(cards=card_operations)
+        pdf = await pdf_renderer.render(render_pdf_cards, card_operations)
 
-        return Success(pdf)
+        return Success(io.BytesIO(pdf))
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MECSA_COMPANY_CODE
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
 from src.core.repositories import SequenceRepository
 from src.core.repository import BaseRepository
 from src.core.result import Result, Success
@@ -124,18 +125,22 @@ class YarnPurchaseEntryService(MovementService):
         self,
         filter_params: YarnPurchaseEntryFilterParams = YarnPurchaseEntryFilterParams(),
     ) -> Result[YarnPurchaseEntriesSimpleListSchema, CustomException]:
-        yarn_purchase_entries = await self.repository.find_yarn_purchase_entries(
-            **filter_params.model_dump(exclude={"page"})
-        )
-
-        amount = await self.repository.count_yarn_purchase_entries(
-            **filter_params.model_dump(exclude={"page", "limit", "offset"})
+        (
+            yarn_purchase_entries,
+            amount,
+        ) = await self.repository.find_yarn_purchase_entries(
+            **filter_params.model_dump(exclude={"page"}),
         )
 
         return Success(
             YarnPurchaseEntriesSimpleListSchema(
                 yarn_purchase_entries=yarn_purchase_entries,
                 amount=amount,
+                next_cursor=next_cursor(
+                    items=yarn_purchase_entries,
+                    keyset=self.repository.get_movement_creation_date_keyset(),
+                    limit=filter_params.limit,
+                ),
             )
         )
 
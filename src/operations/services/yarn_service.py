@@ -1,14 +1,21 @@
 from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.constants import MECSA_COMPANY_CODE
+from src.core.database import after_commit
 from src.core.exceptions import CustomException
 from src.core.repositories import SequenceRepository
 from src.core.repository import BaseRepository
 from src.core.result import Result, Success
 from src.core.schemas import ItemIsUpdatableSchema
 from src.core.utils import is_active_status, map_active_status
-from src.operations.constants import SUPPLY_FAMILY_ID, YARN_SUBFAMILY_ID
+from src.operations.constants import (
+    SUPPLY_FAMILY_ID,
+    YARN_SUBFAMILY_ID,
+    RecipeFingerprintItemType,
+)
+from src.operations.fabric_catalog import fabric_catalog
 from src.operations.failures import (
     DUPLICATE_FIBER_IN_YARN_RECIPE_FAILURE,
     FIBER_DISABLED_IN_YARN_RECIPE_FAILURE,
@@ -33,6 +40,7 @@ from src.operations.models import (
 )
 from src.operations.repositories import (
     FabricRecipeRepository,
+    RecipeFingerprintRepository,
     YarnRecipeRepository,
     YarnRepository,
 )
@@ -46,6 +54,7 @@ from src.operations.schemas import (
     YarnUpdateSchema,
 )
 from src.operations.sequences import product_id_seq
+from src.operations.utils.recipe_fingerprint import yarn_fingerprint
 from src.security.loaders import (
     SpinningMethods,
     YarnCounts,
@@ -66,7 +75,9 @@ class YarnService:
         self.parameter_service = ParameterService(db=db)
         self.mecsa_color_service = MecsaColorService(promec_db=promec_db)
         self.product_sequence = SequenceRepository(
-            sequence=product_id_seq, db=promec_db
+            sequence=product_id_seq,
+            db=promec_db,
+            block_size=settings.PRODUCT_SEQUENCE_BLOCK_SIZE,
         )
         self.spinning_methods = SpinningMethods(db=db)
         self.fiber_service = FiberService(db=db, promec_db=promec_db)
@@ -76,6 +87,7 @@ class YarnService:
         self.manufacturing_sites = YarnManufacturingSites(db=db)
         self.distinctions = YarnDistinctions(db=db)
         self.fabric_recipe_repository = FabricRecipeRepository(db=promec_db)
+        self.fingerprint_repository = RecipeFingerprintRepository(db=db)
         self.distinction_repository = BaseRepository[YarnDistinction](
             model=YarnDistinction, db=db
         )
@@ -300,55 +312,36 @@ class YarnService:
             for yarn in yarns
         )
 
-    async def _is_same_recipe(
+    def _is_same_recipe(
         self, current_yarn: InventoryItem, new_recipe: list[YarnRecipeItemSimpleSchema]
     ) -> bool:
-        if not hasattr(current_yarn, "recipe"):
-            await self._assign_recipe_to_yarns([current_yarn])
-
         return not self._is_yarn_recipe_unique(
             current_recipe=new_recipe, yarns=[current_yarn]
         )
 
-    async def _is_yarn_unique(
-        self,
-        yarn_count_id_: str,
-        spinning_method_id_: str,
-        color_id: str,
-        manufactured_in_id_: str,
+    @staticmethod
+    def _get_yarn_fingerprint(
+        yarn: InventoryItem,
         distinction_ids: list[int],
-        current_yarn: InventoryItem | None = None,
-        current_recipe: list[YarnRecipeItemSimpleSchema] | None = None,
-        **kwargs,
+        recipe: list[YarnRecipeItemSimpleSchema] | None = None,
+    ) -> str:
+        return yarn_fingerprint(
+            yarn_count_id=yarn.field1,
+            spinning_method_id=yarn.field2,
+            color_id=yarn.field3,
+            manufactured_in_id=yarn.field4,
+            distinction_ids=distinction_ids,
+            recipe=yarn.recipe if recipe is None else recipe,
+        )
+
+    async def _is_yarn_unique(
+        self, fingerprint: str, current_yarn_id: str | None = None
     ) -> bool:
-        filter = (
-            (InventoryItem.field1 == yarn_count_id_)
-            & (InventoryItem.field2 == spinning_method_id_)
-            & (InventoryItem.field3 == color_id)
-            & (InventoryItem.field4 == manufactured_in_id_)
+        yarn_ids = await self.fingerprint_repository.find_item_ids_by_fingerprint(
+            item_type=RecipeFingerprintItemType.YARN, fingerprint=fingerprint
         )
-        _yarns = await self.repository.find_yarns(filter=filter)
-        yarns = (
-            _yarns
-            if current_yarn is None
-            else [yarn for yarn in _yarns if yarn != current_yarn]
-        )
-        if len(yarns) == 0:  # yarn has unique attributes
-            return True
-
-        await self._assign_distinctions_to_yarns(yarns=yarns)
-        distinction_ids_ = set(distinction_ids)
-        if all(distinction_ids_ != set(yarn.distinction_ids) for yarn in yarns):
-            return True
-
-        await self._assign_recipe_to_yarns(yarns=_yarns)
-        if current_recipe is None:
-            current_recipe = [
-                YarnRecipeItemSimpleSchema.model_validate(item)
-                for item in current_yarn.recipe
-            ]
 
-        return self._is_yarn_recipe_unique(current_recipe=current_recipe, yarns=yarns)
+        return all(yarn_id == current_yarn_id for yarn_id in yarn_ids)
 
     async def _read_yarn(
         self,
@@ -415,7 +408,15 @@ class YarnService:
         if recipe_validation_result.is_failure:
             return recipe_validation_result
 
-        if not (await self._is_yarn_unique(**attributes, current_recipe=form.recipe)):
+        fingerprint = yarn_fingerprint(
+            yarn_count_id=form.yarn_count_id_,
+            spinning_method_id=form.spinning_method_id_,
+            color_id=form.color_id,
+            manufactured_in_id=form.manufactured_in_id_,
+            distinction_ids=form.distinction_ids,
+            recipe=form.recipe,
+        )
+        if not (await self._is_yarn_unique(fingerprint=fingerprint)):
             return YARN_ALREADY_EXISTS_FAILURE
 
         yarn_id = str(await self.product_sequence.next_value())
@@ -446,6 +447,13 @@ class YarnService:
                 YarnDistinction(yarn_id=yarn_id, distinction_id=id)
                 for id in form.distinction_ids
             )
+        stored = await self.fingerprint_repository.save_fingerprint(
+            item_type=RecipeFingerprintItemType.YARN,
+            item_id=yarn_id,
+            fingerprint=fingerprint,
+        )
+        if stored is None:
+            return YARN_ALREADY_EXISTS_FAILURE
 
         return Success(None)
 
@@ -514,22 +522,30 @@ class YarnService:
         await self._assign_distinctions_to_yarns(yarns=[yarn])
         prev_distinction_ids = yarn.distinction_ids
         yarn.distinction_ids = yarn_data.get("distinction_ids", yarn.distinction_ids)
-        if form_has_yarn_attributes and not (
-            await self._is_yarn_unique(
-                yarn_count_id_=yarn.field1,
-                spinning_method_id_=yarn.field2,
-                color_id=yarn.field3,
-                manufactured_in_id_=yarn.field4,
-                distinction_ids=yarn.distinction_ids,
-                current_yarn=yarn,
-                current_recipe=form.recipe,
+        fingerprint = None
+        if form_has_yarn_attributes:
+            await self._assign_recipe_to_yarns(yarns=[yarn])
+            fingerprint = self._get_yarn_fingerprint(
+                yarn=yarn, distinction_ids=yarn.distinction_ids, recipe=form.recipe
             )
-        ):
-            return YARN_ALREADY_EXISTS_FAILURE
+            if not (
+                await self._is_yarn_unique(
+                    fingerprint=fingerprint, current_yarn_id=yarn.id
+                )
+            ):
+                return YARN_ALREADY_EXISTS_FAILURE
 
         await self.repository.save(yarn)
-        if form.recipe is not None and not (
-            await self._is_same_recipe(current_yarn=yarn, new_recipe=form.recipe)
+        if fingerprint is not None:
+            stored = await self.fingerprint_repository.save_fingerprint(
+                item_type=RecipeFingerprintItemType.YARN,
+                item_id=yarn.id,
+                fingerprint=fingerprint,
+            )
+            if stored is None:
+                return YARN_ALREADY_EXISTS_FAILURE
+        if form.recipe is not None and not self._is_same_recipe(
+            current_yarn=yarn, new_recipe=form.recipe
         ):
             await self.recipe_repository.delete_all([item for item in yarn.recipe])
             await self.recipe_repository.save_all(
@@ -541,6 +557,7 @@ class YarnService:
                 YarnDistinction(yarn_id=yarn_id, distinction_id=id)
                 for id in yarn.distinction_ids
             )
+        after_commit(self.repository.db, fabric_catalog.invalidate)
 
         return Success(None)
 
@@ -554,6 +571,7 @@ class YarnService:
         yarn: InventoryItem = yarn_result.value
         yarn.is_active = map_active_status(is_active)
         await self.repository.save(yarn)
+        after_commit(self.repository.db, fabric_catalog.invalidate)
 
         return Success(None)
 
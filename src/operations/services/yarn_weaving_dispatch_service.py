@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MECSA_COMPANY_CODE
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
 from src.core.repository import BaseRepository
 from src.core.result import Result, Success
 from src.core.utils import PERU_TIMEZONE, calculate_time
@@ -102,19 +103,23 @@ class YarnWeavingDispatchService(MovementService):
         self,
         filter_params: YarnWeavingDispatchFilterParams,
     ) -> Result[YarnWeavingDispatchListSchema, CustomException]:
-        yarn_weaving_dispatches = await self.repository.find_yarn_weaving_dispatches(
+        (
+            yarn_weaving_dispatches,
+            amount,
+        ) = await self.repository.find_yarn_weaving_dispatches(
             **filter_params.model_dump(exclude={"page"}),
             apply_unique=True,
         )
 
-        amount = await self.repository.count_yarn_weaving_dispatches(
-            **filter_params.model_dump(exclude={"page", "limit", "offset"})
-        )
-
         return Success(
             YarnWeavingDispatchListSchema(
                 yarn_weaving_dispatches=yarn_weaving_dispatches,
                 amount=amount,
+                next_cursor=next_cursor(
+                    items=yarn_weaving_dispatches,
+                    keyset=self.repository.get_movement_creation_date_keyset(),
+                    limit=filter_params.limit,
+                ),
             )
         )
 
@@ -395,23 +400,18 @@ class YarnWeavingDispatchService(MovementService):
                 )
             )
 
-            product_inventory_service = await self._read_or_create_product_inventory(
+            self.product_inventory_service.add_stock_delta(
                 product_code1=detail[i]._yarn_purchase_entry_heavy.yarn_id,
                 period=period,
                 storage_code=storage_code,
-                enable_create=True,
+                quantity=detail[i].net_weight,
             )
-            if product_inventory_service.is_failure:
-                return product_inventory_service
 
-            update_result = await self.product_inventory_service.update_current_stock(
-                product_code1=detail[i]._yarn_purchase_entry_heavy.yarn_id,
-                period=period,
-                storage_code=storage_code,
-                new_stock=detail[i].net_weight,
-            )
-            if update_result.is_failure:
-                return update_result
+        update_result = await self.product_inventory_service.flush_stock_deltas(
+            enable_create=True
+        )
+        if update_result.is_failure:
+            return update_result
 
         creation_result = await self.save_movement(
             movement=entry_movement,
@@ -817,15 +817,16 @@ class YarnWeavingDispatchService(MovementService):
             if update_yarn_entry_detail_heavy_result.is_failure:
                 return update_yarn_entry_detail_heavy_result
 
-            update_result = await self.product_inventory_service.update_current_stock(
+            self.product_inventory_service.add_stock_delta(
                 product_code1=detail._yarn_purchase_entry_heavy.yarn_id,
                 period=current_period,
                 storage_code=YARN_WEAVING_DISPATCH_STORAGE_CODE,
-                new_stock=-detail.net_weight,
+                quantity=-detail.net_weight,
             )
 
-            if update_result.is_failure:
-                return update_result
+        update_result = await self.product_inventory_service.flush_stock_deltas()
+        if update_result.is_failure:
+            return update_result
 
         creation_result = await self.save_movement(
             movement=yarn_weaving_dispatch,
@@ -968,27 +969,18 @@ class YarnWeavingDispatchService(MovementService):
         supplier = supplier_result.value
 
         for detail in yarn_weaving_dispatch.detail:
-            rollback_result = (
-                await self.product_inventory_service.rollback_currents_stock(
-                    product_code1=detail.product_code1,
-                    period=detail.period,
-                    storage_code=supplier.storage_code,
-                    quantity=detail.mecsa_weight,
-                )
+            self.product_inventory_service.add_stock_delta(
+                product_code1=detail.product_code1,
+                period=detail.period,
+                storage_code=supplier.storage_code,
+                quantity=-detail.mecsa_weight,
             )
-            if rollback_result.is_failure:
-                return rollback_result
-
-            rollback_result = (
-                await self.product_inventory_service.rollback_currents_stock(
-                    product_code1=detail.product_code1,
-                    period=detail.period,
-                    storage_code=YARN_WEAVING_DISPATCH_STORAGE_CODE,
-                    quantity=-detail.mecsa_weight,
-                )
+            self.product_inventory_service.add_stock_delta(
+                product_code1=detail.product_code1,
+                period=detail.period,
+                storage_code=YARN_WEAVING_DISPATCH_STORAGE_CODE,
+                quantity=detail.mecsa_weight,
             )
-            if rollback_result.is_failure:
-                return rollback_result
 
             rollback_result = await self.yarn_purchase_entry_detail_heavy_service.rollback_yarn_purchase_entry_detail_heavy_by_yarn_dispatch(
                 package_count=detail.detail_aux.guide_package_count,
@@ -1012,7 +1004,7 @@ class YarnWeavingDispatchService(MovementService):
             if rollback_result.is_failure:
                 return rollback_result
 
-        return Success(None)
+        return await self.product_inventory_service.flush_stock_deltas()
 
     async def update_yarn_weaving_dispatch(
         self,
@@ -3,6 +3,10 @@ import os
 import uuid
 
 from pylatex import Command, Document, NoEscape
+from reportlab.graphics.barcode.code128 import Code128
+from reportlab.lib.units import cm
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen.canvas import Canvas
 
 from src.operations.schemas import (
     CardOperationListSchema,
@@ -28,9 +32,13 @@ def read_and_delete_files(
     return pdf
 
 
-def generate_pdf_cards(
+def generate_pdf_cards_latex(
     cards: CardOperationListSchema,
 ):
+    """
+    Former renderer of `generate_pdf_cards`, through LaTeX and `card.tex`. It
+    needs a LaTeX installation and writes temporary files next to this module.
+    """
     doc = Document(documentclass="article")
     doc.preamble.append(Command("input", "card.tex"))
 
@@ -77,3 +85,137 @@ def generate_pdf_cards(
     )
 
     return pdf
+
+
+PAGE_WIDTH, PAGE_HEIGHT = 7.6 * cm, 5.1 * cm
+# Inner separation of the nodes in `card.tex`.
+PADDING = 5
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+DETAIL_WIDTH = 0.67 * PAGE_WIDTH
+LABEL_WIDTH = 0.22 * DETAIL_WIDTH
+
+
+def _draw_barcode(canvas: Canvas, value: str) -> None:
+    # Code 128 sized as the image in `card.tex`: 71.5% of the page width and 30%
+    # of its height, centered in the top third of the card and moved down by
+    # half of the 3 mm top spacing.
+    width = 0.715 * PAGE_WIDTH
+    height = 0.3 * PAGE_HEIGHT
+    modules = Code128(value, barWidth=1, quiet=False, humanReadable=False).width
+    barcode = Code128(
+        value,
+        barWidth=width / modules,
+        barHeight=height,
+        quiet=False,
+        humanReadable=False,
+    )
+
+    section_height = 0.33 * PAGE_HEIGHT
+    barcode.drawOn(
+        canvas,
+        (PAGE_WIDTH - width) / 2,
+        PAGE_HEIGHT - section_height + (section_height - height) / 2 - 0.15 * cm,
+    )
+
+
+def _draw_row(
+    canvas: Canvas,
+    x: float,
+    y: float,
+    label: str,
+    value: str,
+    font_size: float,
+    value_width: float,
+) -> float:
+    """
+    Draws `label` and the bold `value` wrapped to `value_width`, from the
+    baseline `y`, and returns the baseline of the next row.
+    """
+    leading = font_size + 2
+    canvas.setFont(FONT, font_size)
+    canvas.drawString(x, y, label)
+
+    lines = simpleSplit(value, FONT_BOLD, font_size, value_width) or [""]
+    canvas.setFont(FONT_BOLD, font_size)
+    for line in lines:
+        canvas.drawString(x + LABEL_WIDTH, y, line)
+        y -= leading
+
+    return y - 0.5
+
+
+def _draw_card(canvas: Canvas, card) -> None:
+    _draw_barcode(canvas, card.id)
+
+    # Detail block: the left two thirds of the bottom of the card.
+    top = 0.67 * PAGE_HEIGHT - PADDING
+    canvas.setFont(FONT_BOLD, 10)
+    canvas.drawCentredString(DETAIL_WIDTH / 2, top - 10, card.id)
+
+    x = PADDING + 7
+    value_width = DETAIL_WIDTH - 2 * PADDING - 7 - LABEL_WIDTH
+    half_value_width = (DETAIL_WIDTH - 2 * PADDING - 7) / 2 - LABEL_WIDTH
+
+    y = top - 10 - 14
+    y = _draw_row(canvas, x, y, "Tejido:", str(card.product_id), 9, value_width)
+    y = _draw_row(canvas, x, y, "Peso (Kg):", str(card.net_weight), 8, value_width)
+    y = _draw_row(canvas, x, y, "O/S:", ", ".join(card.service_orders), 8, value_width)
+    _draw_row(canvas, x, y, "Tinto:", card._supplier_tint_initials, 8, half_value_width)
+    y = _draw_row(
+        canvas,
+        x + LABEL_WIDTH + half_value_width,
+        y,
+        "Tejed:",
+        card._supplier_weaving_tej_initials,
+        8,
+        half_value_width,
+    )
+    _draw_row(
+        canvas,
+        x,
+        y,
+        "Hilan:",
+        ", ".join(card._supplier_yarn_initials),
+        8,
+        value_width,
+    )
+
+    # Card type: a large letter filling the bottom right third.
+    card_type = "N"
+    font_size = 0.6 * (0.67 * PAGE_HEIGHT - 2 * PADDING)
+    canvas.setFont(FONT_BOLD, font_size)
+    canvas.drawCentredString(
+        DETAIL_WIDTH + (PAGE_WIDTH - DETAIL_WIDTH) / 2,
+        (0.67 * PAGE_HEIGHT - 0.7 * font_size) / 2,
+        card_type,
+    )
+
+
+def generate_pdf_cards(
+    cards: CardOperationListSchema,
+) -> io.BytesIO:
+    """
+    Renders one label page per card, with the layout of `card.tex`, in memory:
+    barcodes are drawn as vector graphics, so no files or LaTeX are involved.
+    """
+    pdf = io.BytesIO()
+    canvas = Canvas(pdf, pagesize=(PAGE_WIDTH, PAGE_HEIGHT), pageCompression=1)
+
+    for card in cards.card_operations:
+        _draw_card(canvas, card)
+        canvas.showPage()
+
+    canvas.save()
+    pdf.seek(0)
+
+    return pdf
+
+
+def render_pdf_cards(
+    cards: CardOperationListSchema,
+) -> bytes:
+    """
+    `generate_pdf_cards` as bytes, to be run through `pdf_renderer`.
+    """
+    return generate_pdf_cards(cards).getvalue()
@@ -1,5 +1,6 @@
 import os
 import uuid
+from datetime import date
 
 from PIL import Image as PILImage
 from reportlab.lib import colors
@@ -18,7 +19,6 @@ from reportlab.platypus import (
 )
 
 from src.core.config import settings
-from src.core.utils import PERU_TIMEZONE, calculate_time
 from src.operations.models import Proveedor
 
 from .constants import (
@@ -166,13 +166,17 @@ def on_later_pages_programacion(canvas, doc, comment, partidas_size, comment_pag
 
 
 def add_dyeing_schedule_to_elements(
-    elements: list, tejeduria: Proveedor, tintoreria: Proveedor, pagesize: tuple, styles
+    elements: list,
+    tejeduria: Proveedor,
+    tintoreria: Proveedor,
+    fecha: date,
+    pagesize: tuple,
+    styles,
 ):
-    fecha = calculate_time(tz=PERU_TIMEZONE).strftime("%d/%m/%Y")
-    semana = calculate_time(tz=PERU_TIMEZONE).isocalendar()[1]
+    semana = fecha.isocalendar()[1]
 
     elements.append(Paragraph("Fecha:", styles["Roboto"]))
-    elements.append(Paragraph(fecha, styles["Roboto"]))
+    elements.append(Paragraph(fecha.strftime("%d/%m/%Y"), styles["Roboto"]))
     elements.append(Spacer(1, 12))
 
     titulo = (
@@ -325,6 +329,7 @@ def generate_pdf(
     comment: str,
     partidas_size: int,
     table: list,
+    fecha: date,
 ) -> bytes:
     attributes = PDFTintoreriaVertical()
 
@@ -368,7 +373,9 @@ def generate_pdf(
         pagesize=pagesize,
     )
 
-    add_dyeing_schedule_to_elements(elements, tejeduria, tintoreria, pagesize, styles)
+    add_dyeing_schedule_to_elements(
+        elements, tejeduria, tintoreria, fecha, pagesize, styles
+    )
     table = add_table_to_elements(elements, table, attributes, styles)
 
     width, height = table.wrap(0, 0)
@@ -0,0 +1,3 @@
+from .fingerprint import fabric_fingerprint, yarn_fingerprint
+
+__all__ = ["fabric_fingerprint", "yarn_fingerprint"]
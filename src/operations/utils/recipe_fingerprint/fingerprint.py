@@ -0,0 +1,66 @@
+import hashlib
+import json
+from typing import Iterable
+
+
+def _fingerprint(attributes: list, recipe: Iterable[tuple]) -> str:
+    """
+    Stable hash of the attributes and the recipe. The recipe is compared as a
+    set, so the order of its items does not change the fingerprint.
+    """
+    content = json.dumps(
+        {
+            "attributes": attributes,
+            "recipe": sorted({json.dumps(item) for item in recipe}),
+        },
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def yarn_fingerprint(
+    yarn_count_id: str | None,
+    spinning_method_id: str | None,
+    color_id: str | None,
+    manufactured_in_id: str | None,
+    distinction_ids: Iterable[int],
+    recipe: Iterable,
+) -> str:
+    """
+    Fingerprint of a yarn: its count, spinning method, color, manufacturing site
+    (`field1` to `field4`), distinctions and `(fiber_id, proportion)` recipe.
+    """
+    return _fingerprint(
+        attributes=[
+            yarn_count_id or "",
+            spinning_method_id or "",
+            color_id or "",
+            manufactured_in_id or "",
+            sorted(set(distinction_ids)),
+        ],
+        recipe=((item.fiber_id, float(item.proportion)) for item in recipe),
+    )
+
+
+def fabric_fingerprint(
+    width: str | None,
+    fabric_type_id: str | None,
+    color_id: str | None,
+    structure_pattern: str | None,
+    recipe: Iterable,
+) -> str:
+    """
+    Fingerprint of a fabric: its width, fabric type, color, structure pattern
+    (`field2` to `field5`) and `(yarn_id, proportion, num_plies)` recipe.
+    """
+    return _fingerprint(
+        attributes=[
+            width or "",
+            fabric_type_id or "",
+            color_id or "",
+            structure_pattern or "",
+        ],
+        recipe=(
+            (item.yarn_id, float(item.proportion), item.num_plies) for item in recipe
+        ),
+    )
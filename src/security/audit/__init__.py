@@ -1,4 +1,14 @@
+from .audit_policy import METADATA_AUDIT_POLICY, TRUNCATED_AUDIT_POLICY, AuditPolicy
+from .audit_queue import audit_action_log_queue, audit_data_log_queue
 from .audit_router import router as AuditRouter
 from .audit_service import AuditService
 
-__all__ = ["AuditService", "AuditRouter"]
+__all__ = [
+    "AuditService",
+    "AuditRouter",
+    "AuditPolicy",
+    "METADATA_AUDIT_POLICY",
+    "TRUNCATED_AUDIT_POLICY",
+    "audit_action_log_queue",
+    "audit_data_log_queue",
+]
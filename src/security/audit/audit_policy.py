@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+from src.core.config import settings
+
+
+@dataclass(frozen=True)
+class AuditPolicy:
+    """
+    Declares what `AuditService.audit_action_log` captures for a route.
+
+    Every request is recorded with its metadata (user, endpoint, method, params,
+    status code). The request and response bodies are only captured when the
+    policy allows it, and the response is cut to `max_response_bytes` when a
+    limit is given.
+    """
+
+    capture_request: bool = True
+    capture_response: bool = True
+    max_response_bytes: int | None = None
+
+    @classmethod
+    def full(cls) -> "AuditPolicy":
+        return cls()
+
+    @classmethod
+    def metadata(cls) -> "AuditPolicy":
+        return cls(capture_request=False, capture_response=False)
+
+    @classmethod
+    def truncated(cls, max_response_bytes: int) -> "AuditPolicy":
+        return cls(max_response_bytes=max_response_bytes)
+
+
+FULL_AUDIT_POLICY = AuditPolicy.full()
+METADATA_AUDIT_POLICY = AuditPolicy.metadata()
+TRUNCATED_AUDIT_POLICY = AuditPolicy.truncated(settings.AUDIT_RESPONSE_MAX_BYTES)
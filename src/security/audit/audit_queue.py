@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy import insert
+
+from src.core.config import settings
+from src.core.database import Base, get_db
+from src.security.models import AuditActionLog, AuditDataLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogQueue:
+    """
+    In-process buffer for audit rows of `model`.
+
+    Rows are enqueued while the request is running and a background writer
+    flushes them to the database in bulk inserts, either when `batch_size` rows
+    are pending or every `flush_interval` seconds. The buffer is bounded: when it
+    is full new rows are dropped and counted in the metrics, and so are the
+    batches whose insert fails, together with the rows they held.
+    """
+
+    def __init__(
+        self,
+        model: type[Base],
+        max_size: int = settings.AUDIT_QUEUE_MAX_SIZE,
+        batch_size: int = settings.AUDIT_QUEUE_BATCH_SIZE,
+        flush_interval: float = settings.AUDIT_QUEUE_FLUSH_INTERVAL,
+    ) -> None:
+        self.model = model
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._stopping = False
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.failed_writes = 0
+        self.last_flush_lag = 0.0
+        self.max_flush_lag = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer is not None and not self._writer.done()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _get_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+        return self._queue
+
+    def enqueue(self, values: dict) -> bool:
+        try:
+            self._get_queue().put_nowait((time.monotonic(), values))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+        self.enqueued += 1
+        return True
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._get_queue()
+        self._stopping = False
+        self._writer = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._writer is not None:
+            await self._writer
+            self._writer = None
+
+        while self.pending:
+            await self.flush()
+
+    async def _run(self) -> None:
+        queue = self._get_queue()
+        while not self._stopping:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                continue
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._write(batch)
+
+    def _drain(self) -> list[tuple]:
+        queue = self._get_queue()
+        batch: list[tuple] = []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        return batch
+
+    async def flush(self) -> int:
+        return await self._write(self._drain())
+
+    async def _write(self, batch: list[tuple]) -> int:
+        if not batch:
+            return 0
+
+        lag = time.monotonic() - batch[0][0]
+        self.last_flush_lag = lag
+        self.max_flush_lag = max(self.max_flush_lag, lag)
+
+        try:
+            async for db in get_db():
+                await db.execute(insert(self.model), [values for _, values in batch])
+        except Exception:
+            self.failed += len(batch)
+            self.failed_writes += 1
+            logger.exception(
+                "Dropped %s %s rows after a failed write",
+                len(batch),
+                self.model.__tablename__,
+            )
+            return 0
+
+        self.written += len(batch)
+        return len(batch)
+
+    def metrics(self) -> dict:
+        return {
+            "pending": self.pending,
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "failed_writes": self.failed_writes,
+            "last_flush_lag": round(self.last_flush_lag, 3),
+            "max_flush_lag": round(self.max_flush_lag, 3),
+        }
+
+
+audit_action_log_queue = AuditLogQueue(model=AuditActionLog)
+audit_data_log_queue = AuditLogQueue(model=AuditDataLog)
@@ -2,12 +2,20 @@ from datetime import datetime
 
 from sqlalchemy import BinaryExpression, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, load_only
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, load_only
 from sqlalchemy.orm.strategy_options import Load
 
+from src.core.cache import RefreshingCache
+from src.core.config import settings
 from src.core.repository import BaseRepository
 from src.security.models import AuditActionLog
 
+# Total of the unfiltered audit log listing, which would otherwise count the
+# whole table on every page view.
+audit_action_log_count_cache: RefreshingCache[type, int] = RefreshingCache(
+    ttl=settings.AUDIT_LOG_COUNT_TTL
+)
+
 
 class AuditRepository(BaseRepository[AuditActionLog]):
     def __init__(self, db: AsyncSession) -> None:
@@ -29,6 +37,10 @@ class AuditRepository(BaseRepository[AuditActionLog]):
             AuditActionLog.at,
         )
 
+    @staticmethod
+    def get_audit_action_log_keyset() -> tuple[InstrumentedAttribute, ...]:
+        return (AuditActionLog.at, AuditActionLog.id)
+
     @staticmethod
     def include_action_data_logs() -> list[Load]:
         base_options = [joinedload(AuditActionLog.audit_data_logs)]
@@ -56,9 +68,10 @@ class AuditRepository(BaseRepository[AuditActionLog]):
         options: list[Load] = None,
         limit: int = None,
         offset: int = None,
+        cursor: str = None,
         apply_unique: bool = False,
         joins: list[tuple] = None,
-    ) -> list[AuditActionLog]:
+    ) -> tuple[list[AuditActionLog], int]:
         base_filter: list[BinaryExpression] = []
         options: list[Load] = [] if options is None else options
         joins: list[tuple] = [] if joins is None else joins
@@ -75,20 +88,24 @@ class AuditRepository(BaseRepository[AuditActionLog]):
         if end_date:
             base_filter.append(AuditActionLog.at <= end_date)
 
+        is_unfiltered = not base_filter and filter is None and not joins
+
         filter = (
             and_(filter, *base_filter) if filter is not None else and_(*base_filter)
         )
 
         options.extend(self.get_load_options())
 
-        return await self.find_all(
+        return await self.find_page(
             filter=filter,
             options=options,
             apply_unique=apply_unique,
             joins=joins,
             limit=limit,
             offset=offset,
-            order_by=AuditActionLog.at.desc(),
+            keyset=self.get_audit_action_log_keyset(),
+            cursor=cursor,
+            count_cache=audit_action_log_count_cache if is_unfiltered else None,
         )
 
     async def find_audit_action_log_by_id(
@@ -118,31 +135,3 @@ class AuditRepository(BaseRepository[AuditActionLog]):
             options=options,
             joins=joins,
         )
-
-    async def count_audit_action_logs(
-        self,
-        user_ids: list[int] = None,
-        actions: list[str] = None,
-        start_date: datetime = None,
-        end_date: datetime = None,
-        filter: BinaryExpression = None,
-    ) -> int:
-        base_filter: list[BinaryExpression] = []
-
-        if user_ids:
-            base_filter.append(AuditActionLog.user_id.in_(user_ids))
-
-        if actions:
-            base_filter.append(AuditActionLog.action.in_(actions))
-
-        if start_date:
-            base_filter.append(AuditActionLog.at >= start_date)
-
-        if end_date:
-            base_filter.append(AuditActionLog.at <= end_date)
-
-        filter = (
-            and_(filter, *base_filter) if filter is not None else and_(*base_filter)
-        )
-
-        return await self.count(filter=filter)
@@ -3,11 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
+from src.security.constants import SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID
 
 from .audit_schema import (
     AuditActionLogFilterParams,
     AuditActionLogListSchema,
     AuditActionLogSchema,
+    AuditQueuesMetricsSchema,
 )
 from .audit_service import AuditService
 
@@ -31,6 +33,16 @@ async def get_audit_action_logs(
     raise result.error
 
 
+@router.get(
+    "/queue/metrics",
+    response_model=AuditQueuesMetricsSchema,
+    status_code=status.HTTP_200_OK,
+)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID)
+async def get_audit_queue_metrics(request: Request, db: AsyncSession = Depends(get_db)):
+    return AuditService.get_queue_metrics()
+
+
 @router.get(
     "/{audit_action_log_id}",
     response_model=AuditActionLogSchema,
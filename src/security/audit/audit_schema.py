@@ -9,18 +9,25 @@ from pydantic import (
     Field,
     computed_field,
     field_serializer,
+    field_validator,
     model_validator,
 )
 
 from src.core.constants import PAGE_SIZE
+from src.core.pagination import decode_cursor, keyset_types
+
+from .audit_repository import AuditRepository
 
 
 class AuditDataLogBase(BaseModel):
     id: int
     entity_type: str
+    entity_id: str | None = None
     action: str
     old_data: str | None = None
     new_data: str | None = None
+    is_diff: bool | None = Field(default=False, exclude=True)
+    changed_fields: list[str] = []
     at: datetime
 
     class Config:
@@ -119,6 +126,7 @@ class AuditActionLogSchema(AuditActionLogBase):
 
 class AuditActionLogListSchema(BaseModel):
     audit_action_logs: list[AuditActionLogSchema]
+    next_cursor: str | None = None
 
     amount: int = Field(default=0, exclude=True)
 
@@ -129,6 +137,7 @@ class AuditActionLogListSchema(BaseModel):
 
 class AuditActionLogFilterParams(BaseModel):
     page: int | None = Field(default=1, ge=1)
+    cursor: str | None = Field(default=None)
     user_ids: list[int] | None = Field(default=None)
     actions: list[str] | None = Field(default=None)
     start_date: datetime | None = Field(default=None)
@@ -140,6 +149,14 @@ class AuditActionLogFilterParams(BaseModel):
             self.actions = list(set(a.upper() for a in (self.actions or [])))
         return self
 
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(
+                value, types=keyset_types(AuditRepository.get_audit_action_log_keyset())
+            )
+        return value
+
     @computed_field
     def limit(self) -> int:
         return PAGE_SIZE
@@ -147,3 +164,20 @@ class AuditActionLogFilterParams(BaseModel):
     @computed_field
     def offset(self) -> int:
         return (self.page - 1) * PAGE_SIZE
+
+
+class AuditQueueMetricsSchema(BaseModel):
+    pending: int
+    max_size: int
+    enqueued: int
+    written: int
+    dropped: int
+    failed: int
+    failed_writes: int
+    last_flush_lag: float
+    max_flush_lag: float
+
+
+class AuditQueuesMetricsSchema(BaseModel):
+    action_logs: AuditQueueMetricsSchema
+    data_logs: AuditQueueMetricsSchema
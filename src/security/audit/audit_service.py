@@ -2,38 +2,48 @@ import json
 import uuid
 from contextlib import asynccontextmanager
 from functools import wraps
-from typing import TypeVar
+from typing import Sequence, TypeVar
 
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import get_history
 from sqlalchemy.orm.properties import ColumnProperty
 
+from src.core.context import get_request_context, request_context
 from src.core.database import Base, get_db
 from src.core.exceptions import CustomException
+from src.core.pagination import next_cursor
 from src.core.result import Result, Success
-from src.core.utils import PERU_TIMEZONE, calculate_time
+from src.core.utils import PERU_TIMEZONE, calculate_time, to_safe_str
 from src.security.models import AuditActionLog, AuditDataLog
 
 from ...core.repository import BaseRepository
 from ...security.services.token_service import TokenService
 from .audit_failures import AuditFailures
+from .audit_policy import FULL_AUDIT_POLICY, AuditPolicy
+from .audit_queue import audit_action_log_queue, audit_data_log_queue
 from .audit_repository import AuditRepository
 from .audit_schema import (
     AuditActionLogFilterParams,
     AuditActionLogListSchema,
     AuditActionLogSchema,
+    AuditDataLogSchema,
+    AuditQueueMetricsSchema,
+    AuditQueuesMetricsSchema,
 )
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
 class AuditService:
-    _context = {}
+    _snapshot_plans: dict[type, tuple[tuple[str, str], ...]] = {}
+    _primary_key_plans: dict[type, tuple[str, ...]] = {}
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
@@ -54,22 +64,41 @@ class AuditService:
             return None
 
     @staticmethod
-    def get_user_id_from_token(db, request):
-        access_token = request.cookies.get("access_token")
-        if not access_token:
-            return None
+    def get_claims_from_token(request) -> dict | None:
+        verification_result = TokenService.get_request_claims(request)
+        return verification_result.value if verification_result.is_success else None
 
-        token_service = TokenService(db=db)
-        verification_result = token_service.verify_access_token(token=access_token)
-        return (
-            verification_result.value.user_id
-            if verification_result.is_success
-            else None
-        )
+    @staticmethod
+    def _truncate_response_data(response_data: str, max_bytes: int) -> str:
+        """
+        Wraps the longest start of `response_data` whose truncation marker, once
+        escaped and UTF-8 encoded, fits in `max_bytes`. When the limit is smaller
+        than the marker itself the preview is left empty.
+        """
+        encoded = response_data.encode("utf-8")
+
+        def wrap(size: int) -> str:
+            return json.dumps(
+                {
+                    "truncated": True,
+                    "size": len(encoded),
+                    "preview": encoded[:size].decode("utf-8", errors="ignore"),
+                },
+                ensure_ascii=False,
+            )
+
+        low, high = 0, min(len(encoded), max_bytes)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if len(wrap(middle).encode("utf-8")) <= max_bytes:
+                low = middle
+            else:
+                high = middle - 1
+
+        return wrap(low)
 
     @staticmethod
-    def extract_response_data(response, request):
-        encoded = jsonable_encoder(response)
+    def extract_response_data(response, request, max_bytes: int | None = None):
         route = request.scope.get("route")
         endpoint_name = route.name if route else ""
 
@@ -82,13 +111,45 @@ class AuditService:
             ), route.status_code
 
         if isinstance(response, BaseModel):
-            return response.json(), route.status_code
-        if isinstance(response, JSONResponse):
-            return encoded.get("body"), response.status_code
-        return json.dumps(encoded, default=str) if encoded else "", route.status_code
+            response_data, status_code = response.model_dump_json(), route.status_code
+        elif isinstance(response, JSONResponse):
+            response_data, status_code = (
+                response.body.decode("utf-8"),
+                response.status_code,
+            )
+        else:
+            encoded = jsonable_encoder(response)
+            response_data, status_code = (
+                json.dumps(encoded, default=str) if encoded else "",
+                route.status_code,
+            )
+
+        if max_bytes is not None and len(response_data.encode("utf-8")) > max_bytes:
+            response_data = AuditService._truncate_response_data(
+                response_data=response_data, max_bytes=max_bytes
+            )
+
+        return response_data, status_code
+
+    @staticmethod
+    def get_status_code(response, request) -> int:
+        if isinstance(response, Response):
+            return response.status_code
+
+        route = request.scope.get("route")
+        return getattr(route, "status_code", None) or 200
 
     @staticmethod
-    def audit_action_log(audit_save: bool = False):
+    def audit_action_log(
+        audit_save: bool = False, policy: AuditPolicy = FULL_AUDIT_POLICY
+    ):
+        """
+        Records the request in `audit_action_log` following the route `policy`.
+
+        The row is handed to the audit action log queue, so it is written outside
+        the request path.
+        """
+
         def decorator(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
@@ -98,50 +159,58 @@ class AuditService:
                 if not request:
                     return await func(*args, **kwargs)
 
-                async with AuditService.get_db_session() as db:
-                    user_id = AuditService.get_user_id_from_token(db, request)
+                capture_request = policy.capture_request
+                capture_response = policy.capture_response
+
+                claims = AuditService.get_claims_from_token(request)
+                user_id = claims["sub"] if claims else None
+                path_params = json.dumps(request.path_params, default=str)
+                endpoint_name = getattr(request.scope.get("route"), "name", None)
+                user_agent = request.headers.get("user-agent", "Desconocido")
+                ip = request.client.host
+                action = request.method
+                query_params = json.dumps(dict(request.query_params), default=str)
+
+                request_data = ""
+                if capture_request:
                     request_data = await AuditService.get_request_data(request)
-                    path_params = json.dumps(request.path_params, default=str)
-                    endpoint_name = getattr(request.scope.get("route"), "name", None)
-                    user_agent = request.headers.get("user-agent", "Desconocido")
-                    ip = request.client.host
-                    action = request.method
-                    query_params = json.dumps(dict(request.query_params), default=str)
                     request_data = (
                         json.dumps(request_data, default=str) if request_data else ""
                     )
 
-                    AuditService._context["audit_save"] = audit_save
-                    AuditService._context["id"] = audit_id = uuid.uuid4()
+                audit_id = uuid.uuid4()
+                with request_context(
+                    audit_id=audit_id,
+                    audit_save=audit_save,
+                    user_id=user_id,
+                    claims=claims,
+                ):
                     response = await func(*args, **kwargs)
 
+                if capture_response:
                     response_data, status_code = AuditService.extract_response_data(
-                        response, request
-                    )
-
-                    audit_entry = AuditActionLog(
-                        id=audit_id,
-                        endpoint_name=endpoint_name,
-                        user_id=user_id,
-                        action=action,
-                        path_params=path_params,
-                        query_params=query_params,
-                        request_data=request_data,
-                        response_data=response_data,
-                        user_agent=user_agent,
-                        status_code=status_code,
-                        at=calculate_time(tz=PERU_TIMEZONE),
-                        ip=ip,
+                        response, request, max_bytes=policy.max_response_bytes
                     )
-
-                    print()
-
-                    try:
-                        await BaseRepository(model=AuditActionLog, db=db).save(
-                            audit_entry
-                        )
-                    except Exception as e:
-                        print(e)
+                else:
+                    response_data = None
+                    status_code = AuditService.get_status_code(response, request)
+
+                audit_action_log_queue.enqueue(
+                    {
+                        "id": audit_id,
+                        "endpoint_name": endpoint_name,
+                        "user_id": user_id,
+                        "action": action,
+                        "path_params": path_params,
+                        "query_params": query_params,
+                        "request_data": request_data,
+                        "response_data": response_data,
+                        "user_agent": user_agent,
+                        "status_code": status_code,
+                        "at": calculate_time(tz=PERU_TIMEZONE),
+                        "ip": ip,
+                    }
+                )
 
                 return response
 
@@ -150,17 +219,16 @@ class AuditService:
         return decorator
 
     @staticmethod
-    async def audit_data_log(
-        db: AsyncSession,
+    def audit_data_log(
         instance: ModelType,
         values_before: dict,
         values_after: dict,
-    ):
+    ) -> None:
         table_name = instance.__tablename__
 
         if (
             table_name == "audit_action_log" or table_name == "audit_data_log"
-        ) and not AuditService._context["audit_save"]:
+        ) and not get_request_context().audit_save:
             return
 
         if values_before == values_after:
@@ -175,53 +243,101 @@ class AuditService:
         elif values_before and not values_after:
             action = "DELETE"
 
-        if "id" not in AuditService._context:
+        audit_id = get_request_context().audit_id
+        if audit_id is None:
             return
 
-        audit_data_log_repository = BaseRepository(model=AuditDataLog, db=db)
-        audit_data_log = AuditDataLog(
-            entity_type=table_name,
-            action=action,
-            old_data=json.dumps(values_before, default=str),
-            new_data=json.dumps(values_after, default=str),
-            at=calculate_time(tz=PERU_TIMEZONE),
-            action_id=AuditService._context["id"],
+        primary_key = AuditService.get_primary_key_columns(type(instance))
+        values = values_after or values_before
+        entity_id = "|".join(to_safe_str(values.get(column)) for column in primary_key)
+
+        old_data, new_data = values_before, values_after
+        is_diff = action == "UPDATE"
+        if is_diff:
+            keys = {column: values.get(column) for column in primary_key}
+            changed = [
+                column
+                for column, value in values_after.items()
+                if values_before.get(column) != value
+            ]
+            old_data = {
+                **keys,
+                **{column: values_before.get(column) for column in changed},
+            }
+            new_data = {**keys, **{column: values_after[column] for column in changed}}
+
+        audit_data_log_queue.enqueue(
+            {
+                "entity_type": table_name,
+                "entity_id": entity_id,
+                "action": action,
+                "old_data": json.dumps(old_data, default=str),
+                "new_data": json.dumps(new_data, default=str),
+                "is_diff": is_diff,
+                "at": calculate_time(tz=PERU_TIMEZONE),
+                "action_id": audit_id,
+            }
         )
 
-        try:
-            AuditService._context["audit_save"] = False
-            await audit_data_log_repository.save(audit_data_log)
-        except Exception as e:
-            print(e)
+    @staticmethod
+    def get_queue_metrics() -> AuditQueuesMetricsSchema:
+        return AuditQueuesMetricsSchema(
+            action_logs=AuditQueueMetricsSchema(**audit_action_log_queue.metrics()),
+            data_logs=AuditQueueMetricsSchema(**audit_data_log_queue.metrics()),
+        )
 
     @staticmethod
-    async def get_before_values(instance: ModelType):
-        if (
+    def get_snapshot_plan(model: type[ModelType]) -> tuple[tuple[str, str], ...]:
+        """
+        Returns the (attribute key, column name) pairs audited for `model`.
+
+        The plan is computed once per mapped class and reused by every snapshot.
+        """
+        plan = AuditService._snapshot_plans.get(model)
+        if plan is None:
+            plan = tuple(
+                (attr.key, attr.columns[0].name)
+                for attr in model.__mapper__.column_attrs
+                if isinstance(attr, ColumnProperty)
+                and not attr.columns[0].name.startswith("%")
+            )
+            AuditService._snapshot_plans[model] = plan
+
+        return plan
+
+    @staticmethod
+    def get_primary_key_columns(model: type[ModelType]) -> tuple[str, ...]:
+        primary_key = AuditService._primary_key_plans.get(model)
+        if primary_key is None:
+            primary_key = tuple(column.name for column in model.__mapper__.primary_key)
+            AuditService._primary_key_plans[model] = primary_key
+
+        return primary_key
+
+    @staticmethod
+    def _is_audit_table(instance: ModelType) -> bool:
+        return (
             instance.__tablename__ == "audit_action_log"
             or instance.__tablename__ == "audit_data_log"
-        ) and not AuditService._context["audit_save"]:
-            return {}
+        ) and not get_request_context().audit_save
 
+    @staticmethod
+    def _snapshot_before(instance: ModelType, plan: tuple) -> dict:
         before_changes: dict = {}
-        insp = inspect(instance)
+        unloaded = inspect(instance).unloaded
         is_updated = False
         is_not_None = False
-        for attr in instance.__mapper__.column_attrs:
-            if not isinstance(attr, ColumnProperty) or attr.columns[0].name.startswith(
-                "%"
-            ):
-                continue
-            column_name = attr.columns[0].name
-            if attr.key in insp.unloaded:
+        for key, column_name in plan:
+            if key in unloaded:
                 before_changes[column_name] = None
             else:
-                hist = get_history(instance, attr.key)
+                hist = get_history(instance, key)
                 if hist.has_changes():
                     old_value = hist.deleted
                     before_changes[column_name] = old_value[0] if old_value else None
                     is_updated |= bool(old_value[0]) if old_value else False
                 else:
-                    current_value = getattr(instance, attr.key)
+                    current_value = getattr(instance, key)
                     before_changes[column_name] = current_value
                     is_not_None |= bool(current_value)
 
@@ -231,34 +347,64 @@ class AuditService:
         return before_changes
 
     @staticmethod
-    async def get_after_values(instance: ModelType):
-        if (
-            instance.__tablename__ == "audit_action_log"
-            or instance.__tablename__ == "audit_data_log"
-        ) and not AuditService._context["audit_save"]:
-            return {}
-
+    def _snapshot_after(instance: ModelType, plan: tuple) -> dict:
         after_changes: dict = {}
-        insp = inspect(instance)
-        for attr in instance.__mapper__.column_attrs:
-            if not isinstance(attr, ColumnProperty) or attr.columns[0].name.startswith(
-                "%"
-            ):
-                continue
-            column_name = attr.columns[0].name
-            if attr.key in insp.unloaded:
+        unloaded = inspect(instance).unloaded
+        for key, column_name in plan:
+            if key in unloaded:
                 after_changes[column_name] = None
             else:
-                hist = get_history(instance, attr.key)
+                hist = get_history(instance, key)
                 if hist.has_changes():
                     new_value = hist.added
                     after_changes[column_name] = new_value[0] if new_value else None
                 else:
-                    current_value = getattr(instance, attr.key)
-                    after_changes[column_name] = current_value
+                    after_changes[column_name] = getattr(instance, key)
 
         return after_changes
 
+    @staticmethod
+    async def get_before_values(instance: ModelType):
+        if AuditService._is_audit_table(instance):
+            return {}
+
+        plan = AuditService.get_snapshot_plan(type(instance))
+        return AuditService._snapshot_before(instance, plan)
+
+    @staticmethod
+    async def get_after_values(instance: ModelType):
+        if AuditService._is_audit_table(instance):
+            return {}
+
+        plan = AuditService.get_snapshot_plan(type(instance))
+        return AuditService._snapshot_after(instance, plan)
+
+    @staticmethod
+    def _snapshot_all(instances: Sequence[ModelType], snapshot) -> list[dict]:
+        plans: dict[type, tuple | None] = {}
+        values: list[dict] = []
+        for instance in instances:
+            model = type(instance)
+            if model not in plans:
+                plans[model] = (
+                    None
+                    if AuditService._is_audit_table(instance)
+                    else AuditService.get_snapshot_plan(model)
+                )
+
+            plan = plans[model]
+            values.append({} if plan is None else snapshot(instance, plan))
+
+        return values
+
+    @staticmethod
+    async def get_before_values_list(instances: Sequence[ModelType]) -> list[dict]:
+        return AuditService._snapshot_all(instances, AuditService._snapshot_before)
+
+    @staticmethod
+    async def get_after_values_list(instances: Sequence[ModelType]) -> list[dict]:
+        return AuditService._snapshot_all(instances, AuditService._snapshot_after)
+
     async def read_audit_action_log(
         self, audit_action_log_id: str
     ) -> Result[AuditActionLogSchema, CustomException]:
@@ -273,25 +419,127 @@ class AuditService:
         if not audit_action_log:
             return AuditFailures.AUDIT_ACTION_NOT_FOUND
 
-        return Success(AuditActionLogSchema.model_validate(audit_action_log))
+        audit_action_log = AuditActionLogSchema.model_validate(audit_action_log)
+        await self._rebuild_audit_data_logs(
+            audit_action_log_id=audit_action_log_id,
+            audit_data_logs=audit_action_log.audit_data_logs,
+        )
+
+        return Success(audit_action_log)
+
+    async def _rebuild_audit_data_logs(
+        self, audit_action_log_id: uuid.UUID, audit_data_logs: list[AuditDataLogSchema]
+    ) -> None:
+        """
+        Rebuilds the full before/after view of the UPDATE rows stored as diffs.
+
+        The history of each entity is replayed from its latest full snapshot
+        (CREATE, DELETE or a legacy full UPDATE) before the first diff of the
+        action, applying the later diffs in order. Only the rows from that
+        snapshot onwards are loaded.
+        """
+        diffs = [log for log in audit_data_logs if log.is_diff]
+        if not diffs:
+            return
+
+        first_diffs = (
+            select(
+                AuditDataLog.entity_type,
+                AuditDataLog.entity_id,
+                func.min(AuditDataLog.id).label("first_diff_id"),
+            )
+            .where(
+                AuditDataLog.action_id == audit_action_log_id,
+                AuditDataLog.is_diff,
+            )
+            .group_by(AuditDataLog.entity_type, AuditDataLog.entity_id)
+            .subquery()
+        )
+        snapshot = aliased(AuditDataLog)
+        bounds = (
+            select(
+                first_diffs.c.entity_type,
+                first_diffs.c.entity_id,
+                func.coalesce(func.max(snapshot.id), 0).label("base_id"),
+            )
+            .outerjoin(
+                snapshot,
+                and_(
+                    snapshot.entity_type == first_diffs.c.entity_type,
+                    snapshot.entity_id == first_diffs.c.entity_id,
+                    snapshot.id < first_diffs.c.first_diff_id,
+                    ~snapshot.is_diff,
+                ),
+            )
+            .group_by(first_diffs.c.entity_type, first_diffs.c.entity_id)
+            .subquery()
+        )
+
+        history: list[AuditDataLog] = await self.audit_data_log_repository.find_all(
+            filter=AuditDataLog.id <= max(log.id for log in diffs),
+            joins=[
+                (
+                    bounds,
+                    and_(
+                        AuditDataLog.entity_type == bounds.c.entity_type,
+                        AuditDataLog.entity_id == bounds.c.entity_id,
+                        AuditDataLog.id >= bounds.c.base_id,
+                    ),
+                )
+            ],
+            order_by=AuditDataLog.id,
+        )
+
+        states: dict[tuple[str, str], dict] = {}
+        views: dict[int, tuple[dict, dict]] = {}
+        for log in history:
+            key = (log.entity_type, log.entity_id)
+            old_data = json.loads(log.old_data) if log.old_data else {}
+            new_data = json.loads(log.new_data) if log.new_data else {}
+
+            if log.is_diff:
+                state = states.get(key, {})
+                old_data = {**state, **old_data}
+                new_data = {**state, **new_data}
+
+            states[key] = new_data
+            views[log.id] = (old_data, new_data)
+
+        for log in diffs:
+            if log.id not in views:
+                continue
+
+            old_diff = json.loads(log.old_data) if log.old_data else {}
+            new_diff = json.loads(log.new_data) if log.new_data else {}
+            log.changed_fields = [
+                column
+                for column, value in new_diff.items()
+                if old_diff.get(column) != value
+            ]
+
+            old_data, new_data = views[log.id]
+            log.old_data = json.dumps(old_data, default=str)
+            log.new_data = json.dumps(new_data, default=str)
 
     async def read_audit_action_logs(
         self,
         filter_params: AuditActionLogFilterParams,
     ) -> Result[AuditActionLogListSchema, CustomException]:
-        audit_action_logs = (
-            await self.audit_action_log_repository.find_audit_action_logs(
-                **filter_params.model_dump(exclude={"page"})
-            )
-        )
-
-        amount = await self.audit_action_log_repository.count_audit_action_logs(
-            **filter_params.model_dump(exclude={"page", "limit", "offset"})
+        (
+            audit_action_logs,
+            amount,
+        ) = await self.audit_action_log_repository.find_audit_action_logs(
+            **filter_params.model_dump(exclude={"page"}),
         )
 
         return Success(
             AuditActionLogListSchema(
                 audit_action_logs=audit_action_logs,
                 amount=amount,
+                next_cursor=next_cursor(
+                    items=audit_action_logs,
+                    keyset=self.audit_action_log_repository.get_audit_action_log_keyset(),
+                    limit=filter_params.limit,
+                ),
             )
         )
@@ -29,11 +29,14 @@ PARAMETER_VALUE_MAX_LENGTH = 256
 PARAMETER_DATATYPE_MAX_LENGTH = 50
 
 YARNS_ACCESS_ID = 1
+SYSTEM_ACCESS_ID = 118
 
 VISUALIZE_OPERATION_ID = 101
+EDIT_OPERATION_ID = 103
 
 ENDPOINT_NAME_MAX_LENGTH = 150
 ACTION_MAX_LENGTH = 50
 USER_AGENT_MAX_LENGTH = 255
 
 ENTITY_TYPE_MAX_LENGTH = 100
+ENTITY_ID_MAX_LENGTH = 255
@@ -2,6 +2,7 @@ from .fabric_types_loader import FabricTypes, JerseyFabric, RibBvdFabric
 from .fiber_categories_loader import FiberCategories
 from .fiber_denominations_loader import FiberDenominations
 from .multi_parameter_loader_by_category import MultiParameterLoaderByCategory
+from .parameter_cache import ParameterCache, parameter_cache
 from .password_loader import (
     MinUserPasswordDigits,
     MinUserPasswordLength,
@@ -38,4 +39,6 @@ __all__ = [
     "UserPasswordValidityDays",
     "UserPasswordPolicy",
     "ServiceOrderStatus",
+    "ParameterCache",
+    "parameter_cache",
 ]
@@ -9,10 +9,14 @@ from src.security.failures import (
 )
 from src.security.repositories import ParameterRepository
 
+from .parameter_cache import parameter_cache
+
 
 class AbstractParameterLoader(ABC):
     not_found_failure: Failure = PARAMETER_NOT_FOUND_FAILURE
     disabled_failure: Failure = PARAMETER_DISABLED_FAILURE
 
     def __init__(self, db: AsyncSession) -> None:
+        self.db = db
         self.repository = ParameterRepository(db=db)
+        self.cache = parameter_cache
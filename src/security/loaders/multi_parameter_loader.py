@@ -13,13 +13,12 @@ class MultiParameterLoader(AbstractParameterLoader):
         super().__init_subclass__(**kwargs)
 
     async def get(self, include_inactives: bool = False) -> list[Parameter]:
-        parameters = await self.repository.find_parameters(
-            filter=Parameter.id.in_(self.ids),
-            order_by=Parameter.id.asc(),
-            load_only_value=True,
-            include_inactives=include_inactives,
-        )
-        return parameters
+        mapping = await self.cache.get_by_ids(db=self.db, parameter_ids=self.ids)
+        return [
+            mapping[id]
+            for id in sorted(mapping)
+            if include_inactives or mapping[id].is_active
+        ]
 
     async def get_and_mapping(
         self, include_inactives: bool = False
@@ -17,13 +17,11 @@ class MultiParameterLoaderByCategory(AbstractParameterLoader):
         super().__init_subclass__(**kwargs)
 
     async def get(self, include_inactives: bool = False) -> list[Parameter]:
-        parameters = await self.repository.find_parameters(
-            filter=Parameter.category_id == self.param_category_id,
-            order_by=Parameter.id.asc(),
-            load_only_value=True,
+        return await self.cache.get_by_category(
+            db=self.db,
+            category_id=self.param_category_id,
             include_inactives=include_inactives,
         )
-        return parameters
 
     async def get_and_mapping(
         self, include_inactives: bool = False
@@ -32,13 +30,9 @@ class MultiParameterLoaderByCategory(AbstractParameterLoader):
         return {value.id: value for value in values}
 
     async def validate(self, id: int) -> Result[Parameter, CustomException]:
-        parameter_result = await self.repository.find_parameter_by_id(
-            parameter_id=id, load_only_value=True
-        )
-        if parameter_result.is_failure:
-            return self.not_found_failure
+        parameter = await self.cache.get_by_id(db=self.db, parameter_id=id)
 
-        return self.validate_instance(parameter_result.value)
+        return self.validate_instance(parameter)
 
     def validate_instance(
         self, parameter: Parameter
@@ -0,0 +1,131 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.security.models import Parameter
+from src.security.repositories import ParameterRepository
+
+_MISSING = object()
+
+
+class ParameterCache:
+    """
+    Process-wide cache of the `parameters` rows read by the loaders, by id and by
+    category.
+
+    Entries are detached copies holding the columns loaded by
+    `ParameterRepository.load_only_value`, so they can be shared between
+    requests and sessions. Ids that do not exist are cached as well, until the
+    TTL expires or a parameter is created.
+    """
+
+    def __init__(self, ttl: float = settings.PARAMETER_CACHE_TTL) -> None:
+        self.by_id: TTLCache[int, Parameter | None] = TTLCache(ttl=ttl)
+        self.by_category: TTLCache[int, list[Parameter]] = TTLCache(ttl=ttl)
+
+    @staticmethod
+    def _copy(parameter: Parameter) -> Parameter:
+        return Parameter(
+            id=parameter.id,
+            category_id=parameter.category_id,
+            value=parameter.value,
+            is_active=parameter.is_active,
+        )
+
+    def _store(self, parameters: list[Parameter]) -> list[Parameter]:
+        copies = [self._copy(parameter) for parameter in parameters]
+        for parameter in copies:
+            self.by_id.set(parameter.id, parameter)
+
+        return copies
+
+    async def get_by_ids(
+        self, db: AsyncSession, parameter_ids: list[int]
+    ) -> dict[int, Parameter]:
+        parameters: dict[int, Parameter | None] = {}
+        missing_ids: list[int] = []
+        for parameter_id in dict.fromkeys(parameter_ids):
+            parameter = self.by_id.get(parameter_id, _MISSING)
+            if parameter is _MISSING:
+                missing_ids.append(parameter_id)
+            else:
+                parameters[parameter_id] = parameter
+
+        if missing_ids:
+            found = await ParameterRepository(db=db).find_parameters(
+                filter=Parameter.id.in_(missing_ids), load_only_value=True
+            )
+            for parameter in self._store(found):
+                parameters[parameter.id] = parameter
+
+            for parameter_id in missing_ids:
+                if parameter_id not in parameters:
+                    parameters[parameter_id] = self.by_id.set(parameter_id, None)
+
+        return {
+            parameter_id: parameter
+            for parameter_id, parameter in parameters.items()
+            if parameter is not None
+        }
+
+    async def get_by_id(self, db: AsyncSession, parameter_id: int) -> Parameter | None:
+        return (await self.get_by_ids(db=db, parameter_ids=[parameter_id])).get(
+            parameter_id
+        )
+
+    async def get_by_category(
+        self, db: AsyncSession, category_id: int, include_inactives: bool = True
+    ) -> list[Parameter]:
+        parameters = self.by_category.get(category_id)
+        if parameters is None:
+            found = await ParameterRepository(db=db).find_parameters(
+                filter=Parameter.category_id == category_id,
+                order_by=Parameter.id.asc(),
+                load_only_value=True,
+            )
+            parameters = self.by_category.set(category_id, self._store(found))
+
+        return [
+            parameter
+            for parameter in parameters
+            if include_inactives or parameter.is_active
+        ]
+
+    async def warm_up(self, db: AsyncSession) -> int:
+        """
+        Loads every parameter in one query and fills both indexes.
+        """
+        parameters = self._store(
+            await ParameterRepository(db=db).find_parameters(
+                order_by=Parameter.id.asc(), load_only_value=True
+            )
+        )
+
+        categories: dict[int, list[Parameter]] = {}
+        for parameter in parameters:
+            if parameter.category_id is not None:
+                categories.setdefault(parameter.category_id, []).append(parameter)
+
+        for category_id, category_parameters in categories.items():
+            self.by_category.set(category_id, category_parameters)
+
+        return len(parameters)
+
+    def invalidate(self, parameter: Parameter | None = None) -> None:
+        if parameter is None:
+            self.by_id.clear()
+            self.by_category.clear()
+            return
+
+        self.by_id.invalidate(parameter.id)
+        if parameter.category_id is not None:
+            self.by_category.invalidate(parameter.category_id)
+
+    def metrics(self) -> dict:
+        return {
+            "by_id": self.by_id.metrics(),
+            "by_category": self.by_category.metrics(),
+        }
+
+
+parameter_cache = ParameterCache()
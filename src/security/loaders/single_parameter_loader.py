@@ -15,9 +15,7 @@ class SingleParameterLoader(AbstractParameterLoader):
     async def get(
         self,
     ) -> Parameter:
-        parameter = await self.repository.find_parameter_by_id(
-            parameter_id=self.id, load_only_value=True
-        )
+        parameter = await self.cache.get_by_id(db=self.db, parameter_id=self.id)
         if parameter:
             return parameter
 
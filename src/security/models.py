@@ -6,6 +6,7 @@ from sqlalchemy import (
     TIMESTAMP,
     ForeignKeyConstraint,
     Identity,
+    Index,
     PrimaryKeyConstraint,
     String,
     and_,
@@ -18,6 +19,7 @@ from src.core.database import Base
 from src.security.constants import (
     ACTION_MAX_LENGTH,
     ENDPOINT_NAME_MAX_LENGTH,
+    ENTITY_ID_MAX_LENGTH,
     ENTITY_TYPE_MAX_LENGTH,
     MAX_LENGTH_ACCESO_DESCRIPTION,
     MAX_LENGTH_ACCESO_IMAGE_PATH,
@@ -355,10 +357,15 @@ class AuditDataLog(Base):
 
     id: Mapped[int] = mapped_column(Identity(start=1))
     entity_type: Mapped[str] = mapped_column(String(ENTITY_TYPE_MAX_LENGTH))
+    entity_id: Mapped[str] = mapped_column(String(ENTITY_ID_MAX_LENGTH), nullable=True)
     action: Mapped[str] = mapped_column(String(ACTION_MAX_LENGTH))
     old_data: Mapped[str] = mapped_column(CLOB, nullable=True)
     new_data: Mapped[str] = mapped_column(CLOB, nullable=True)
+    is_diff: Mapped[bool] = mapped_column(default=False)
     at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
     action_id: Mapped[UUID] = mapped_column()
 
-    __table_args__ = (PrimaryKeyConstraint("id"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("id"),
+        Index("ix_audit_data_log_entity", "entity_type", "entity_id"),
+    )
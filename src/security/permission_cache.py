@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+
+
+@dataclass(frozen=True)
+class UserPermissions:
+    """
+    Compiled permission matrix of a user: its status and every (access,
+    operation) pair granted by its active roles on active accesses.
+    """
+
+    is_active: bool
+    blocked_until: datetime | None
+    access_operations: frozenset[tuple[int, int]]
+
+    def has_access_operation(self, access_id: int, operation_id: int) -> bool:
+        return (access_id, operation_id) in self.access_operations
+
+
+# Keyed by user id. Changes to a user invalidate its entry; changes to roles or
+# accesses clear the whole cache, since they affect every user holding them.
+# Both happen after the change commits.
+#
+# The cache lives in each worker process and is only invalidated in the worker
+# that made the change: the other workers keep serving their entries until
+# PERMISSION_CACHE_TTL expires, which bounds how long a revoked permission
+# can still be granted there.
+permission_cache: TTLCache[int, UserPermissions] = TTLCache(
+    ttl=settings.PERMISSION_CACHE_TTL
+)
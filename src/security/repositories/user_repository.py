@@ -1,10 +1,16 @@
-from sqlalchemy import BinaryExpression
+from sqlalchemy import BinaryExpression, Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.strategy_options import Load
 
 from src.core.repository import BaseRepository
-from src.security.models import Usuario
+from src.security.models import (
+    Acceso,
+    Rol,
+    RolAccesoOperation,
+    Usuario,
+    UsuarioRol,
+)
 
 
 class UserRepository(BaseRepository[Usuario]):
@@ -26,3 +32,33 @@ class UserRepository(BaseRepository[Usuario]):
         user = await self.find(filter, options=options)
 
         return user
+
+    async def find_user_access_operations(self, user_id: int) -> list[Row]:
+        """
+        Returns the status of the user with one row per (access, operation) pair
+        granted by its active roles on active accesses, in a single query. A user
+        without permissions yields one row with `acceso_id` set to `None`, and an
+        unknown user yields no rows.
+        """
+        stmt = (
+            select(
+                Usuario.is_active,
+                Usuario.blocked_until,
+                Acceso.acceso_id,
+                RolAccesoOperation.operation_id,
+            )
+            .select_from(Usuario)
+            .outerjoin(UsuarioRol, UsuarioRol.usuario_id == Usuario.usuario_id)
+            .outerjoin(
+                Rol, (Rol.rol_id == UsuarioRol.rol_id) & (Rol.is_active == bool(True))
+            )
+            .outerjoin(RolAccesoOperation, RolAccesoOperation.rol_id == Rol.rol_id)
+            .outerjoin(
+                Acceso,
+                (Acceso.acceso_id == RolAccesoOperation.acceso_id)
+                & (Acceso.is_active == bool(True)),
+            )
+            .where(Usuario.usuario_id == user_id)
+        )
+
+        return list((await self.db.execute(stmt)).all())
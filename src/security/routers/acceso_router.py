@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 from src.security.schemas import (
     AccesoListSchema,
     AccesoSchema,
@@ -17,7 +17,7 @@ router = APIRouter(tags=["Seguridad - Accesos"], prefix="/accesos")
 
 @router.get("/", response_model=AccesoListSchema, status_code=status.HTTP_200_OK)
 # @PermissionService.check_permission(1, 101)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_accesos(
     request: Request, db: AsyncSession = Depends(get_db)
 ) -> AccesoListSchema:
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 from src.security.docs import ParameterPublicRouterDocumentation
 from src.security.loaders import (
     FabricTypes,
@@ -35,7 +35,7 @@ router = APIRouter()
 @router.get(
     "/data-types", response_model=DataTypeListSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_datatypes(
     request: Request,
 ):
@@ -47,7 +47,7 @@ async def read_datatypes(
     response_model=FiberCategoriesSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_fiber_categories(request: Request, db: AsyncSession = Depends(get_db)):
     return FiberCategoriesSchema(fiber_categories=await FiberCategories(db=db).get())
 
@@ -67,7 +67,7 @@ async def password_restrictions(db: AsyncSession = Depends(get_db)):
     **ParameterPublicRouterDocumentation.read_spinning_methods(),
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_spinning_methods(request: Request, db: AsyncSession = Depends(get_db)):
     return SpinningMethodsSchema(spinning_methods=await SpinningMethods(db=db).get())
 
@@ -75,7 +75,7 @@ async def read_spinning_methods(request: Request, db: AsyncSession = Depends(get
 @router.get(
     "/fabric-types", response_model=FabricTypesSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_fabric_types(request: Request, db: AsyncSession = Depends(get_db)):
     return FabricTypesSchema(fabric_types=await FabricTypes(db=db).get())
 
@@ -85,7 +85,7 @@ async def read_fabric_types(request: Request, db: AsyncSession = Depends(get_db)
     response_model=ServiceOrderStatusSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_service_order_status(
     request: Request, db: AsyncSession = Depends(get_db)
 ):
@@ -99,7 +99,7 @@ async def read_service_order_status(
     response_model=FiberDenominationsSchema,
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_fiber_denominations(
     request: Request, db: AsyncSession = Depends(get_db)
 ):
@@ -113,7 +113,7 @@ async def read_fiber_denominations(
     **ParameterPublicRouterDocumentation.read_yarn_counts(),
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_counts(request: Request, db: AsyncSession = Depends(get_db)):
     return YarnCountsSchema(yarn_counts=await YarnCounts(db=db).get())
 
@@ -123,7 +123,7 @@ async def read_yarn_counts(request: Request, db: AsyncSession = Depends(get_db))
     **ParameterPublicRouterDocumentation.read_yarn_manufacturing_sites(),
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_manufacturing_sites(
     request: Request, db: AsyncSession = Depends(get_db)
 ):
@@ -137,6 +137,6 @@ async def read_yarn_manufacturing_sites(
     **ParameterPublicRouterDocumentation.read_yarn_distinctions(),
     status_code=status.HTTP_200_OK,
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_yarn_distinctions(request: Request, db: AsyncSession = Depends(get_db)):
     return YarnDistinctionsSchema(yarn_distinctions=await YarnDistinctions(db=db).get())
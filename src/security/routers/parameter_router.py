@@ -3,7 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
+from src.security.constants import (
+    EDIT_OPERATION_ID,
+    SYSTEM_ACCESS_ID,
+    VISUALIZE_OPERATION_ID,
+)
+from src.security.loaders import parameter_cache
 from src.security.schemas import (
     ParameterCreateSchema,
     ParameterWithCategoryListSchema,
@@ -14,6 +20,24 @@ from src.security.services import ParameterService
 router = APIRouter()
 
 
+@router.get("/cache/metrics", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID)
+async def read_parameter_cache_metrics(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    return parameter_cache.metrics()
+
+
+@router.post("/cache/invalidate", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, EDIT_OPERATION_ID)
+@AuditService.audit_action_log()
+async def invalidate_parameter_cache(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    parameter_cache.invalidate()
+    return {"message": "Caché de parámetros invalidada con éxito."}
+
+
 @router.get(
     "/{parameter_id}",
     response_model=ParameterWithCategorySchema,
@@ -35,7 +59,7 @@ async def read_parameter(parameter_id: int, db: AsyncSession = Depends(get_db)):
 @router.get(
     "/", response_model=ParameterWithCategoryListSchema, status_code=status.HTTP_200_OK
 )
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_parameters(request: Request, db: AsyncSession = Depends(get_db)):
     parameter_service = ParameterService(db=db)
     result = await parameter_service.read_parameters(include_category=True)
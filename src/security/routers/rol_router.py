@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 from src.security.schemas import (
     RolCreateAccessWithOperationSchema,
     RolCreateWithAccesosSchema,
@@ -30,7 +30,7 @@ async def read_rol(request: Request, rol_id: int, db: AsyncSession = Depends(get
 
 
 @router.get("/", response_model=RolListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_roles(request: Request, db: AsyncSession = Depends(get_db)):
     service = RolService(db)
     result = await service.read_roles()
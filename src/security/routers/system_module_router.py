@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 from src.security.schemas import (
     SystemModuleCreateSchema,
     SystemModuleFilterParams,
@@ -16,7 +16,7 @@ router = APIRouter()
 
 
 @router.get("/", response_model=SystemModuleListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_system_modules(
     request: Request,
     filter_params: SystemModuleFilterParams = Depends(),
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.rendering import pdf_renderer
+from src.core.services import PermissionService
+from src.security.constants import SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID
+
+router = APIRouter()
+
+
+@router.get("/print/metrics", status_code=status.HTTP_200_OK)
+@PermissionService.check_permission(SYSTEM_ACCESS_ID, VISUALIZE_OPERATION_ID)
+async def read_pdf_renderer_metrics(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    return pdf_renderer.metrics()
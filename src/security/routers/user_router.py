@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db, get_promec_db
 from src.core.dependencies import get_current_user_id
 from src.core.services import PermissionService
-from src.security.audit import AuditService
+from src.security.audit import METADATA_AUDIT_POLICY, AuditService
 from src.security.schemas import (
     UsuarioCreateWithRolesSchema,
     UsuarioListSchema,
@@ -41,7 +41,7 @@ async def read_user(
 
 
 @router.get("/", response_model=UsuarioListSchema, status_code=status.HTTP_200_OK)
-@AuditService.audit_action_log()
+@AuditService.audit_action_log(policy=METADATA_AUDIT_POLICY)
 async def read_users(request: Request, db: AsyncSession = Depends(get_db)):
     user_service = UserService(db)
 
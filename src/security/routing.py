@@ -10,6 +10,7 @@ from src.security.routers import (
     parameter_router,
     rol_router,
     system_module_router,
+    system_router,
     user_router,
 )
 
@@ -43,4 +44,9 @@ router.include_router(
     prefix="/operations",
     tags=["[SISTEMA] OPERACIONES"],
 )
+router.include_router(
+    system_router.router,
+    prefix="/system",
+    tags=["[SISTEMA] SISTEMA"],
+)
 router.include_router(AuditRouter, prefix="/audit", tags=["[SISTEMA] AUDITORÍA"])
@@ -1,9 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import after_commit
 from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.security.failures import AccesoFailures
 from src.security.models import Acceso, AccessOperation, Operation
+from src.security.permission_cache import permission_cache
 from src.security.repositories import AccesoRepository
 from src.security.schemas import (
     AccesoListSchema,
@@ -264,5 +266,6 @@ class AccesoService:
             accessess_operations.append(access_operation)
 
         await self.repository.save_all(accessess_operations)
+        after_commit(self.repository.db, permission_cache.clear)
 
         return Success(AccesoSchema.model_validate(access))
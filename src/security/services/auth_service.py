@@ -7,7 +7,8 @@ from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.security.failures import AuthFailures
 from src.security.models import Acceso, Usuario
-from src.security.repositories import ModuloSistemaRepository
+from src.security.permission_cache import UserPermissions, permission_cache
+from src.security.repositories import ModuloSistemaRepository, UserRepository
 from src.security.schemas import (
     AccessesWithOperationsListSchema,
     LoginForm,
@@ -35,11 +36,12 @@ class AuthService:
         self.token_service = TokenService(db)
         self.rol_service = RolService(db)
         self.modulo_repository = ModuloSistemaRepository(db)
-        self.email_service = EmailService()
+        self.email_service = EmailService(db)
         self.acceso_service = AccesoService(db)
+        self.user_repository = UserRepository(db)
 
     @staticmethod
-    def validate_user_status(user: Usuario) -> bool:
+    def validate_user_status(user: Usuario | UserPermissions) -> bool:
         if not user.is_active:
             return False
 
@@ -50,42 +52,43 @@ class AuthService:
 
         return True
 
+    async def read_user_permissions(self, user_id: int) -> UserPermissions | None:
+        permissions = permission_cache.get(user_id)
+        if permissions is not None:
+            return permissions
+
+        rows = await self.user_repository.find_user_access_operations(user_id=user_id)
+        if not rows:
+            return None
+
+        permissions = UserPermissions(
+            is_active=rows[0].is_active,
+            blocked_until=rows[0].blocked_until,
+            access_operations=frozenset(
+                (row.acceso_id, row.operation_id)
+                for row in rows
+                if row.acceso_id is not None
+            ),
+        )
+
+        return permission_cache.set(user_id, permissions)
+
     async def is_valid_access_operation_to_user(
         self,
         user_id: int,
         access_id: int,
         operation_id: int,
     ) -> bool:
-        user_result = await self.user_service.read_user(user_id, include_roles=True)
-        if user_result.is_failure:
+        permissions = await self.read_user_permissions(user_id=user_id)
+        if permissions is None:
             return False
 
-        user: Usuario = user_result.value
-        if not self.validate_user_status(user):
+        if not self.validate_user_status(permissions):
             return False
 
-        for rol in user.roles:
-            if rol.is_active:
-                validation_result = await self.acceso_service._read_access(
-                    access_id=access_id
-                )
-
-                if validation_result.is_failure:
-                    return False
-
-                access: Acceso = validation_result.value
-
-                if access.is_active:
-                    validation_result = await self.rol_service.has_access_operation(
-                        rol_id=rol.rol_id,
-                        acceso_id=access_id,
-                        operation_id=operation_id,
-                    )
-
-                    if validation_result.is_success:
-                        return True
-
-        return False
+        return permissions.has_access_operation(
+            access_id=access_id, operation_id=operation_id
+        )
 
     async def get_valid_user_access(self, user: Usuario) -> list[Acceso]:
         rol_ids = [rol.rol_id for rol in user.roles if rol.is_active]
@@ -111,7 +114,7 @@ class AuthService:
         if not self.validate_user_status(user):
             return AuthFailures.INVALID_CREDENTIALS_FAILURE
 
-        if not self.user_service.verify_password(password, user.password):
+        if not await self.user_service.verify_password(password, user.password):
             return AuthFailures.INVALID_CREDENTIALS_FAILURE
 
         return Success(user)
@@ -1,13 +1,42 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from src.core.config import settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a thread pool keeps the event loop free while
+# hashes are computed. The semaphore caps the hashes in flight: extra callers
+# wait on the event loop, where a cancelled request drops out of the queue
+# before any bcrypt work is done for it.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.HASH_POOL_SIZE, thread_name_prefix="hash"
+)
+_semaphore = asyncio.Semaphore(settings.HASH_POOL_SIZE)
+
 
 class HashService:
     @staticmethod
-    def hash_text(plain_text: str) -> str:
+    async def _run(func, *args):
+        async with _semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                _executor, func, *args
+            )
+
+    @staticmethod
+    def _hash(plain_text: str) -> str:
         return pwd_context.hash(plain_text, rounds=12)
 
     @staticmethod
-    def verify_text(plain_text: str, hashed_text: str) -> bool:
+    def _verify(plain_text: str, hashed_text: str) -> bool:
         return pwd_context.verify(plain_text, hashed_text)
+
+    @staticmethod
+    async def hash_text(plain_text: str) -> str:
+        return await HashService._run(HashService._hash, plain_text)
+
+    @staticmethod
+    async def verify_text(plain_text: str, hashed_text: str) -> bool:
+        return await HashService._run(HashService._verify, plain_text, hashed_text)
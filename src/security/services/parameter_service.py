@@ -3,6 +3,7 @@ from typing import Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import after_commit
 from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.security.failures import (
@@ -15,7 +16,7 @@ from src.security.failures import (
     PARAMETER_VALUE_CONVERSION_TO_FLOAT_FAILURE,
     PARAMETER_VALUE_CONVERSION_TO_INT_FAILURE,
 )
-from src.security.loaders import MultiParameterLoaderByCategory
+from src.security.loaders import MultiParameterLoaderByCategory, parameter_cache
 from src.security.models import Parameter
 from src.security.repositories import ParameterRepository
 from src.security.schemas import DataType, ParameterCreateSchema
@@ -25,6 +26,7 @@ from .parameter_category_service import ParameterCategoryService
 
 class ParameterService:
     def __init__(self, db: AsyncSession) -> None:
+        self.db = db
         self.repository = ParameterRepository(db=db)
         self.parameter_category_service = ParameterCategoryService(db=db)
 
@@ -121,7 +123,8 @@ class ParameterService:
             return validation_result
 
         parameter = Parameter(**form.model_dump())
-        await self.repository.save(parameter)
+        await self.repository.save(parameter, flush=True)
+        after_commit(self.repository.db, lambda: parameter_cache.invalidate(parameter))
 
         return Success(parameter)
 
@@ -152,6 +155,18 @@ class ParameterService:
         if not parameter_ids:
             return Success([])
 
+        if load_only_value and not include_category:
+            mapping = await parameter_cache.get_by_ids(
+                db=self.db, parameter_ids=parameter_ids
+            )
+            return Success(
+                [
+                    parameter
+                    for parameter in mapping.values()
+                    if include_inactives or parameter.is_active
+                ]
+            )
+
         if len(parameter_ids) == 1:
             id = parameter_ids[0]
             result = await self.read_parameter(
@@ -1,12 +1,13 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import transactional
+from src.core.database import after_commit, transactional
 from src.core.exceptions.http_exceptions import (
     CustomException,
 )
 from src.core.result import Result, Success
 from src.security.failures import RolFailures
 from src.security.models import Rol, RolAccesoOperation
+from src.security.permission_cache import permission_cache
 from src.security.repositories import (
     RolAccesoOperationRepository,
     RolRepository,
@@ -134,6 +135,7 @@ class RolService:
             setattr(rol, key, value)
 
         await self.repository.save(rol)
+        after_commit(self.repository.db, permission_cache.clear)
 
         return Success(None)
 
@@ -146,6 +148,7 @@ class RolService:
 
         rol.is_active = False
         await self.repository.save(rol)
+        after_commit(self.repository.db, permission_cache.clear)
 
         return Success(None)
 
@@ -210,6 +213,7 @@ class RolService:
             access_operation_to_scheme.append(acceso_result.value)
 
         await self.rol_acceso_operation_repository.save_all(access_operation_to_add)
+        after_commit(self.repository.db, permission_cache.clear)
 
         return Success(access_operation_to_scheme)
 
@@ -282,5 +286,6 @@ class RolService:
         await self.rol_acceso_operation_repository.delete_all(
             access_operation_to_delete
         )
+        after_commit(self.repository.db, permission_cache.clear)
 
         return Success(RolSchema.model_validate(rol))
@@ -3,6 +3,7 @@ import string
 from datetime import UTC, datetime, timedelta
 
 from authlib.jose import jwt
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
@@ -103,9 +104,7 @@ class TokenService:
         return Success(RefreshTokenData(user_id=claims["sub"], sesion_id=claims["sid"]))
 
     @staticmethod
-    def verify_access_token(
-        token: str | None,
-    ) -> Result[AccessTokenData, CustomException]:
+    def verify_access_claims(token: str | None) -> Result[dict, CustomException]:
         if token is None:
             return TokenFailures.MISSING_ACCESS_TOKEN_FAILURE
 
@@ -117,7 +116,35 @@ class TokenService:
         if claims.get("type", "") != "access":
             return TokenFailures.INVALID_TOKEN_TYPE_FAILURE
 
-        return Success(AccessTokenData(user_id=claims["sub"]))
+        return Success(claims)
+
+    @staticmethod
+    def verify_access_token(
+        token: str | None,
+    ) -> Result[AccessTokenData, CustomException]:
+        verification_result = TokenService.verify_access_claims(token)
+        if verification_result.is_failure:
+            return verification_result
+
+        return Success(AccessTokenData(user_id=verification_result.value["sub"]))
+
+    @staticmethod
+    def get_request_claims(request: Request) -> Result[dict, CustomException]:
+        """
+        Verifies the access token cookie of the request and returns its claims.
+
+        The signature is checked once per request: the result is kept in
+        `request.state`, which is shared by the audit decorator, the permission
+        check and the dependencies of the same request.
+        """
+        verification_result = getattr(request.state, "access_claims", None)
+        if verification_result is None:
+            verification_result = TokenService.verify_access_claims(
+                request.cookies.get("access_token")
+            )
+            request.state.access_claims = verification_result
+
+        return verification_result
 
     @staticmethod
     def _generate_auth_token(length=6):
@@ -130,7 +157,7 @@ class TokenService:
             minutes=self.AUTH_TOKEN_EXPIRATION_MINUTES
         )
         auth_token = self._generate_auth_token(length=AUTH_TOKEN_LENGTH)
-        hashed_auth_token = HashService.hash_text(auth_token)
+        hashed_auth_token = await HashService.hash_text(auth_token)
         instance = AuthToken(
             codigo=hashed_auth_token, usuario_id=user_id, expiration_at=expiration_time
         )
@@ -143,7 +170,7 @@ class TokenService:
         auth_token = await self.repository.find(filter=AuthToken.usuario_id == user_id)
         if (
             auth_token is None
-            or (not HashService.verify_text(codigo, auth_token.codigo))
+            or (not await HashService.verify_text(codigo, auth_token.codigo))
             or auth_token.expiration_at < datetime.now()
         ):
             return TokenFailures.INVALID_TOKEN_FAILURE
@@ -3,14 +3,14 @@ import string
 from datetime import datetime, timedelta
 from re import findall as re_search
 
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import transactional
+from src.core.database import after_commit, transactional
 from src.core.exceptions import CustomException
 from src.core.result import Result, Success
 from src.security.failures import UserFailures
 from src.security.models import Usuario, UsuarioRol
+from src.security.permission_cache import permission_cache
 from src.security.repositories import UserRepository, UserRolRepository
 from src.security.schemas import (
     UsuarioCreateWithRolesSchema,
@@ -19,10 +19,9 @@ from src.security.schemas import (
 )
 
 from ...core.services.email_service import EmailService
+from .hash_service import HashService
 from .rol_service import RolService
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 MIN_LENGTH_PASSWORD = 6
 MIN_UPPER_PASSWORD = 1
 MIN_LOWER_PASSWORD = 1
@@ -36,15 +35,15 @@ class UserService:
         self.repository = UserRepository(db)
         self.rol_service = RolService(db)
         self.user_rol_repository = UserRolRepository(db)
-        self.email_service = EmailService()
+        self.email_service = EmailService(db)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await HashService.verify_text(plain_password, hashed_password)
 
     @staticmethod
-    def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password, rounds=12)
+    async def get_password_hash(password: str) -> str:
+        return await HashService.hash_text(password)
 
     @staticmethod
     def is_password_secure(password: str) -> bool:
@@ -134,7 +133,7 @@ class UserService:
             return validation_result
 
         user = Usuario(**user_dict, reset_password_at=datetime.now())
-        user.password = self.get_password_hash(user.password)
+        user.password = await self.get_password_hash(user.password)
 
         await self.repository.save(user)
 
@@ -181,6 +180,7 @@ class UserService:
             setattr(user, key, value)
 
         await self.repository.save(user)
+        after_commit(self.repository.db, lambda: permission_cache.invalidate(user_id))
 
         return Success(None)
 
@@ -191,6 +191,7 @@ class UserService:
 
         user: Usuario = user_result.value
         await self.repository.delete(user)
+        after_commit(self.repository.db, lambda: permission_cache.invalidate(user_id))
 
         return Success(None)
 
@@ -225,6 +226,7 @@ class UserService:
             roles_to_add.append(UsuarioRol(usuario_id=user_id, rol_id=rol.rol_id))
 
         await self.user_rol_repository.save_all(roles_to_add)
+        after_commit(self.repository.db, lambda: permission_cache.invalidate(user_id))
 
         return Success(None)
 
@@ -259,6 +261,7 @@ class UserService:
             roles_to_delete.append(has_rol_validation.value)
 
         await self.user_rol_repository.delete_all(roles_to_delete)
+        after_commit(self.repository.db, lambda: permission_cache.invalidate(user_id))
 
         return Success(None)
 
@@ -274,7 +277,7 @@ class UserService:
         if not self.is_password_secure(new_password):
             return UserFailures.USER_UPDATE_PASSWORD_FAILURE
 
-        user.password = self.get_password_hash(new_password)
+        user.password = await self.get_password_hash(new_password)
         user.reset_password_at = datetime.now() + timedelta(
             days=PASSWORD_EXPIRATION_DAYS
         )
@@ -291,7 +294,7 @@ class UserService:
         user: Usuario = user_result.value
         new_password = self.generate_random_password()
 
-        user.password = self.get_password_hash(new_password)
+        user.password = await self.get_password_hash(new_password)
         user.reset_password_at = datetime.now()
 
         await self.repository.save(user)